@@ -0,0 +1,232 @@
+"""
+响应压缩中间件 - 按 Accept-Encoding 协商 brotli / gzip 压缩
+
+- 只压缩 Content-Type 在允许列表中、且响应体不小于 minimum_size 的响应
+- 已压缩的响应（有 Content-Encoding）、204/304 响应不处理
+- 完整响应体的压缩结果按 (编码, 响应体摘要) 缓存，同一份响应体只压缩一次
+  （不按 ETag：不同路由、不同查询参数的响应可能带相同的 ETag）；
+  压缩后的强 ETag 改为弱 ETag（表示内容与未压缩版本语义相同）
+- 流式响应（如 NDJSON 导出）逐块压缩并刷新，客户端可以边接收边解析
+
+brotli 为可选依赖，未安装时只使用 gzip。
+"""
+import hashlib
+import logging
+import zlib
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli 是可选依赖
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 压缩结果缓存的单条上限，超过该大小的响应体每次单独压缩
+MAX_CACHED_BODY_SIZE = 4 * 1024 * 1024
+
+_stats = {"compressed": 0, "streamed": 0, "cache_hits": 0, "bytes_in": 0, "bytes_out": 0}
+
+
+def get_compression_stats():
+    """获取响应压缩统计信息"""
+    return {"encodings": (["br"] if brotli is not None else []) + ["gzip"], **_stats}
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    根据 Accept-Encoding 选择编码：优先 br（已安装 brotli 时），其次 gzip
+
+    Returns:
+        "br" / "gzip"，客户端不接受压缩时返回 None
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    best = None
+    for coding in candidates:
+        quality = accepted.get(coding, wildcard)
+        if quality > 0 and (best is None or quality > best[1]):
+            best = (coding, quality)
+    return best[0] if best else None
+
+
+class _StreamCompressor:
+    """流式压缩器：每块数据压缩后立即刷新"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """协商式 brotli / gzip 响应压缩"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024,
+                 content_types: Iterable[str] = ("application/json",),
+                 gzip_level: int = 6, brotli_quality: int = 4, cache_size: int = 256):
+        """
+        Args:
+            app: 下游 ASGI 应用
+            minimum_size: 小于该字节数的响应不压缩
+            content_types: 允许压缩的 Content-Type（以 "/" 结尾的项按前缀匹配，如 "text/"）
+            gzip_level: gzip 压缩级别（1-9）
+            brotli_quality: brotli 压缩质量（0-11，越高越慢）
+            cache_size: 缓存的压缩结果数量，0 表示不缓存
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(t.strip().lower() for t in content_types if t.strip())
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, content_type: str) -> bool:
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        return any(
+            media_type.startswith(allowed) if allowed.endswith("/") else media_type == allowed
+            for allowed in self.content_types
+        )
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        """压缩完整响应体；相同内容的响应体只压缩一次"""
+        _stats["compressed"] += 1
+        _stats["bytes_in"] += len(body)
+        cacheable = self.cache_size > 0 and len(body) <= MAX_CACHED_BODY_SIZE
+        key = None
+        if cacheable:
+            key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                _stats["cache_hits"] += 1
+                _stats["bytes_out"] += len(compressed)
+                return compressed
+
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+            compressed = compressor.compress(body) + compressor.flush()
+
+        if key is not None:
+            self._cache[key] = compressed
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        _stats["bytes_out"] += len(compressed)
+        return compressed
+
+    def stream_compressor(self, encoding: str) -> _StreamCompressor:
+        _stats["streamed"] += 1
+        return _StreamCompressor(encoding, self.gzip_level, self.brotli_quality)
+
+
+class _CompressionResponder:
+    """包装 send：缓存响应头，根据第一块响应体决定是否压缩"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._mode: Optional[str] = None  # passthrough / stream
+        self._compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._mode is None:
+            await self._first_body(message)
+        elif self._mode == "stream":
+            body = self._compressor.compress(message.get("body", b""))
+            more_body = message.get("more_body", False)
+            if not more_body:
+                body += self._compressor.finish()
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+        else:
+            await self._send(message)
+
+    async def _first_body(self, message: Message) -> None:
+        start = self._start
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        eligible = (
+            start["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and self.middleware.is_compressible(headers.get("content-type", ""))
+        )
+        if eligible:
+            headers.add_vary_header("Accept-Encoding")
+        if not eligible or self.encoding is None or (not more_body and len(body) < self.middleware.minimum_size):
+            self._mode = "passthrough"
+            await self._send(start)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        if more_body:
+            self._mode = "stream"
+            self._compressor = self.middleware.stream_compressor(self.encoding)
+            if "content-length" in headers:
+                del headers["content-length"]
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": self._compressor.compress(body), "more_body": True})
+            return
+
+        compressed = self.middleware.compress(self.encoding, body)
+        headers["Content-Length"] = str(len(compressed))
+        self._mode = "passthrough"
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
@@ -0,0 +1,154 @@
+"""
+条件请求 - 数据库艺术家/歌曲接口的 ETag / Last-Modified 和 304 响应
+
+- ETag 为强校验值，由序列化后的响应体计算，序列化结果同时用作响应体（只序列化一次）；
+  不依赖 updated_at 是否随每次修改更新
+- Last-Modified 只用于单条资源：列表删除行时最大 updated_at 不变，不能作为列表的校验值
+- If-None-Match 按弱比较匹配（压缩中间件会把压缩后响应的 ETag 改为 W/ 前缀），
+  存在 If-None-Match 时忽略 If-Modified-Since
+- 每个 URL 最近一次响应的校验值在进程内保留 CONDITIONAL_VERSION_TTL 秒，
+  期间匹配的条件请求直接返回 304，不查询数据库、不序列化；进程内的所有写操作会清空这些记录。
+  多进程部署时默认关闭（见 services.response_versions）
+"""
+import hashlib
+import logging
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+from api.responses import dumps
+from config import settings
+from services.response_versions import get_version_stats, response_versions
+
+logger = logging.getLogger(__name__)
+
+# 响应格式变化时修改，使客户端已有的 ETag 失效
+ETAG_FORMAT_VERSION = "2"
+
+CACHE_CONTROL = "no-cache"
+
+_stats = {"not_modified": 0, "not_modified_without_query": 0, "full": 0}
+
+Validators = Tuple[str, Optional[datetime]]
+
+
+def get_conditional_stats() -> Dict[str, Any]:
+    """获取条件请求统计信息"""
+    return {**get_version_stats(), **_stats}
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """解析数据库返回的 ISO 时间字符串"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def compute_validators(result: Dict[str, Any]) -> Tuple[Validators, bytes]:
+    """
+    序列化查询结果并计算校验值
+
+    Args:
+        result: 服务层返回的 {"success": True, "data": 单行或行列表, ...}
+
+    Returns:
+        ((强 ETag, 单行的 Last-Modified；列表为 None), 序列化后的响应体)
+    """
+    body = dumps(result)
+    digest = hashlib.blake2b(ETAG_FORMAT_VERSION.encode(), digest_size=16)
+    digest.update(body)
+    etag = f'"{digest.hexdigest()}"'
+
+    last_modified = None
+    data = result.get("data")
+    if isinstance(data, dict):
+        last_modified = _parse_timestamp(data.get("updated_at") or data.get("created_at"))
+    return (etag, last_modified), body
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 的弱比较"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 日期只精确到秒
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def _version_key(request: Request) -> Tuple[str, str]:
+    return request.url.path, request.url.query
+
+
+def check_not_modified(request: Request) -> Optional[Response]:
+    """
+    查询数据库之前调用：该 URL 的校验值仍在有效期内且与请求条件匹配时返回 304 响应
+
+    Returns:
+        304 响应；需要查询数据库时返回 None
+    """
+    if "if-none-match" not in request.headers and "if-modified-since" not in request.headers:
+        return None
+    validators: Optional[Validators] = response_versions.get(_version_key(request))
+    if validators is None or not _is_not_modified(request, *validators):
+        return None
+    _stats["not_modified"] += 1
+    _stats["not_modified_without_query"] += 1
+    return Response(status_code=304, headers=_headers(*validators))
+
+
+def conditional_response(request: Request, result: Dict[str, Any]) -> Response:
+    """
+    为成功的查询结果附加 ETag / Last-Modified，请求条件匹配时返回 304
+
+    Args:
+        request: 当前请求
+        result: 服务层返回的 {"success": True, "data": ...}
+    """
+    (etag, last_modified), body = compute_validators(result)
+    if settings.CONDITIONAL_VERSION_TTL > 0:
+        response_versions.set(_version_key(request), (etag, last_modified))
+
+    headers = _headers(etag, last_modified)
+    if _is_not_modified(request, etag, last_modified):
+        _stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    _stats["full"] += 1
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -5,12 +5,15 @@ import logging
 from typing import Optional, List
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, Query, Path, Body, Request
-from fastapi.responses import JSONResponse
+from api.conditional import check_not_modified, conditional_response
+from api.responses import FastJSONResponse
 
+from services.artist_bundle_service import artist_bundle_service
 from services.artist_db_service import artist_db_service
 from services.song_db_service import song_db_service
 from services.ai_description_db_service import ai_description_db_service
 from services.user_db_service import user_db_service
+from services.response_versions import invalidate_versions
 from models.database import (
     CreateArtistRequest, UpdateArtistRequest, CreateSongRequest, 
     CreateAIDescriptionRequest, CreateFavoriteRequest, SearchRequest
@@ -38,26 +41,31 @@ async def create_artist(artist_data: CreateArtistRequest):
     try:
         result = await artist_db_service.create_artist(artist_data)
         if result["success"]:
-            return JSONResponse(content=result, status_code=201)
+            invalidate_versions()
+            return FastJSONResponse(content=result, status_code=201)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in create_artist API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/artists/{artist_id}")
-async def get_artist(artist_id: UUID = Path(..., description="艺术家UUID")):
+async def get_artist(request: Request, artist_id: UUID = Path(..., description="艺术家UUID")):
     """
     根据ID获取艺术家信息
     
     **功能说明：**
     - 获取艺术家的完整信息
     - 包含Wikipedia、Spotify等平台数据
+    - 支持 If-None-Match / If-Modified-Since 条件请求（304）
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await artist_db_service.get_artist_by_id(artist_id)
         if result["success"]:
-            return result
+            return conditional_response(request, result)
         else:
             raise HTTPException(status_code=404, detail=result["error"])
     except HTTPException:
@@ -69,13 +77,16 @@ async def get_artist(artist_id: UUID = Path(..., description="艺术家UUID")):
 
     
 @router.get("/artists/by-name/{artist_name}")
-async def get_artist_by_name(artist_name: str = Path(..., description="艺术家名称")):
-    """根据名称获取艺术家信息（支持模糊匹配）"""
+async def get_artist_by_name(request: Request, artist_name: str = Path(..., description="艺术家名称")):
+    """根据名称获取艺术家信息（支持模糊匹配，支持条件请求）"""
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         # 使用模糊匹配方法
         result = await artist_db_service.get_artist_by_name_fuzzy(artist_name)
         if result["success"]:
-            return result
+            return conditional_response(request, result)
         else:
             raise HTTPException(status_code=404, detail=result["error"])
     except HTTPException:
@@ -85,14 +96,17 @@ async def get_artist_by_name(artist_name: str = Path(..., description="艺术家
         raise HTTPException(status_code=500, detail=str(e))
     
 @router.get("/artists/by-spotify/{spotify_id}")
-async def get_artist_by_spotify_id(spotify_id: str = Path(..., description="Spotify艺术家ID")):
+async def get_artist_by_spotify_id(request: Request, spotify_id: str = Path(..., description="Spotify艺术家ID")):
     """
-    根据Spotify ID获取艺术家信息
+    根据Spotify ID获取艺术家信息（支持条件请求）
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await artist_db_service.get_artist_by_spotify_id(spotify_id)
         if result["success"]:
-            return result
+            return conditional_response(request, result)
         else:
             raise HTTPException(status_code=404, detail=result["error"])
     except HTTPException:
@@ -116,9 +130,11 @@ async def update_artist(
     try:
         result = await artist_db_service.update_artist(artist_id, update_data)
         if result["success"]:
-            return result
+            invalidate_versions()
+            artist_bundle_service.invalidate(artist_id)
+            return FastJSONResponse(content=result)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in update_artist API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -143,9 +159,11 @@ async def update_artist_wikipedia_data(
     try:
         result = await artist_db_service.update_artist_wikipedia_data(artist_id, wiki_data, wiki_extract)
         if result["success"]:
-            return result
+            invalidate_versions()
+            artist_bundle_service.invalidate(artist_id)
+            return FastJSONResponse(content=result)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in update_artist_wikipedia_data API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -170,15 +188,18 @@ async def update_artist_spotify_data(
     try:
         result = await artist_db_service.update_artist_spotify_data(artist_id, spotify_data, spotify_id)
         if result["success"]:
-            return result
+            invalidate_versions()
+            artist_bundle_service.invalidate(artist_id)
+            return FastJSONResponse(content=result)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in update_artist_spotify_data API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/artists")
 async def search_artists(
+    request: Request,
     query: str = Query(..., description="搜索关键词"),
     limit: int = Query(10, description="返回结果数量限制", ge=1, le=50),
     offset: int = Query(0, description="偏移量", ge=0)
@@ -190,39 +211,56 @@ async def search_artists(
     - 支持多语言模糊搜索
     - 按热度排序返回结果
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await artist_db_service.search_artists(query, limit, offset)
-        return result
+        if result["success"]:
+            return conditional_response(request, result)
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in search_artists API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/artists/fuji-rock")
 async def get_fuji_rock_artists(
+    request: Request,
     limit: int = Query(50, description="返回结果数量限制", ge=1, le=100),
     offset: int = Query(0, description="偏移量", ge=0)
 ):
     """
     获取Fuji Rock艺术家列表
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await artist_db_service.get_fuji_rock_artists(limit, offset)
-        return result
+        if result["success"]:
+            return conditional_response(request, result)
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_fuji_rock_artists API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/artists/popular")
 async def get_popular_artists(
+    request: Request,
     limit: int = Query(20, description="返回结果数量限制", ge=1, le=50),
     offset: int = Query(0, description="偏移量", ge=0)
 ):
     """
     获取热门艺术家列表
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await artist_db_service.get_popular_artists(limit, offset)
-        return result
+        if result["success"]:
+            return conditional_response(request, result)
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_popular_artists API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -239,9 +277,11 @@ async def delete_artist(artist_id: UUID = Path(..., description="艺术家UUID")
     try:
         result = await artist_db_service.delete_artist(artist_id)
         if result["success"]:
-            return result
+            invalidate_versions()
+            artist_bundle_service.invalidate(artist_id)
+            return FastJSONResponse(content=result)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in delete_artist API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -260,9 +300,11 @@ async def create_song(song_data: CreateSongRequest):
     try:
         result = await song_db_service.create_song(song_data)
         if result["success"]:
-            return JSONResponse(content=result, status_code=201)
+            invalidate_versions()
+            artist_bundle_service.invalidate(song_data.artist_id)
+            return FastJSONResponse(content=result, status_code=201)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in create_song API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -279,22 +321,28 @@ async def batch_create_songs(songs_data: List[CreateSongRequest]):
     try:
         result = await song_db_service.batch_create_songs(songs_data)
         if result["success"]:
-            return JSONResponse(content=result, status_code=201)
+            invalidate_versions()
+            for artist_id in {song.artist_id for song in songs_data}:
+                artist_bundle_service.invalidate(artist_id)
+            return FastJSONResponse(content=result, status_code=201)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in batch_create_songs API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/songs/{song_id}")
-async def get_song(song_id: UUID = Path(..., description="歌曲UUID")):
+async def get_song(request: Request, song_id: UUID = Path(..., description="歌曲UUID")):
     """
-    根据ID获取歌曲信息
+    根据ID获取歌曲信息（支持条件请求）
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await song_db_service.get_song_by_id(song_id)
         if result["success"]:
-            return result
+            return conditional_response(request, result)
         else:
             raise HTTPException(status_code=404, detail=result["error"])
     except HTTPException:
@@ -305,6 +353,7 @@ async def get_song(song_id: UUID = Path(..., description="歌曲UUID")):
 
 @router.get("/artists/{artist_id}/songs")
 async def get_artist_songs(
+    request: Request,
     artist_id: UUID = Path(..., description="艺术家UUID"),
     limit: int = Query(10, description="返回结果数量限制", ge=1, le=50),
     offset: int = Query(0, description="偏移量", ge=0)
@@ -312,15 +361,47 @@ async def get_artist_songs(
     """
     获取艺术家的歌曲列表
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await song_db_service.get_songs_by_artist(artist_id, limit, offset)
-        return result
+        if result["success"]:
+            return conditional_response(request, result)
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_artist_songs API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/artists/{artist_id}/bundle")
+async def get_artist_bundle(
+    artist_id: UUID = Path(..., description="艺术家UUID"),
+    language: str = Query("zh", description="AI描述语言"),
+    songs_limit: int = Query(20, description="返回的歌曲数量", ge=1, le=50)
+):
+    """
+    获取艺术家页面聚合数据
+    
+    **功能说明：**
+    - 一次返回艺术家记录（含Wikipedia数据）、演出信息、歌曲（含预览URL）、最新AI描述和Spotify概要
+    - 各部分在服务端并发获取，聚合结果缓存，相关数据经本接口组修改后立即失效
+    - 部分数据获取失败时仍返回其余部分，失败项为 null 并记录在 errors 中
+    """
+    try:
+        result = await artist_bundle_service.get_bundle(artist_id, language, songs_limit)
+        if result["success"]:
+            return FastJSONResponse(content=result)
+        else:
+            raise HTTPException(status_code=404, detail=result["error"])
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_artist_bundle API: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/songs")
 async def search_songs(
+    request: Request,
     query: str = Query(..., description="搜索关键词"),
     limit: int = Query(10, description="返回结果数量限制", ge=1, le=50),
     offset: int = Query(0, description="偏移量", ge=0)
@@ -332,15 +413,21 @@ async def search_songs(
     - 支持歌曲标题和专辑名称搜索
     - 返回结果包含艺术家信息
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await song_db_service.search_songs(query, limit, offset)
-        return result
+        if result["success"]:
+            return conditional_response(request, result)
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in search_songs API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/songs/with-preview")
 async def get_songs_with_preview(
+    request: Request,
     limit: int = Query(20, description="返回结果数量限制", ge=1, le=50),
     offset: int = Query(0, description="偏移量", ge=0)
 ):
@@ -351,9 +438,14 @@ async def get_songs_with_preview(
     - 只返回有音频预览的歌曲
     - 适用于音乐播放功能
     """
+    not_modified = check_not_modified(request)
+    if not_modified is not None:
+        return not_modified
     try:
         result = await song_db_service.get_songs_with_preview(limit, offset)
-        return result
+        if result["success"]:
+            return conditional_response(request, result)
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_songs_with_preview API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -375,9 +467,10 @@ async def create_ai_description(description_data: CreateAIDescriptionRequest):
     try:
         result = await ai_description_db_service.create_ai_description(description_data)
         if result["success"]:
-            return JSONResponse(content=result, status_code=201)
+            artist_bundle_service.invalidate(description_data.artist_id)
+            return FastJSONResponse(content=result, status_code=201)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in create_ai_description API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -394,7 +487,7 @@ async def get_artist_ai_descriptions(
     """
     try:
         result = await ai_description_db_service.get_ai_descriptions_by_artist(artist_id, language, limit, offset)
-        return result
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_artist_ai_descriptions API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -414,7 +507,7 @@ async def get_latest_ai_description(
     try:
         result = await ai_description_db_service.get_latest_ai_description(artist_id, language)
         if result["success"]:
-            return result
+            return FastJSONResponse(content=result)
         else:
             raise HTTPException(status_code=404, detail=result["error"])
     except HTTPException:
@@ -436,7 +529,7 @@ async def get_ai_descriptions_stats(
     """
     try:
         result = await ai_description_db_service.get_ai_descriptions_stats(artist_id)
-        return result
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_ai_descriptions_stats API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -458,9 +551,9 @@ async def add_favorite(
     try:
         result = await user_db_service.add_favorite(user_id, favorite_data)
         if result["success"]:
-            return JSONResponse(content=result, status_code=201)
+            return FastJSONResponse(content=result, status_code=201)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in add_favorite API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -476,9 +569,9 @@ async def remove_favorite(
     try:
         result = await user_db_service.remove_favorite(user_id, artist_id)
         if result["success"]:
-            return result
+            return FastJSONResponse(content=result)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in remove_favorite API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -498,7 +591,7 @@ async def get_user_favorites(
     """
     try:
         result = await user_db_service.get_user_favorites(user_id, limit, offset)
-        return result
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_user_favorites API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -515,7 +608,7 @@ async def get_favorites_by_tag(
     """
     try:
         result = await user_db_service.get_favorites_by_tag(user_id, tag, limit, offset)
-        return result
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_favorites_by_tag API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -547,9 +640,9 @@ async def record_search(
             None, ip_address, user_agent
         )
         if result["success"]:
-            return JSONResponse(content=result, status_code=201)
+            return FastJSONResponse(content=result, status_code=201)
         else:
-            return JSONResponse(content=result, status_code=400)
+            return FastJSONResponse(content=result, status_code=400)
     except Exception as e:
         logger.error(f"Error in record_search API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -569,7 +662,7 @@ async def get_popular_searches(
     """
     try:
         result = await user_db_service.get_popular_searches(search_type, days, limit)
-        return result
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_popular_searches API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -585,7 +678,7 @@ async def get_user_stats(user_id: UUID = Path(..., description="用户UUID")):
     """
     try:
         result = await user_db_service.get_user_stats(user_id)
-        return result
+        return FastJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in get_user_stats API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
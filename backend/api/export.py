@@ -0,0 +1,76 @@
+"""
+数据导出 API 路由 - 以 NDJSON（每行一个 JSON 对象）流式导出整张表
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from api.responses import dumps
+from services.export_service import EXPORT_TABLES, export_service
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/export", tags=["Export"])
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _encode_pages(first_page: List[Dict[str, Any]], pages: Iterator[List[Dict[str, Any]]],
+                  table: str) -> Iterator[bytes]:
+    """每页编码为一个数据块（每行一个 JSON 对象）"""
+    exported = 0
+    try:
+        page = first_page
+        while page:
+            exported += len(page)
+            yield b"".join(dumps(row) + b"\n" for row in page)
+            page = next(pages, None)
+    except Exception as e:
+        # 响应头已经发出，只能中断连接：客户端会收到不完整的分块响应，而不是被截断但看似完整的文件
+        logger.error(f"Export of {table} failed after {exported} rows: {str(e)}")
+        raise
+    logger.info(f"Exported {exported} rows from {table}")
+
+
+@router.get("/{table}.ndjson")
+async def export_table(
+    table: str = Path(..., description="表名：artists / songs / ai_descriptions"),
+    updated_since: Optional[datetime] = Query(None, description="只导出该时间之后更新（ai_descriptions 为创建）的行"),
+    fields: Optional[str] = Query(None, description="逗号分隔的字段列表，为空时导出全部字段"),
+    page_size: Optional[int] = Query(None, description="每次查询数据库的行数", ge=1, le=5000)
+):
+    """
+    以 NDJSON 流式导出整张表
+
+    **功能说明：**
+    - 按 id 分页读取数据库，逐页输出，内存占用与表大小无关
+    - 支持 updated_since 增量导出和字段投影
+    - 客户端可以边下载边逐行解析
+    """
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"Table '{table}' cannot be exported")
+    try:
+        pages = export_service.iter_pages(
+            table,
+            fields=fields.split(",") if fields else None,
+            updated_since=updated_since,
+            page_size=page_size
+        )
+        # 先读取第一页：参数错误、数据库不可用等问题在发出响应头之前以正常的错误状态返回
+        first_page = await run_in_threadpool(next, pages, [])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in export_table API: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        _encode_pages(first_page, pages, table),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{table}.ndjson"'}
+    )
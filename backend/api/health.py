@@ -32,7 +32,21 @@ async def get_system_status():
     """
     获取详细的系统状态信息
     """
+    # 在处理函数内导入：健康检查模块不依赖各服务的加载
+    from api.compression import get_compression_stats
+    from api.conditional import get_conditional_stats
+    from services.artist_bundle_service import artist_bundle_service
+    from services.circuit_breaker import get_all_breaker_stats
+    from services.disk_cache import get_http_cache
+    from services.hedging import get_all_hedge_stats
+    from services.itunes_service import itunes_service
+    from services.preview_resolver import preview_resolver
+    from services.rate_limiter import get_all_limiter_stats
+    from services.spotify_service import spotify_service
+    from services.wikipedia_service import get_wikipedia_cache_stats, wikipedia_service
+    
     api_validation = validate_settings()
+    http_cache = get_http_cache()
     
     return {
         "success": True,
@@ -45,7 +59,9 @@ async def get_system_status():
             "services": {
                 "wikipedia": {
                     "available": True,
-                    "base_url": settings.WIKIPEDIA_API_URL
+                    "base_url": settings.WIKIPEDIA_SITE_URL,
+                    "cache": get_wikipedia_cache_stats(),
+                    "database_copy": wikipedia_service.get_db_copy_stats()
                 },
                 "deepseek": {
                     "available": api_validation["deepseek"],
@@ -53,9 +69,22 @@ async def get_system_status():
                 },
                 "spotify": {
                     "available": api_validation["spotify"],
-                    "configured": bool(settings.SPOTIFY_CLIENT_ID and settings.SPOTIFY_CLIENT_SECRET)
-                }
+                    "configured": bool(settings.SPOTIFY_CLIENT_ID and settings.SPOTIFY_CLIENT_SECRET),
+                    "cache": spotify_service.get_cache_stats()
+                },
+                "itunes": {
+                    "available": True,
+                    "cache": itunes_service.get_cache_stats(),
+                    "preview_resolver": preview_resolver.stats()
+                },
+                "artist_bundle": artist_bundle_service.get_cache_stats()
             },
+            "rate_limits": get_all_limiter_stats(),
+            "circuit_breakers": get_all_breaker_stats(),
+            "hedging": get_all_hedge_stats(),
+            "compression": get_compression_stats(),
+            "conditional_requests": get_conditional_stats(),
+            "http_cache": http_cache.stats() if http_cache else {"mode": "off"},
             "timestamp": datetime.now()
         }
     }
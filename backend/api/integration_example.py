@@ -5,7 +5,7 @@ import logging
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, Query, Path
-from fastapi.responses import JSONResponse
+from api.responses import FastJSONResponse
 
 # 导入现有服务
 from services.wikipedia_service import wikipedia_service
@@ -17,6 +17,7 @@ from services.artist_db_service import artist_db_service
 from services.song_db_service import song_db_service
 from services.ai_description_db_service import ai_description_db_service
 from services.user_db_service import user_db_service
+from services.response_versions import invalidate_versions
 
 # 导入数据模型
 from models.database import CreateArtistRequest, CreateSongRequest, CreateAIDescriptionRequest
@@ -55,7 +56,7 @@ async def complete_artist_setup(
             if existing_artist.get("success"):
                 result["data"]["existing_artist"] = existing_artist["data"]
                 result["steps_completed"].append("found_existing_artist")
-                return JSONResponse(content={
+                return FastJSONResponse(content={
                     "success": True,
                     "message": "Artist already exists in database",
                     "result": result
@@ -186,6 +187,7 @@ async def complete_artist_setup(
                     
                     result["data"]["artist_id"] = str(artist_id)
                     result["steps_completed"].append("database_saved")
+                    invalidate_versions()
                     
                 else:
                     result["database_operations"].append(f"artist_creation_failed: {artist_create_result.get('error')}")
@@ -198,7 +200,7 @@ async def complete_artist_setup(
         success_count = len(result["steps_completed"])
         total_steps = 5 if save_to_db else 4
         
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "message": f"Artist setup completed: {success_count}/{total_steps} steps successful",
             "result": result
@@ -278,7 +280,7 @@ async def get_enhanced_artist_info(
             except Exception as e:
                 logger.error(f"Spotify API error: {str(e)}")
         
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "result": result
         }, status_code=200)
@@ -336,7 +338,7 @@ async def search_and_favorite(
             if favorite_result.get("success"):
                 result["favorite_data"] = favorite_result["data"]
         
-        return JSONResponse(content={
+        return FastJSONResponse(content={
             "success": True,
             "result": result
         }, status_code=200)
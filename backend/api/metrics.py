@@ -0,0 +1,96 @@
+"""
+运行指标 - 请求计时中间件和 /metrics 接口（Prometheus 文本格式）
+
+- 每个请求按 (方法, 路由模板, 状态码) 记录耗时，路由模板如 /api/database/artists/{artist_id}，
+  不按实际路径区分，序列数量固定；未匹配任何路由的请求记为 "unmatched"
+- 流式响应的耗时包含整个响应体的发送时间
+- 缓存命中率、熔断器状态在抓取时从各自的统计中读取
+
+指标在每个 worker 进程内单独统计，所有序列带 pid 标签，见 services.metrics。
+"""
+import time
+from typing import Iterable
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from services.cache import get_all_cache_stats
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, get_all_breaker_stats
+from services.metrics import (
+    Counter, Gauge, Metric, http_request_duration, http_requests_in_flight, registry
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["Metrics"])
+
+
+class MetricsMiddleware:
+    """记录请求耗时和正在处理的请求数（纯 ASGI 中间件，不包装响应体）"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec(method)
+            # 路由匹配后 FastAPI 把匹配到的路由写入 scope["route"]
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                method, getattr(route, "path", None) or "unmatched", str(status_code)
+            )
+
+
+def _collect_caches() -> Iterable[Metric]:
+    """内存 TTL 缓存的命中、未命中、命中率和当前大小"""
+    lookups = Counter("cache_lookups_total", "In-memory cache lookups by cache and result", ("cache", "result"))
+    hit_ratio = Gauge("cache_hit_ratio", "Share of in-memory cache lookups served from the cache", ("cache",))
+    size = Gauge("cache_entries", "Entries currently held by the in-memory cache", ("cache",))
+    evictions = Counter("cache_evictions_total", "Entries evicted by the LRU limit", ("cache",))
+    for name, stats in get_all_cache_stats().items():
+        for result in ("hits", "stale_hits", "negative_hits", "misses"):
+            lookups.inc(name, result, amount=stats[result])
+        hit_ratio.set(stats["hit_ratio"], name)
+        size.set(stats["size"], name)
+        evictions.inc(name, amount=stats["evictions"])
+    return lookups, hit_ratio, size, evictions
+
+
+def _collect_breakers() -> Iterable[Metric]:
+    """各上游熔断器状态（0 关闭 / 1 半开 / 2 打开）"""
+    state = Gauge("upstream_circuit_state", "Circuit breaker state per upstream (0 closed, 1 half-open, 2 open)", ("upstream",))
+    codes = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+    for name, stats in get_all_breaker_stats().items():
+        state.set(codes.get(stats["state"], 0), name)
+    return (state,)
+
+
+registry.add_collector(_collect_caches)
+registry.add_collector(_collect_breakers)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus 文本格式的运行指标（当前 worker 进程）
+    """
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
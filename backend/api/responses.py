@@ -0,0 +1,55 @@
+"""
+JSON 响应 - 使用 orjson 序列化（未安装 orjson 时回退到标准库 json）
+
+main.py 将 FastJSONResponse 设为全局默认响应类。直接返回 FastJSONResponse 的路由
+（大列表、嵌套 wiki_data / spotify_data 的数据库接口）还可以跳过 FastAPI 的 jsonable_encoder。
+UUID、datetime、date 由 orjson 原生处理，pydantic 模型、Decimal、集合通过 _default 转换。
+"""
+import json
+import logging
+from decimal import Decimal
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 是可选依赖
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+if orjson is None:
+    logger.info("orjson not installed, falling back to standard json serialization")
+
+
+def _default(obj: Any) -> Any:
+    """orjson 不能直接序列化的类型"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """序列化为 JSON 字节串（与 FastJSONResponse 相同的规则）"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 序列化的 JSON 响应"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
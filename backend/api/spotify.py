@@ -4,14 +4,11 @@ Spotify API 路由
 from fastapi import APIRouter, HTTPException, Query, Body, status
 from typing import List, Dict, Any
 
-from models.spotify import SpotifyResponse, SpotifyPlaylistRequest, SpotifyPlaylistResponse
-from services.spotify_service import SpotifyService
+from models.spotify import SpotifyResponse, SpotifyPlaylistRequest, SpotifyPlaylistResponse, SpotifyBatchRequest
+from services.spotify_service import spotify_service
 
 router = APIRouter(prefix="/api/spotify", tags=["Spotify"])
 
-# 创建服务实例
-spotify_service = SpotifyService()
-
 @router.get(
     "/artists/{spotify_id}",
     response_model=SpotifyResponse,
@@ -188,6 +185,115 @@ async def get_artist_top_tracks(
             }
         )
 
+@router.post(
+    "/artists/batch",
+    summary="批量获取艺术家信息",
+    description="""
+    根据 Spotify 艺术家 ID 列表批量获取详细信息。
+    
+    服务端按每 50 个 ID 分块调用 Spotify 的 /artists?ids= 接口并并发执行，
+    适用于全量刷新艺术家目录。Spotify 上不存在的 ID 在 missing 中返回，
+    所在分块请求失败（超时、限流、上游错误）的 ID 在 failed 中返回，可以稍后重试。
+    """,
+    responses={
+        200: {"description": "成功获取艺术家信息（部分分块失败时 failed 非空）"},
+        422: {"description": "请求参数无效"},
+        502: {"description": "所有分块都返回上游错误"},
+        503: {"description": "Spotify 服务不可用"}
+    }
+)
+async def get_artists_batch(request: SpotifyBatchRequest):
+    """
+    批量获取 Spotify 艺术家信息
+    
+    请求体参数：
+    - **ids**: Spotify 艺术家 ID 列表（必需）
+    """
+    try:
+        artists, failed = await spotify_service.get_artists_bulk(request.ids)
+        requested = list(dict.fromkeys(request.ids))
+        failed_set = set(failed)
+        return {
+            "success": True,
+            "data": {
+                "artists": list(artists.values()),
+                "total": len(artists),
+                "requested": len(requested),
+                "missing": [
+                    spotify_id for spotify_id in requested
+                    if spotify_id not in artists and spotify_id not in failed_set
+                ],
+                "failed": failed
+            }
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Internal server error",
+                "message": "An unexpected error occurred while fetching artists in batch",
+                "service": "Spotify",
+                "details": str(e)
+            }
+        )
+
+@router.post(
+    "/tracks/batch",
+    summary="批量获取曲目信息",
+    description="""
+    根据 Spotify 曲目 ID 列表批量获取详细信息。
+    
+    服务端按每 50 个 ID 分块调用 Spotify 的 /tracks?ids= 接口并并发执行。
+    Spotify 上不存在的 ID 在 missing 中返回，所在分块请求失败的 ID 在 failed 中返回。
+    """,
+    responses={
+        200: {"description": "成功获取曲目信息（部分分块失败时 failed 非空）"},
+        422: {"description": "请求参数无效"},
+        502: {"description": "所有分块都返回上游错误"},
+        503: {"description": "Spotify 服务不可用"}
+    }
+)
+async def get_tracks_batch(request: SpotifyBatchRequest):
+    """
+    批量获取 Spotify 曲目信息
+    
+    请求体参数：
+    - **ids**: Spotify 曲目 ID 列表（必需）
+    - **market**: 市场代码，默认 JP
+    """
+    try:
+        tracks, failed = await spotify_service.get_tracks_bulk(request.ids, request.market)
+        requested = list(dict.fromkeys(request.ids))
+        failed_set = set(failed)
+        return {
+            "success": True,
+            "data": {
+                "tracks": list(tracks.values()),
+                "total": len(tracks),
+                "requested": len(requested),
+                "missing": [
+                    spotify_id for spotify_id in requested
+                    if spotify_id not in tracks and spotify_id not in failed_set
+                ],
+                "failed": failed,
+                "market": request.market
+            }
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Internal server error",
+                "message": "An unexpected error occurred while fetching tracks in batch",
+                "service": "Spotify",
+                "details": str(e)
+            }
+        )
+
 @router.post(
     "/artists/{spotify_id}/create-playlist",
     response_model=SpotifyPlaylistResponse,
@@ -434,9 +540,8 @@ async def get_spotify_status():
     通过艺术家名称直接获取艺术家信息，自动处理搜索和ID转换。
     
     工作流程：
-    1. 自动搜索艺术家名称
-    2. 选择最匹配的结果（通常是流行度最高的）
-    3. 返回详细的艺术家信息
+    1. 在数据库中查找已保存的 Spotify ID，没有时搜索艺术家名称并选择最匹配的结果（搜索得到的 ID 写回数据库）
+    2. 返回详细的艺术家信息
     
     返回信息包括：
     - 艺术家基本信息（姓名、流行度等）
@@ -496,24 +601,10 @@ async def get_artist_by_name(
     自动搜索并返回最匹配的艺术家详细信息。
     """
     try:
-        # 1. 先搜索艺术家
-        search_results = await spotify_service.search_artists(artist_name, limit=5, market=market)
-        
-        if not search_results:
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "error": "Artist not found",
-                    "message": f"No artist found with name '{artist_name}'",
-                    "service": "Spotify"
-                }
-            )
+        # 1. 解析 Spotify ID（数据库优先，未命中时按原名搜索）
+        spotify_id = await spotify_service.resolve_artist_id(artist_name, market, clean_name=False)
         
-        # 2. 选择最匹配的结果（通常是第一个，因为按流行度排序）
-        best_match = search_results[0]
-        spotify_id = best_match["id"]
-        
-        # 3. 获取详细信息
+        # 2. 获取详细信息
         artist_data = await spotify_service.get_artist_info(spotify_id)
         
         return SpotifyResponse(success=True, data=artist_data)
@@ -541,9 +632,8 @@ async def get_artist_by_name(
     通过艺术家名称直接获取热门曲目，自动处理搜索和ID转换。
     
     工作流程：
-    1. 自动搜索艺术家名称
-    2. 选择最匹配的结果
-    3. 获取该艺术家的热门曲目
+    1. 在数据库中查找已保存的 Spotify ID，没有时搜索艺术家名称并选择最匹配的结果（搜索得到的 ID 写回数据库）
+    2. 获取该艺术家的热门曲目
     
     返回信息包括：
     - 曲目基本信息（标题、时长等）
@@ -616,24 +706,10 @@ async def get_artist_top_tracks_by_name(
     自动搜索艺术家并返回其热门曲目列表。
     """
     try:
-        # 1. 先搜索艺术家
-        search_results = await spotify_service.search_artists(artist_name, limit=5, market=market)
-        
-        if not search_results:
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "error": "Artist not found",
-                    "message": f"No artist found with name '{artist_name}'",
-                    "service": "Spotify"
-                }
-            )
-        
-        # 2. 选择最匹配的结果
-        best_match = search_results[0]
-        spotify_id = best_match["id"]
+        # 1. 解析 Spotify ID（数据库优先，未命中时按原名搜索）
+        spotify_id = await spotify_service.resolve_artist_id(artist_name, market, clean_name=False)
         
-        # 3. 获取热门曲目
+        # 2. 获取热门曲目
         tracks = await spotify_service.get_top_tracks(spotify_id, limit, market)
         
         return {
@@ -4,14 +4,11 @@ Wikipedia API 路由
 from fastapi import APIRouter, HTTPException, Query, status
 from typing import Optional, List, Dict, Any
 
-from models.wikipedia import WikipediaResponse
-from services.wikipedia_service import WikipediaService
+from models.wikipedia import WikipediaResponse, WikipediaBatchRequest
+from services.wikipedia_service import wikipedia_service
 
 router = APIRouter(prefix="/api/wikipedia", tags=["Wikipedia"])
 
-# 创建服务实例
-wikipedia_service = WikipediaService()
-
 @router.get(
     "/artists/{artist_name}", 
     response_model=WikipediaResponse,
@@ -24,6 +21,7 @@ wikipedia_service = WikipediaService()
     - 参考资料链接
     
     支持多种语言版本的 Wikipedia。
+    数据库中已保存该语言的副本时直接返回副本，副本过期时在后台刷新。
     """,
     responses={
         200: {
@@ -88,7 +86,7 @@ async def get_artist_wiki_info(
     返回艺术家的详细 Wikipedia 信息，包括简介、图片和相关链接。
     """
     try:
-        wiki_data = await wikipedia_service.get_artist_info(artist_name, language)
+        wiki_data = await wikipedia_service.get_artist_info_db_first(artist_name, language)
         return WikipediaResponse(success=True, data=wiki_data)
     except HTTPException:
         # 重新抛出已处理的 HTTP 异常
@@ -105,6 +103,46 @@ async def get_artist_wiki_info(
             }
         )
 
+@router.post(
+    "/artists/batch",
+    summary="批量获取艺术家的 Wikipedia 信息",
+    description="""
+    批量获取多个艺术家的 Wikipedia 摘要和缩略图。
+    
+    每 50 个名称合并为一次 MediaWiki action API 查询，并自动解析重定向。
+    未找到页面（或只有消歧义页）的名称在 `missing` 中返回。
+    """
+)
+async def get_artists_wiki_batch(request: WikipediaBatchRequest):
+    """
+    批量获取艺术家的 Wikipedia 信息
+    
+    - **artist_names**: 艺术家名称列表
+    - **language**: 语言代码，默认为英文 (en)
+    """
+    try:
+        results = await wikipedia_service.get_artists_bulk(request.artist_names, request.language)
+        return {
+            "success": True,
+            "data": {
+                "artists": results,
+                "total": len(results),
+                "requested": len(request.artist_names),
+                "missing": [name for name in request.artist_names if name not in results],
+                "language": request.language
+            }
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Batch fetch failed",
+                "message": "Failed to fetch Wikipedia data in batch",
+                "service": "Wikipedia",
+                "details": str(e)
+            }
+        )
+
 @router.get(
     "/search",
     summary="搜索艺术家",
@@ -24,6 +24,17 @@ class Settings:
     DEBUG: bool = os.getenv("DEBUG", "true").lower() == "true"
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     
+    # 生产服务器模式（gunicorn -c gunicorn.conf.py main:app）：多 worker、uvloop + httptools，
+    # 主进程预加载应用并预热缓存，fork 后各 worker 以写时复制方式共享
+    SERVER_WORKERS: int = int(os.getenv("SERVER_WORKERS", os.getenv("WEB_CONCURRENCY", 0)))  # 0 表示按 CPU 核数
+    SERVER_KEEPALIVE: int = int(os.getenv("SERVER_KEEPALIVE", 20))   # 空闲长连接保持时间（秒），应大于前端代理的空闲超时
+    SERVER_BACKLOG: int = int(os.getenv("SERVER_BACKLOG", 2048))
+    SERVER_TIMEOUT: int = int(os.getenv("SERVER_TIMEOUT", 60))        # worker 无响应超过该秒数后重启
+    SERVER_GRACEFUL_TIMEOUT: int = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", 30))
+    SERVER_MAX_REQUESTS: int = int(os.getenv("SERVER_MAX_REQUESTS", 0))  # 每个 worker 处理该数量请求后重启，0 表示不限
+    SERVER_ACCESS_LOG: bool = os.getenv("SERVER_ACCESS_LOG", "false").lower() == "true"
+    SERVER_WARM_UP: bool = os.getenv("SERVER_WARM_UP", "true").lower() == "true"  # fork 前预热缓存
+    
     # API 密钥配置
     ARK_API_KEY: Optional[str] = os.getenv("ARK_API_KEY")
     SPOTIFY_CLIENT_ID: Optional[str] = os.getenv("SPOTIFY_CLIENT_ID")
@@ -37,22 +48,131 @@ class Settings:
     SUPABASE_JWT_SECRET: Optional[str] = os.getenv("SUPABASE_JWT_SECRET")
     
     # Wikipedia API 配置
-    WIKIPEDIA_API_URL: str = os.getenv("WIKIPEDIA_API_URL", "https://zh.wikipedia.org/api/rest_v1")
+    WIKIPEDIA_SITE_URL: str = os.getenv("WIKIPEDIA_SITE_URL", "https://{language}.wikipedia.org")  # REST 和 action API 的站点地址模板
     WIKIPEDIA_USER_AGENT: str = os.getenv("WIKIPEDIA_USER_AGENT", "FujiRock2025API/1.0 (https://github.com/example/fujirock)")
+    WIKIPEDIA_MAXLAG: int = int(os.getenv("WIKIPEDIA_MAXLAG", 5))  # Action API 的 maxlag 参数（秒）
+    WIKIPEDIA_BULK_CONCURRENCY: int = int(os.getenv("WIKIPEDIA_BULK_CONCURRENCY", 2))  # 批量摘要查询的并发请求数
+    WIKIPEDIA_LOOKUP_CONCURRENCY: int = int(os.getenv("WIKIPEDIA_LOOKUP_CONCURRENCY", 6))  # 多语言/多变体并发查找的并发请求数
+    WIKIPEDIA_MIN_EXTRACT_LENGTH: int = int(os.getenv("WIKIPEDIA_MIN_EXTRACT_LENGTH", 20))  # 查找结果摘要的最小长度
+    
+    # Wikipedia 响应缓存配置（秒）
+    WIKIPEDIA_CACHE_MAX_SIZE: int = int(os.getenv("WIKIPEDIA_CACHE_MAX_SIZE", 1024))
+    WIKIPEDIA_CACHE_TTL: float = float(os.getenv("WIKIPEDIA_CACHE_TTL", 3600))
+    WIKIPEDIA_NEGATIVE_CACHE_TTL: float = float(os.getenv("WIKIPEDIA_NEGATIVE_CACHE_TTL", 300))    # 404 和超时结果的缓存时间
+    WIKIPEDIA_CACHE_STALE_TTL: float = float(os.getenv("WIKIPEDIA_CACHE_STALE_TTL", 600))          # 过期后返回旧数据并后台刷新的时间窗口
+    WIKIPEDIA_CACHE_REFRESH_AHEAD: float = float(os.getenv("WIKIPEDIA_CACHE_REFRESH_AHEAD", 300))  # 距离过期不足该时间时提前后台刷新
+    # 数据库中 Wikipedia 副本（artists.wiki_data）的有效期，超过后先返回旧副本并后台刷新；0 表示不读取数据库
+    WIKIPEDIA_DB_MAX_AGE: float = float(os.getenv("WIKIPEDIA_DB_MAX_AGE", 7 * 24 * 3600))
     
     # DeepSeek AI API 配置
     DEEPSEEK_MODEL: str = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
+    DEEPSEEK_API_URL: Optional[str] = os.getenv("DEEPSEEK_API_URL")  # 为空时使用 SDK 默认地址
     DEEPSEEK_MAX_TOKENS: int = int(os.getenv("DEEPSEEK_MAX_TOKENS", 1000))
     DEEPSEEK_TEMPERATURE: float = float(os.getenv("DEEPSEEK_TEMPERATURE", 0.8))
     
     # Spotify API 配置
     SPOTIFY_API_URL: str = os.getenv("SPOTIFY_API_URL", "https://api.spotify.com/v1")
     SPOTIFY_AUTH_URL: str = os.getenv("SPOTIFY_AUTH_URL", "https://accounts.spotify.com/api/token")
+    SPOTIFY_BULK_CONCURRENCY: int = int(os.getenv("SPOTIFY_BULK_CONCURRENCY", 4))  # 批量接口并发请求数
+    
+    # Spotify 响应缓存配置（秒）
+    SPOTIFY_CACHE_MAX_SIZE: int = int(os.getenv("SPOTIFY_CACHE_MAX_SIZE", 2048))
+    SPOTIFY_ARTIST_CACHE_TTL: float = float(os.getenv("SPOTIFY_ARTIST_CACHE_TTL", 3600))
+    SPOTIFY_TOP_TRACKS_CACHE_TTL: float = float(os.getenv("SPOTIFY_TOP_TRACKS_CACHE_TTL", 1800))
+    SPOTIFY_SEARCH_CACHE_TTL: float = float(os.getenv("SPOTIFY_SEARCH_CACHE_TTL", 600))
+    SPOTIFY_ARTIST_ID_CACHE_TTL: float = float(os.getenv("SPOTIFY_ARTIST_ID_CACHE_TTL", 24 * 3600))  # 艺术家名称 -> Spotify ID
+    SPOTIFY_NEGATIVE_CACHE_TTL: float = float(os.getenv("SPOTIFY_NEGATIVE_CACHE_TTL", 300))   # 404 结果的缓存时间
+    SPOTIFY_CACHE_STALE_TTL: float = float(os.getenv("SPOTIFY_CACHE_STALE_TTL", 600))         # 过期后返回旧数据并后台刷新的时间窗口
+    
+    # iTunes Search API
+    ITUNES_API_URL: str = os.getenv("ITUNES_API_URL", "https://itunes.apple.com/search")
+    
+    # iTunes 预览搜索结果缓存配置（秒）
+    ITUNES_CACHE_MAX_SIZE: int = int(os.getenv("ITUNES_CACHE_MAX_SIZE", 2048))
+    ITUNES_PREVIEW_CACHE_TTL: float = float(os.getenv("ITUNES_PREVIEW_CACHE_TTL", 6 * 3600))
+    ITUNES_NEGATIVE_CACHE_TTL: float = float(os.getenv("ITUNES_NEGATIVE_CACHE_TTL", 600))   # 未找到匹配歌曲的缓存时间
+    
+    # 歌曲预览URL后台补全任务（间隔为 0 时不在应用内自动运行，可使用 scripts/resolve_song_previews.py）
+    PREVIEW_RESOLVER_INTERVAL: float = float(os.getenv("PREVIEW_RESOLVER_INTERVAL", 0))
+    PREVIEW_RESOLVER_CONCURRENCY: int = int(os.getenv("PREVIEW_RESOLVER_CONCURRENCY", 4))   # 同时查询 iTunes 的歌曲数
+    PREVIEW_RESOLVER_BATCH_SIZE: int = int(os.getenv("PREVIEW_RESOLVER_BATCH_SIZE", 50))    # 每批扫描并写回数据库的歌曲数
+    
+    # 整表导出（/export/*.ndjson 和脚本）每次查询数据库的行数
+    EXPORT_PAGE_SIZE: int = int(os.getenv("EXPORT_PAGE_SIZE", 1000))
     
     # HTTP 客户端配置
     HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", 30.0))
     HTTP_RETRIES: int = int(os.getenv("HTTP_RETRIES", 3))
     
+    # 上游响应磁盘缓存（SQLite），主要供数据填充脚本重复运行时使用
+    # 模式：off 关闭 / cache 读写缓存（按 TTL）/ record 总是请求上游并记录 / replay 只从缓存回放（不访问网络）
+    HTTP_CACHE_MODE: str = os.getenv("HTTP_CACHE_MODE", "off").lower()
+    HTTP_CACHE_PATH: str = os.getenv("HTTP_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "http_cache.sqlite"))
+    HTTP_CACHE_TTL: float = float(os.getenv("HTTP_CACHE_TTL", 7 * 24 * 3600))
+    SPOTIFY_HTTP_CACHE_TTL: float = float(os.getenv("SPOTIFY_HTTP_CACHE_TTL", os.getenv("HTTP_CACHE_TTL", 24 * 3600)))
+    WIKIPEDIA_HTTP_CACHE_TTL: float = float(os.getenv("WIKIPEDIA_HTTP_CACHE_TTL", os.getenv("HTTP_CACHE_TTL", 7 * 24 * 3600)))
+    ITUNES_HTTP_CACHE_TTL: float = float(os.getenv("ITUNES_HTTP_CACHE_TTL", os.getenv("HTTP_CACHE_TTL", 7 * 24 * 3600)))
+    
+    # 上游限流配置：每秒请求数 / 突发容量（被 429/503 限流时会自动降速并按 Retry-After 暂停）
+    SPOTIFY_RATE_LIMIT: float = float(os.getenv("SPOTIFY_RATE_LIMIT", 5.0))
+    SPOTIFY_RATE_BURST: int = int(os.getenv("SPOTIFY_RATE_BURST", 10))
+    WIKIPEDIA_RATE_LIMIT: float = float(os.getenv("WIKIPEDIA_RATE_LIMIT", 10.0))
+    WIKIPEDIA_RATE_BURST: int = int(os.getenv("WIKIPEDIA_RATE_BURST", 20))
+    # iTunes Search API 公开限额约为每分钟 20 次
+    ITUNES_RATE_LIMIT: float = float(os.getenv("ITUNES_RATE_LIMIT", 0.33))
+    ITUNES_RATE_BURST: int = int(os.getenv("ITUNES_RATE_BURST", 3))
+    DEEPSEEK_RATE_LIMIT: float = float(os.getenv("DEEPSEEK_RATE_LIMIT", 2.0))
+    DEEPSEEK_RATE_BURST: int = int(os.getenv("DEEPSEEK_RATE_BURST", 5))
+    DEFAULT_RATE_LIMIT: float = float(os.getenv("DEFAULT_RATE_LIMIT", 5.0))
+    DEFAULT_RATE_BURST: int = int(os.getenv("DEFAULT_RATE_BURST", 10))
+    
+    # 对冲请求：第一次请求超过近期延迟 p95 仍未返回时再发一次相同请求，先返回的生效（只用于 GET）
+    # 对冲请求数不超过普通请求的 HTTP_HEDGE_BUDGET 比例；各上游单独开启
+    WIKIPEDIA_HEDGE_REQUESTS: bool = os.getenv("WIKIPEDIA_HEDGE_REQUESTS", "false").lower() == "true"
+    ITUNES_HEDGE_REQUESTS: bool = os.getenv("ITUNES_HEDGE_REQUESTS", "false").lower() == "true"
+    HTTP_HEDGE_PERCENTILE: float = float(os.getenv("HTTP_HEDGE_PERCENTILE", 0.95))
+    HTTP_HEDGE_BUDGET: float = float(os.getenv("HTTP_HEDGE_BUDGET", 0.05))
+    HTTP_HEDGE_MIN_SAMPLES: int = int(os.getenv("HTTP_HEDGE_MIN_SAMPLES", 20))   # 延迟样本达到该数量后才开始对冲
+    HTTP_HEDGE_MIN_DELAY: float = float(os.getenv("HTTP_HEDGE_MIN_DELAY", 0.02))
+    
+    # 上游熔断器：最近 WINDOW 次调用中错误率或慢调用（耗时超过超时时间 × SLOW_CALL_RATIO）比例超过阈值时打开，
+    # 打开期间请求直接失败并走各服务的回退逻辑，OPEN_SECONDS 后放行 HALF_OPEN_CALLS 个试探请求
+    CIRCUIT_BREAKER_ENABLED: bool = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    CIRCUIT_BREAKER_WINDOW: int = int(os.getenv("CIRCUIT_BREAKER_WINDOW", 20))
+    CIRCUIT_BREAKER_MIN_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", 10))
+    CIRCUIT_BREAKER_FAILURE_RATE: float = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", 0.5))
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = float(os.getenv("CIRCUIT_BREAKER_SLOW_CALL_RATE", 0.8))
+    CIRCUIT_BREAKER_SLOW_CALL_RATIO: float = float(os.getenv("CIRCUIT_BREAKER_SLOW_CALL_RATIO", 0.5))
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", 30))
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_CALLS", 3))
+    
+    # 响应压缩：按 Accept-Encoding 协商 brotli / gzip，只压缩允许列表中的类型（以 "/" 结尾的项按前缀匹配）
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))   # 小于该字节数的响应不压缩
+    COMPRESSION_CONTENT_TYPES: str = os.getenv(
+        "COMPRESSION_CONTENT_TYPES",
+        "application/json,application/x-ndjson,application/javascript,text/"
+    )
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+    COMPRESSION_CACHE_SIZE: int = int(os.getenv("COMPRESSION_CACHE_SIZE", 256))  # 缓存的压缩结果数量
+    
+    # 运行指标：/metrics 按 Prometheus 文本格式输出请求延迟、上游调用、缓存命中率和事件循环延迟
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_LOOP_LAG_INTERVAL: float = float(os.getenv("METRICS_LOOP_LAG_INTERVAL", 0.5))  # 事件循环延迟采样间隔（秒），0 表示不采样
+    
+    # 条件请求：数据库艺术家/歌曲接口返回 ETag / Last-Modified，客户端带 If-None-Match / If-Modified-Since 时可返回 304
+    # 最近一次响应的校验值在进程内保留 CONDITIONAL_VERSION_TTL 秒，期间匹配的条件请求不查询数据库（0 表示总是查询）
+    # 写操作只能清除当前进程的记录，因此只在实际只有一个 worker 时默认开启
+    # （SERVER_WORKERS 为 0 时 gunicorn 按 CPU 核数启动 worker；python main.py 为单进程，需要时手动设置）
+    CONDITIONAL_VERSION_TTL: float = float(os.getenv("CONDITIONAL_VERSION_TTL", 30 if (SERVER_WORKERS or os.cpu_count() or 1) == 1 else 0))
+    CONDITIONAL_VERSION_CACHE_SIZE: int = int(os.getenv("CONDITIONAL_VERSION_CACHE_SIZE", 4096))
+    
+    # 艺术家页面聚合接口（/artists/{id}/bundle）的结果缓存（秒），相关数据经 API 修改后立即失效
+    BUNDLE_CACHE_MAX_SIZE: int = int(os.getenv("BUNDLE_CACHE_MAX_SIZE", 512))
+    BUNDLE_CACHE_TTL: float = float(os.getenv("BUNDLE_CACHE_TTL", 300))
+    BUNDLE_PARTIAL_CACHE_TTL: float = float(os.getenv("BUNDLE_PARTIAL_CACHE_TTL", 30))  # 部分数据获取失败时的缓存时间
+    
     # 服务特定超时配置
     WIKIPEDIA_TIMEOUT: float = float(os.getenv("WIKIPEDIA_TIMEOUT", 8.0))  # Wikipedia专用超时：8秒
     SPOTIFY_TIMEOUT: float = float(os.getenv("SPOTIFY_TIMEOUT", 10.0))     # Spotify专用超时：10秒
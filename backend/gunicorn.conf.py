@@ -0,0 +1,62 @@
+"""
+生产服务器配置 - gunicorn 管理多个 uvicorn worker
+
+启动（在 backend 目录下）：
+    gunicorn -c gunicorn.conf.py main:app
+
+- preload_app：主进程导入应用并预热缓存，然后 gc.freeze()，fork 后各 worker 写时复制共享这些对象
+- worker 使用 uvloop 事件循环和 httptools HTTP 解析器，关闭访问日志
+- fork 后每个 worker 重新创建数据库客户端，不与主进程共用连接
+- 后台任务（歌曲预览补全）只在一个 worker 中运行；该 worker 退出后由下一个新 worker 接管
+
+开发时仍使用 python main.py（单进程，支持 reload）。
+"""
+import gc
+import multiprocessing
+
+from uvicorn_worker import UvicornWorker
+
+from config import settings
+
+
+class ProductionWorker(UvicornWorker):
+    """uvloop + httptools，关闭访问日志"""
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "access_log": settings.SERVER_ACCESS_LOG}
+
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = settings.SERVER_WORKERS or multiprocessing.cpu_count()
+worker_class = ProductionWorker
+preload_app = True
+keepalive = settings.SERVER_KEEPALIVE
+backlog = settings.SERVER_BACKLOG
+timeout = settings.SERVER_TIMEOUT
+graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT
+max_requests = settings.SERVER_MAX_REQUESTS
+max_requests_jitter = settings.SERVER_MAX_REQUESTS // 10
+accesslog = "-" if settings.SERVER_ACCESS_LOG else None
+loglevel = settings.LOG_LEVEL.lower()
+
+
+def when_ready(server):
+    """应用已预加载、worker 尚未 fork：预热缓存并冻结当前对象"""
+    if settings.SERVER_WARM_UP:
+        from services.warmup import warm_up
+        warm_up()
+    # 把已有对象移出 GC 跟踪范围，避免 worker 中的垃圾回收改写共享页面引发复制
+    gc.freeze()
+
+
+def pre_fork(server, worker):
+    """在主进程中为新 worker 分配后台任务（同一时间只有一个 worker 运行）"""
+    worker.run_background_tasks = not any(
+        getattr(existing, "run_background_tasks", False) for existing in server.WORKERS.values()
+    )
+
+
+def post_fork(server, worker):
+    """worker 进程内：重新创建数据库客户端，未分配后台任务的 worker 关闭预览补全"""
+    from services.database_service import db_service
+    db_service.reset_client()
+    if not worker.run_background_tasks:
+        settings.PREVIEW_RESOLVER_INTERVAL = 0
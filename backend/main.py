@@ -1,15 +1,16 @@
 """
 Fuji Rock 2025 API - 重构后的主应用文件
 """
-import uvicorn
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
 
 from config import settings, validate_settings
+from api.responses import FastJSONResponse
+from api.compression import CompressionMiddleware
+from api.metrics import MetricsMiddleware
 
 # 导入路由
 from api.wikipedia import router as wikipedia_router
@@ -17,12 +18,18 @@ from api.wikipedia import router as wikipedia_router
 from api.spotify import router as spotify_router
 from api.health import router as health_router
 from api.database import router as database_router
+from api.export import router as export_router
+from api.metrics import router as metrics_router
 from api.integration_example import router as integration_router
 from api.auth import router as auth_router
 from api.protected import router as protected_router
+from services.metrics import EventLoopLagMonitor
 
 logger = logging.getLogger(__name__)
 
+# 创建全局事件循环延迟监控实例
+loop_lag_monitor = EventLoopLagMonitor(settings.METRICS_LOOP_LAG_INTERVAL)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
@@ -39,10 +46,23 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("🛠️ Development mode - Relaxed CORS settings")
     
+    # 后台补全歌曲预览URL
+    if settings.PREVIEW_RESOLVER_INTERVAL > 0:
+        from services.preview_resolver import preview_resolver
+        preview_resolver.start(settings.PREVIEW_RESOLVER_INTERVAL)
+    
+    # 事件循环延迟采样
+    if settings.METRICS_ENABLED and settings.METRICS_LOOP_LAG_INTERVAL > 0:
+        loop_lag_monitor.start()
+    
     yield
     
     # 关闭时的清理操作
     logger.info("🔄 Shutting down application...")
+    if settings.PREVIEW_RESOLVER_INTERVAL > 0:
+        from services.preview_resolver import preview_resolver
+        await preview_resolver.stop()
+    await loop_lag_monitor.stop()
 
 # 创建 FastAPI 应用实例
 app = FastAPI(
@@ -51,7 +71,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse  # orjson 序列化（未安装时回退到标准库 json）
 )
 
 # # 添加可信主机中间件（生产环境安全措施）
@@ -70,6 +91,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 添加响应压缩中间件（压缩所有内层中间件处理后的最终响应）
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        content_types=settings.COMPRESSION_CONTENT_TYPES.split(","),
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        cache_size=settings.COMPRESSION_CACHE_SIZE
+    )
+
+# 添加请求指标中间件（放在压缩之外，耗时包含压缩）
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # 添加全局异常处理
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
@@ -78,13 +114,13 @@ async def global_exception_handler(request, exc):
     
     if settings.is_production:
         # 生产环境不暴露详细错误信息
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"detail": "Internal server error"}
         )
     else:
         # 开发环境返回详细错误信息
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"detail": str(exc)}
         )
@@ -93,11 +129,14 @@ async def global_exception_handler(request, exc):
 API_V1_PREFIX = ""
 
 app.include_router(health_router)  # 健康检查不需要版本前缀
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)  # /metrics 同样不加前缀
 app.include_router(auth_router, prefix=API_V1_PREFIX)
 app.include_router(wikipedia_router, prefix=API_V1_PREFIX)  
 #app.include_router(openai_router, prefix=API_V1_PREFIX)
 app.include_router(spotify_router, prefix=API_V1_PREFIX)
 app.include_router(database_router, prefix=API_V1_PREFIX)
+app.include_router(export_router, prefix=API_V1_PREFIX)
 app.include_router(integration_router, prefix=API_V1_PREFIX)
 app.include_router(protected_router, prefix=API_V1_PREFIX)
 
@@ -141,13 +180,12 @@ async def get_track_with_itunes_preview(
     track: str = Query(..., description="歌曲名称")
 ):
     """
-    获取Spotify歌曲信息，并尝试从iTunes获取预览URL
+    获取Spotify歌曲信息，并尝试获取iTunes预览URL（优先读取数据库中已保存的预览，未命中时实时查询iTunes）
     """
     try:
-        from services.itunes_service import itunes_service
+        from services.preview_resolver import preview_resolver
         
-        # 尝试从iTunes获取预览
-        itunes_result = await itunes_service.search_track(artist, track)
+        preview = await preview_resolver.get_preview(artist, track)
         
         response = {
             "spotify_preview_available": False,
@@ -160,15 +198,16 @@ async def get_track_with_itunes_preview(
             }
         }
         
-        if itunes_result and itunes_result.get("success"):
-            itunes_data = itunes_result["data"]
-            if itunes_data.get("preview_url"):
-                response.update({
-                    "itunes_preview_available": True,
-                    "preview_url": itunes_data["preview_url"],
-                    "preview_source": "iTunes",
-                    "itunes_info": itunes_data
-                })
+        if preview:
+            response.update({
+                "spotify_preview_available": preview["source"] == "Spotify",
+                "itunes_preview_available": preview["source"] == "iTunes",
+                "preview_url": preview["preview_url"],
+                "preview_source": preview["source"],
+                "from_database": preview["from_database"]
+            })
+            if preview["itunes_info"]:
+                response["itunes_info"] = preview["itunes_info"]
         
         return response
         
@@ -190,6 +229,8 @@ async def root():
     }
 
 if __name__ == "__main__":
+    # 开发用单进程服务器；生产环境使用 gunicorn -c gunicorn.conf.py main:app（多 worker，见 gunicorn.conf.py）
+    import uvicorn
     uvicorn.run(
         "main:app",  # 使用字符串导入以支持 reload
         host=settings.HOST,
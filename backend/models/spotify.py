@@ -64,6 +64,11 @@ class SpotifyTopTracksRequest(BaseModel):
     limit: int = Field(10, ge=1, le=50, description="返回数量限制")
     market: str = Field("JP", description="市场代码")
 
+class SpotifyBatchRequest(BaseModel):
+    """Spotify 批量查询请求模型"""
+    ids: List[str] = Field(..., min_length=1, max_length=2000, description="Spotify ID 列表")
+    market: str = Field("JP", description="市场代码（仅曲目查询使用）", pattern="^[A-Z]{2}$")
+
 class SpotifyPlaylistRequest(BaseModel):
     """Spotify 播放列表创建请求模型"""
     playlist_name: str = Field(..., description="播放列表名称", min_length=1)
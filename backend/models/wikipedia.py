@@ -2,7 +2,7 @@
 Wikipedia API 相关数据模型
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 class WikiThumbnail(BaseModel):
     """Wikipedia 缩略图模型"""
@@ -29,6 +29,11 @@ class WikipediaRequest(BaseModel):
     language: str = Field("zh", description="语言代码", pattern="^(zh|en|ja|ko)$")
     include_references: bool = Field(False, description="是否包含参考资料")
 
+class WikipediaBatchRequest(BaseModel):
+    """Wikipedia 批量请求模型"""
+    artist_names: List[str] = Field(..., description="艺术家名称列表", min_length=1, max_length=1000)
+    language: str = Field("en", description="语言代码", pattern="^(zh|en|ja|ko)$")
+
 class WikipediaResponse(BaseModel):
     """Wikipedia 响应模型"""
     success: bool = True
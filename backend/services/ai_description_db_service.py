@@ -136,6 +136,10 @@ class AIDescriptionDatabaseService:
         Returns:
             最新的AI描述
         """
+        return self.get_latest_ai_description_sync(artist_id, language)
+    
+    def get_latest_ai_description_sync(self, artist_id: UUID, language: str = "zh") -> Dict[str, Any]:
+        """get_latest_ai_description 的同步版本（直接执行 supabase 查询，供线程池调用）"""
         if not self.db.is_connected():
             return {"success": False, "error": "Database not connected"}
         
@@ -0,0 +1,167 @@
+"""
+艺术家页面聚合服务 - 一次返回艺术家页面需要的全部数据
+
+聚合内容：艺术家数据库记录（含 Wikipedia 副本）、演出信息、歌曲（含预览URL）、最新AI描述、Spotify 概要。
+各部分并发获取：supabase 客户端是同步的，数据库服务的 async 方法实际会阻塞事件循环，
+因此在线程池中调用它们的同步版本（*_sync）；Spotify 概要在艺术家记录返回后立即开始请求。
+
+聚合结果按 (艺术家ID, 语言, 歌曲数量) 缓存，艺术家、歌曲、AI描述的写操作调用 invalidate() 使其失效。
+部分数据获取失败时仍返回其余部分（失败项为 None 并记录在 errors 中），这样的结果只缓存较短时间。
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, Optional
+from uuid import UUID
+
+from config import settings
+from services.ai_description_db_service import ai_description_db_service
+from services.artist_db_service import artist_db_service
+from services.cache import TTLCache
+from services.single_flight import SingleFlight
+from services.song_db_service import song_db_service
+from services.spotify_service import spotify_service
+
+logger = logging.getLogger(__name__)
+
+
+def _summarize_spotify(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Spotify 艺术家数据 -> 页面使用的概要"""
+    images = data.get("images") or []
+    followers = data.get("followers")
+    return {
+        "id": data.get("id"),
+        "name": data.get("name"),
+        "popularity": data.get("popularity"),
+        "followers": followers.get("total") if isinstance(followers, dict) else followers,
+        "genres": data.get("genres") or [],
+        "image_url": images[0].get("url") if images else None,
+        "external_url": (data.get("external_urls") or {}).get("spotify")
+    }
+
+
+class ArtistBundleService:
+    """艺术家页面聚合服务"""
+
+    def __init__(self):
+        self._cache = TTLCache("artist_bundle", max_size=settings.BUNDLE_CACHE_MAX_SIZE, ttl=settings.BUNDLE_CACHE_TTL)
+        self._inflight = SingleFlight("artist_bundle")
+        # 失效计数（全部 / 每个艺术家）：聚合期间发生写操作时，聚合结果不写入缓存
+        self._epoch = 0
+        self._generations: Dict[str, int] = {}
+        self._stats = {"composed": 0, "partial": 0, "invalidations": 0}
+
+    def invalidate(self, artist_id: Optional[Any] = None) -> None:
+        """
+        使艺术家的聚合结果失效
+
+        Args:
+            artist_id: 艺术家ID；为 None 时清空全部
+        """
+        self._stats["invalidations"] += 1
+        if artist_id is None:
+            self._epoch += 1
+            self._cache.clear()
+            return
+        artist_id = str(artist_id)
+        self._generations[artist_id] = self._generations.get(artist_id, 0) + 1
+        self._cache.delete_where(lambda key: key[0] == artist_id)
+
+    async def get_bundle(self, artist_id: UUID, language: str = "zh", songs_limit: int = 20) -> Dict[str, Any]:
+        """
+        获取艺术家页面聚合数据
+
+        Args:
+            artist_id: 艺术家UUID
+            language: AI描述语言
+            songs_limit: 返回的歌曲数量
+
+        Returns:
+            {"success": True, "data": {...}}；艺术家不存在或数据库不可用时 success 为 False
+        """
+        key: Hashable = (str(artist_id), language, songs_limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return {"success": True, "data": cached, "cached": True}
+        return await self._inflight.do(key, lambda: self._load(key, artist_id, language, songs_limit))
+
+    async def _load(self, key: Hashable, artist_id: UUID, language: str, songs_limit: int) -> Dict[str, Any]:
+        generation = (self._epoch, self._generations.get(key[0], 0))
+        result = await self._compose(artist_id, language, songs_limit)
+        if result["success"] and (self._epoch, self._generations.get(key[0], 0)) == generation:
+            ttl = settings.BUNDLE_PARTIAL_CACHE_TTL if result["data"]["errors"] else None
+            self._cache.set(key, result["data"], ttl)
+        return {**result, "cached": False}
+
+    async def _compose(self, artist_id: UUID, language: str, songs_limit: int) -> Dict[str, Any]:
+        """并发获取各部分数据并组装"""
+        artist_task = asyncio.create_task(asyncio.to_thread(artist_db_service.get_artist_by_id_sync, artist_id))
+
+        async def spotify_summary() -> Optional[Dict[str, Any]]:
+            artist_result = await asyncio.shield(artist_task)
+            if not artist_result.get("success"):
+                return None
+            artist = artist_result["data"]
+            if not artist.get("spotify_id"):
+                return None
+            try:
+                spotify_artist = await spotify_service.get_artist_info(artist["spotify_id"])
+                return _summarize_spotify(spotify_artist.model_dump())
+            except Exception as e:
+                # Spotify 不可用时使用数据库中保存的 spotify_data
+                if artist.get("spotify_data"):
+                    logger.warning(f"Spotify lookup failed for bundle {artist_id}, using stored data: {str(e)}")
+                    return _summarize_spotify(artist["spotify_data"])
+                raise
+
+        artist_result, performances, songs, ai_description, spotify = await asyncio.gather(
+            artist_task,
+            asyncio.to_thread(artist_db_service.get_artist_performances_sync, str(artist_id)),
+            asyncio.to_thread(song_db_service.get_songs_by_artist_sync, artist_id, songs_limit, 0),
+            asyncio.to_thread(ai_description_db_service.get_latest_ai_description_sync, artist_id, language),
+            spotify_summary(),
+            return_exceptions=True
+        )
+        if isinstance(artist_result, Exception):
+            raise artist_result
+        if not artist_result.get("success"):
+            return artist_result
+
+        errors = {}
+
+        def part(name: str, value: Any, missing_ok: str = None) -> Any:
+            if isinstance(value, Exception):
+                errors[name] = str(value)
+                return None
+            if isinstance(value, dict) and "success" in value:
+                if value["success"]:
+                    return value["data"]
+                if value.get("error") != missing_ok:
+                    errors[name] = value.get("error")
+                return None
+            return value
+
+        songs_data = part("songs", songs) or []
+        bundle = {
+            "artist": artist_result["data"],
+            "performances": part("performances", performances) or [],
+            "songs": songs_data,
+            "songs_with_preview": sum(1 for song in songs_data if song.get("preview_url")),
+            "ai_description": part("ai_description", ai_description, missing_ok="No AI description found"),
+            "spotify": part("spotify", spotify),
+            "errors": errors,
+            "composed_at": datetime.now(timezone.utc).isoformat()
+        }
+        self._stats["composed"] += 1
+        if errors:
+            self._stats["partial"] += 1
+            logger.warning(f"Artist bundle {artist_id} composed with errors: {errors}")
+        return {"success": True, "data": bundle}
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """获取聚合缓存统计信息"""
+        return {**self._stats, "cache": self._cache.stats(), "inflight": self._inflight.stats()}
+
+
+# 创建全局艺术家页面聚合服务实例
+artist_bundle_service = ArtistBundleService()
@@ -6,7 +6,7 @@ import logging
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone
-from services.database_service import db_service
+from services.database_service import db_service, escape_like
 from models.database import ArtistModel, CreateArtistRequest, UpdateArtistRequest
 
 logger = logging.getLogger(__name__)
@@ -280,6 +280,10 @@ class ArtistDatabaseService:
         Returns:
             艺术家详细信息
         """
+        return self.get_artist_by_id_sync(artist_id)
+    
+    def get_artist_by_id_sync(self, artist_id: UUID) -> Dict[str, Any]:
+        """get_artist_by_id 的同步版本（直接执行 supabase 查询，供线程池调用）"""
         if not self.db.is_connected():
             return {"success": False, "error": "Database not connected"}
         
@@ -355,6 +359,90 @@ class ArtistDatabaseService:
             logger.error(f"Error getting artist by Spotify ID: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    async def get_spotify_id_by_name(self, name: str) -> Dict[str, Any]:
+        """
+        根据艺术家名称查找已保存的 Spotify ID（先精确匹配，再忽略大小写匹配）
+        
+        Args:
+            name: 艺术家名称
+            
+        Returns:
+            {"success": True, "data": {"id", "name", "spotify_id"}}，没有已保存 ID 的同名艺术家时返回 "Artist not found"
+        """
+        if not self.db.is_connected():
+            return {"success": False, "error": "Database not connected"}
+        
+        try:
+            return self._select_by_name(name, "id, name, spotify_id", "spotify_id")
+        except Exception as e:
+            logger.error(f"Error getting Spotify ID by name: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def get_artist_wiki_by_name(self, name: str) -> Dict[str, Any]:
+        """
+        根据艺术家名称获取已保存的 Wikipedia 数据（先精确匹配，再忽略大小写匹配）
+        
+        Args:
+            name: 艺术家名称
+            
+        Returns:
+            {"success": True, "data": {"id", "name", "wiki_data", "wiki_extract", "wiki_last_updated"}}，
+            没有已保存 Wikipedia 数据的同名艺术家时返回 "Artist not found"
+        """
+        if not self.db.is_connected():
+            return {"success": False, "error": "Database not connected"}
+        
+        try:
+            return self._select_by_name(name, "id, name, wiki_data, wiki_extract, wiki_last_updated", "wiki_data")
+        except Exception as e:
+            logger.error(f"Error getting Wikipedia data by name: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    def _select_by_name(self, name: str, columns: str, required_column: str) -> Dict[str, Any]:
+        """按名称查找 required_column 不为空的艺术家，先精确匹配再忽略大小写匹配"""
+        for column_filter in ("eq", "ilike"):
+            query = self.db.supabase.table("artists").select(columns).not_.is_(required_column, "null")
+            if column_filter == "eq":
+                query = query.eq("name", name)
+            else:
+                query = query.ilike("name", escape_like(name))
+            result = query.limit(1).execute()
+            if result.data:
+                return {
+                    "success": True,
+                    "data": result.data[0]
+                }
+        return {"success": False, "error": "Artist not found"}
+    
+    async def set_spotify_id_by_name(self, name: str, spotify_id: str) -> Dict[str, Any]:
+        """
+        为尚未保存 Spotify ID 的同名艺术家写入 Spotify ID（名称完全一致才写入，不做模式匹配）
+        
+        Args:
+            name: 艺术家名称
+            spotify_id: Spotify艺术家ID
+            
+        Returns:
+            更新结果，count 为更新的艺术家数量
+        """
+        if not self.db.is_connected():
+            return {"success": False, "error": "Database not connected"}
+        
+        try:
+            result = self.db.supabase.table("artists").update({
+                "spotify_id": spotify_id,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }).eq("name", name).is_("spotify_id", "null").execute()
+            
+            count = len(result.data or [])
+            if count:
+                logger.info(f"Saved Spotify ID {spotify_id} for artist '{name}'")
+            return {"success": True, "count": count}
+                
+        except Exception as e:
+            logger.error(f"Error saving Spotify ID by name: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
     async def get_artist_performances(self, artist_id: str) -> Dict[str, Any]:
         """
         根据艺术家ID获取其所有演出信息
@@ -365,6 +453,10 @@ class ArtistDatabaseService:
         Returns:
             演出信息列表
         """
+        return self.get_artist_performances_sync(artist_id)
+    
+    def get_artist_performances_sync(self, artist_id: str) -> Dict[str, Any]:
+        """get_artist_performances 的同步版本（直接执行 supabase 查询，供线程池调用）"""
         if not self.db.is_connected():
             return {"success": False, "error": "Database not connected"}
         
@@ -1,7 +1,8 @@
 """
 认证服务 - 处理Supabase JWT Token验证
+
+PyJWT（及其依赖的 cryptography）在第一次验证 Token 时才导入，不影响应用启动时间。
 """
-import jwt
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
@@ -39,6 +40,8 @@ class AuthService:
             logger.error("JWT Secret not configured")
             return None
         
+        import jwt
+        
         try:
             # 使用PyJWT解码并验证Token
             # 这里验证Token的签名、过期时间等
@@ -0,0 +1,204 @@
+"""
+缓存工具 - 提供带容量上限的内存 TTL 缓存
+
+特性：
+- LRU 淘汰：超过 max_size 时淘汰最久未使用的条目
+- 按条目设置 TTL：同一个缓存可以存放不同类型、不同有效期的数据
+- 负缓存：加载失败（如 404）时在较短时间内直接重放该错误，避免重复请求上游
+- 过期后短时间内继续返回旧数据，同时在后台刷新（stale-while-revalidate）
+- 临近过期的条目被访问时提前在后台刷新（refresh-ahead）
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class _CacheEntry:
+    """缓存条目"""
+    __slots__ = ("value", "expires_at", "stale_until", "negative")
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float, negative: bool = False):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.negative = negative
+
+
+class TTLCache:
+    """带容量上限、负缓存和后台刷新的 TTL 缓存"""
+
+    def __init__(self, name: str, max_size: int = 1024, ttl: float = 300.0,
+                 negative_ttl: float = 60.0, stale_ttl: float = 0.0, refresh_ahead: float = 0.0):
+        """
+        Args:
+            name: 缓存名称（用于日志和统计）
+            max_size: 最大条目数，超过后按 LRU 淘汰
+            ttl: 默认有效期（秒）
+            negative_ttl: 负缓存条目的有效期（秒）
+            stale_ttl: 过期后仍可返回旧数据并触发后台刷新的时间窗口（秒）
+            refresh_ahead: 距离过期不足该秒数时，命中会触发后台刷新
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_ahead = refresh_ahead
+        self._data: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "stale_hits": 0,
+            "negative_hits": 0,
+            "evictions": 0,
+            "refreshes": 0,
+        }
+        _caches[name] = self
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and time.monotonic() < entry.expires_at
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """获取未过期的正向缓存值，不触发加载"""
+        entry = self._data.get(key)
+        if entry is None or entry.negative or time.monotonic() >= entry.expires_at:
+            return default
+        self._data.move_to_end(key)
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """写入缓存条目"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        self._store(key, _CacheEntry(value, now + ttl, now + ttl + self.stale_ttl))
+
+    def set_negative(self, key: Hashable, error: Exception, ttl: Optional[float] = None) -> None:
+        """写入负缓存条目，命中时重新抛出该错误"""
+        ttl = self.negative_ttl if ttl is None else ttl
+        now = time.monotonic()
+        self._store(key, _CacheEntry(error, now + ttl, now + ttl, negative=True))
+
+    def delete(self, key: Hashable) -> None:
+        """删除缓存条目"""
+        self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """删除键满足 predicate 的所有条目，返回删除数量"""
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
+
+    def _store(self, key: Hashable, entry: _CacheEntry) -> None:
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    async def get_or_load(self, key: Hashable, loader: Loader, ttl: Optional[float] = None,
+                          negative_if: Optional[Callable[[Exception], bool]] = None) -> Any:
+        """
+        读取缓存，未命中时调用 loader 加载并写入缓存
+
+        Args:
+            key: 缓存键
+            loader: 无参数的异步加载函数
+            ttl: 本条目的有效期，默认使用缓存的 ttl
+            negative_if: 判断加载异常是否需要负缓存的函数（如 404）
+
+        Returns:
+            缓存值或新加载的值
+
+        Raises:
+            loader 抛出的异常，或负缓存命中时记录的异常
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.expires_at:
+                self._data.move_to_end(key)
+                if entry.negative:
+                    self._stats["negative_hits"] += 1
+                    raise entry.value.with_traceback(None)
+                self._stats["hits"] += 1
+                if self.refresh_ahead and entry.expires_at - now < self.refresh_ahead:
+                    self._schedule_refresh(key, loader, ttl, negative_if)
+                return entry.value
+            if now < entry.stale_until:
+                # 旧数据仍在可用窗口内：立即返回，并在后台刷新
+                self._data.move_to_end(key)
+                self._stats["stale_hits"] += 1
+                self._schedule_refresh(key, loader, ttl, negative_if)
+                return entry.value
+            del self._data[key]
+
+        self._stats["misses"] += 1
+        return await self._load(key, loader, ttl, negative_if)
+
+    async def _load(self, key: Hashable, loader: Loader, ttl: Optional[float],
+                    negative_if: Optional[Callable[[Exception], bool]]) -> Any:
+        try:
+            value = await loader()
+        except Exception as e:
+            if negative_if is not None and negative_if(e):
+                self.set_negative(key, e)
+            raise
+        self.set(key, value, ttl)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, loader: Loader, ttl: Optional[float],
+                          negative_if: Optional[Callable[[Exception], bool]]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self._stats["refreshes"] += 1
+
+        async def refresh():
+            try:
+                await self._load(key, loader, ttl, negative_if)
+            except Exception as e:
+                # 刷新失败时保留旧数据，等待下一次访问再重试
+                logger.warning(f"Background refresh failed for {self.name} cache key {key!r}: {str(e)}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> Dict[str, Any]:
+        """获取缓存统计信息"""
+        lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["negative_hits"] + self._stats["misses"]
+        hit_count = lookups - self._stats["misses"]
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "max_size": self.max_size,
+            **self._stats,
+            "hit_ratio": round(hit_count / lookups, 4) if lookups else 0.0,
+        }
+
+
+_caches: Dict[str, TTLCache] = {}
+
+
+def get_all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """获取所有已创建缓存的统计（按名称，同名缓存以最后创建的为准）"""
+    return {name: cache.stats() for name, cache in _caches.items()}
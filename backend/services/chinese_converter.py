@@ -0,0 +1,291 @@
+"""
+繁体 → 简体中文转换
+
+- 单字转换：预编译的完整字符对照表，通过 str.translate 一次完成
+- 词语转换：最长匹配的词语前缀树，处理一对多和需要保留原字的词（如 乾隆、瞭望、隨著）
+
+转换时间与文本长度成线性关系，可用于 Wikipedia 摘要和描述脚本的批量处理。
+"""
+from typing import Dict, Iterable, List, Optional
+
+# 单字对照表：每项为「繁简」两个字符，以空白分隔
+# 只收录一对一或以某一简体字为主的字；一简多繁以外有歧义的字（著、藉、覆 等）交给词语表处理
+_CHAR_PAIRS = """
+萬万 與与 醜丑 專专 業业 叢丛 東东 絲丝 丟丢 兩两 嚴严 喪丧 個个 豐丰 臨临 為为 麗丽 舉举
+麼么 義义 烏乌 樂乐 喬乔 習习 鄉乡 書书 買买 亂乱 爭争 於于 虧亏 雲云 亙亘 亞亚 產产 畝亩
+親亲 褻亵 億亿 僅仅 從从 侖仑 倉仓 儀仪 們们 價价 眾众 衆众 優优 夥伙 會会 傴伛 傘伞 偉伟
+傳传 傷伤 倀伥 倫伦 傖伧 偽伪 佇伫 體体 餘余 傭佣 僉佥 俠侠 侶侣 僥侥 偵侦 側侧 僑侨 儈侩
+儕侪 儂侬 俁俣 儔俦 儼俨 倆俩 儷俪 儉俭 債债 傾倾 僂偻 僨偾 償偿 儐傧 儲储 儺傩 儻傥 兒儿
+兌兑 兗兖 黨党 蘭兰 關关 興兴 茲兹 養养 獸兽 囅冁 內内 岡冈 冊册 寫写 軍军 農农 塚冢 馮冯
+沖冲 衝冲 決决 況况 凍冻 淨净 凈净 淒凄 涼凉 淩凌 減减 湊凑 凜凛 幾几 鳳凤 鳧凫 憑凭 凱凯
+擊击 鑿凿 芻刍 劃划 劉刘 則则 剛刚 創创 刪删 別别 剗刬 剄刭 劊刽 劌刿 剴剀 劑剂 剮剐 劍剑
+剝剥 劇剧 勸劝 辦办 務务 勱劢 動动 勵励 勁劲 勞劳 勢势 勳勋 勛勋 勻匀 匭匦 匱匮 區区 醫医
+華华 協协 單单 賣卖 盧卢 鹵卤 臥卧 衛卫 卻却 巹卺 廠厂 廳厅 曆历 歷历 厲厉 壓压 厭厌 厙厍
+廁厕 廂厢 厴厣 廈厦 廚厨 廄厩 廝厮 縣县 參参 叄叁 雙双 發发 變变 敘叙 疊叠 葉叶 號号 嘆叹
+歎叹 嘰叽 籲吁 後后 嚇吓 呂吕 嗎吗 噸吨 聽听 啟启 啓启 吳吴 嘸呒 囈呓 嘔呕 嚦呖 唄呗 員员
+咼呙 嗆呛 嗚呜 詠咏 嚨咙 嚀咛 噝咝 響响 啞哑 噠哒 嘵哓 嗶哔 噦哕 嘩哗 譁哗 噲哙 嚌哜 噥哝
+喲哟 嘜唛 嘮唠 嗩唢 喚唤 嘖啧 嗇啬 囀啭 嚙啮 齧啮 嘯啸 噴喷 嘍喽 嚳喾 囁嗫 噯嗳 嚶嘤 囑嘱
+噁恶 嚕噜 囉啰 嘽啴 嗊唝 團团 糰团 園园 囪囱 圍围 圇囵 國国 圖图 圓圆 聖圣 壙圹 場场 壞坏
+塊块 堅坚 壇坛 罈坛 壢坜 壩坝 塢坞 墳坟 墜坠 壟垄 壚垆 壘垒 墾垦 堊垩 埡垭 塏垲 塒埘 塤埙
+壎埙 堖垴 塗涂 塋茔 墊垫 塹堑 墮堕 聲声 壺壶 壽寿 處处 備备 復复 複复 夠够 頭头 誇夸 夾夹
+奪夺 奩奁 奐奂 奮奋 獎奖 奧奥 妝妆 粧妆 婦妇 媽妈 嫵妩 嫗妪 媯妫 姍姗 婁娄 婭娅 嬈娆 嬌娇
+孌娈 娛娱 媧娲 嫻娴 嬰婴 嬋婵 嬸婶 媼媪 嬡嫒 嬪嫔 嬙嫱 妳你 姦奸 孫孙 學学 孿孪 寧宁 甯宁
+寶宝 實实 寵宠 審审 憲宪 宮宫 寬宽 賓宾 寢寝 對对 尋寻 導导 將将 爾尔 塵尘 嘗尝 嚐尝 堯尧
+尷尴 屍尸 盡尽 層层 屜屉 屆届 屬属 屢屡 屨屦 嶼屿 歲岁 豈岂 嶇岖 崗岗 峴岘 嶴岙 嵐岚 島岛
+嶺岭 嶽岳 崬岽 巋岿 嶧峄 峽峡 嶠峤 崢峥 巒峦 嶗崂 崍崃 嶮崄 嶄崭 嶸嵘 嶁嵝 巔巅 巖岩 崑昆
+崙仑 峯峰 鞏巩 幣币 帥帅 師师 幃帏 帳帐 簾帘 幟帜 帶带 幀帧 幫帮 幬帱 幘帻 幗帼 冪幂 乾干
+幹干 並并 併并 廣广 莊庄 慶庆 廬庐 廡庑 庫库 應应 廟庙 龐庞 廢废 廩廪 開开 異异 棄弃 張张
+彌弥 瀰弥 弳弪 彎弯 彈弹 強强 歸归 當当 錄录 彙汇 彥彦 徹彻 徑径 徠徕 禦御 憶忆 懺忏 憂忧
+愾忾 懷怀 態态 慫怂 憮怃 慪怄 悵怅 愴怆 憐怜 總总 懟怼 懌怿 戀恋 懇恳 惡恶 慟恸 懨恹 愷恺
+惻恻 惱恼 惲恽 悅悦 愨悫 懸悬 慳悭 憫悯 驚惊 懼惧 慘惨 懲惩 憊惫 愜惬 慚惭 憚惮 慣惯 慍愠
+憤愤 憒愦 願愿 懾慑 懣懑 懶懒 懍懔 戇戆 恆恒 恥耻 慮虑 戔戋 戲戏 戧戗 戰战 戩戬 戶户 執执
+擴扩 捫扪 掃扫 揚扬 擾扰 撫抚 摶抟 摳抠 掄抡 搶抢 護护 報报 擔担 擬拟 攏拢 揀拣 擁拥 攔拦
+擰拧 撥拨 擇择 掛挂 摯挚 攣挛 掗挜 撾挝 撻挞 挾挟 撓挠 擋挡 撟挢 掙挣 擠挤 揮挥 撏挦 撈捞
+損损 撿捡 換换 搗捣 據据 擄掳 摑掴 擲掷 撣掸 摻掺 摜掼 攬揽 撳揿 攙搀 擱搁 摟搂 攪搅 攜携
+攝摄 攄摅 擺摆 襬摆 搖摇 擯摈 攤摊 攖撄 撐撑 攆撵 擷撷 擼撸 攛撺 擻擞 攢攒 拋抛 捨舍 捲卷
+採采 擡抬 摺折 敵敌 斂敛 數数 齋斋 斕斓 鬥斗 斬斩 斷断 無无 舊旧 時时 曠旷 暘旸 曇昙 晝昼
+曨昽 顯显 晉晋 曬晒 曉晓 曄晔 暈晕 暉晖 暫暂 曖暧 術术 樸朴 機机 殺杀 雜杂 權权 條条 來来
+楊杨 榪杩 傑杰 極极 構构 樅枞 樞枢 棗枣 櫪枥 梘枧 棖枨 槍枪 楓枫 梟枭 櫃柜 檸柠 檉柽 梔栀
+柵栅 標标 棧栈 櫛栉 櫳栊 棟栋 櫨栌 櫟栎 欄栏 樹树 棲栖 樣样 欒栾 椏桠 橈桡 楨桢 檔档 榿桤
+橋桥 樺桦 檜桧 槳桨 樁桩 夢梦 檢检 欞棂 槨椁 櫝椟 槧椠 槤梿 櫚榈 檯台 檳槟 櫧槠 橫横 檣樯
+櫻樱 櫫橥 櫥橱 櫓橹 櫞橼 檁檩 欏椤 欖榄 櫬榇 櫸榉 桿杆 稜棱 簷檐 歡欢 歐欧 歟欤 殲歼 歿殁
+殤殇 殘残 殞殒 殮殓 殫殚 殯殡 毆殴 毀毁 轂毂 畢毕 斃毙 氈毡 氌氇 氣气 氫氢 氬氩 氳氲 匯汇
+滙汇 漢汉 湯汤 溝沟 沒没 灃沣 漚沤 瀝沥 淪沦 滄沧 溈沩 滬沪 濘泞 註注 淚泪 澩泶 瀧泷 瀘泸
+濼泺 瀉泻 潑泼 澤泽 涇泾 潔洁 灑洒 窪洼 浹浃 淺浅 漿浆 澆浇 湞浈 濁浊 測测 澮浍 濟济 瀏浏
+滻浐 渾浑 滸浒 濃浓 潯浔 濤涛 澇涝 淶涞 漣涟 澗涧 渦涡 渙涣 滌涤 潤润 漲涨 澀涩 淵渊 淥渌
+漬渍 瀆渎 漸渐 澠渑 漁渔 瀋沈 滲渗 溫温 灣湾 濕湿 潰溃 濺溅 漵溆 滎荥 滯滞 灄滠 滿满 瀅滢
+濾滤 濫滥 灤滦 濱滨 灘滩 澦滪 灧滟 瀟潇 瀾澜 瀲潋 潛潜 瀕濒 瀦潴 瀨濑 灝灏 瀠潆 潁颍 氾泛
+汙污 滷卤 灕漓 湧涌 燈灯 靈灵 災灾 燦灿 煬炀 爐炉 燉炖 煒炜 熗炝 點点 煉炼 熾炽 爍烁 爛烂
+烴烃 燭烛 煙烟 菸烟 煩烦 燒烧 燁烨 燴烩 燙烫 燼烬 熱热 煥焕 燜焖 燾焘 營营 熒荧 榮荣 犖荦
+愛爱 爺爷 牘牍 牽牵 犧牺 犢犊 狀状 獷犷 獁犸 猶犹 狽狈 獮狝 獰狞 獨独 狹狭 獅狮 獪狯 猙狰
+獄狱 猻狲 獫猃 獵猎 獼猕 玀猡 豬猪 貓猫 蝟猬 獻献 獺獭 獃呆 璣玑 瑪玛 瑋玮 環环 現现 璽玺
+瓏珑 琺珐 琿珲 瑣琐 瑤瑶 瑩莹 瓊琼 璉琏 瓔璎 瓚瓒 璦瑷 甌瓯 甕瓮 電电 畫画 暢畅 疇畴 療疗
+瘧疟 癘疠 瘍疡 癤疖 瘡疮 瘋疯 皰疱 癰痈 痙痉 癢痒 瘂痖 癆痨 瘓痪 癇痫 癉瘅 瘞瘗 瘺瘘 癱瘫
+癮瘾 癭瘿 癩癞 癬癣 癲癫 癥症 癧疬 癟瘪 癒愈 痠酸 皚皑 皺皱 盜盗 盞盏 鹽盐 監监 盤盘 盪荡
+蕩荡 眥眦 睜睁 睞睐 瞼睑 瞞瞒 矚瞩 睏困 矇蒙 矓眬 瞭了 矯矫 硃朱 礬矾 礦矿 碭砀 碼码 磚砖
+硨砗 硯砚 碸砜 礪砺 礱砻 礫砾 礎础 硤硖 磽硗 確确 礙碍 磧碛 磣碜 鹼碱 磯矶 禮礼 禱祷 禍祸
+禎祯 禰祢 禪禅 離离 禿秃 秈籼 種种 積积 稱称 穢秽 穠秾 穩稳 穫获 穀谷 穌稣 稅税 稈秆 稟禀
+穡穑 穎颖 窩窝 窮穷 竊窃 竅窍 窯窑 竄窜 窺窥 竇窦 窶窭 豎竖 競竞 筆笔 筍笋 箋笺 筧笕 籌筹
+簽签 籤签 簡简 箏筝 篤笃 篩筛 節节 範范 築筑 篋箧 篳筚 簍篓 籃篮 籬篱 籮箩 簞箪 簣篑 簫箫
+籜箨 籟籁 籙箓 籩笾 籪簖 籠笼 糴籴 類类 糶粜 糲粝 粵粤 糞粪 糧粮 糝糁 緊紧 縶絷 糾纠 紆纡
+紅红 紂纣 纖纤 縴纤 紇纥 約约 級级 紈纨 纊纩 紀纪 紉纫 緯纬 紜纭 純纯 紕纰 紗纱 綱纲 納纳
+縱纵 綸纶 紛纷 紙纸 紋纹 紡纺 紐纽 紓纾 線线 綫线 紺绀 紲绁 紱绂 練练 組组 紳绅 細细 織织
+終终 縐绉 絆绊 紼绋 絀绌 紹绍 繹绎 經经 紿绐 綁绑 絨绒 結结 絝绔 繞绕 絎绗 繪绘 給给 絢绚
+絳绛 絡络 絕绝 絞绞 統统 綆绠 綃绡 絹绢 繡绣 綌绤 綏绥 繼继 綈绨 績绩 緒绪 綾绫 續续 綺绮
+緋绯 綽绰 緄绲 繩绳 維维 綿绵 綬绶 繃绷 綢绸 綹绺 綣绻 綜综 綻绽 綰绾 綠绿 綴缀 緇缁 緙缂
+緗缃 緘缄 緬缅 纜缆 緹缇 緲缈 緝缉 繢缋 緦缌 緞缎 締缔 緡缗 緣缘 縫缝 縛缚 縟缛 縝缜 縉缙
+縊缢 縑缣 縞缟 纏缠 縭缡 縮缩 繆缪 縷缕 縹缥 繅缫 繚缭 繒缯 繕缮 繳缴 繽缤 辮辫 紮扎 繫系
+纓缨 纘缵 纔才 纍累 緻致 縧绦 繾缱 纈缬 編编 緩缓 網网 綵彩 縈萦 繭茧 綑捆 罌罂 罰罚 罵骂
+罷罢 羅罗 羆罴 羈羁 羋芈 羥羟 羨羡 翹翘 耬耧 聳耸 聶聂 聾聋 職职 聹聍 聯联 聵聩 聰聪 肅肃
+腸肠 膚肤 骯肮 餚肴 腎肾 腫肿 脹胀 脅胁 膽胆 勝胜 朧胧 臚胪 脛胫 膠胶 脈脉 膾脍 臍脐 腦脑
+膿脓 臠脔 腳脚 脫脱 腡脶 臉脸 臘腊 醃腌 膕腘 齶腭 膩腻 腖胨 膃腽 臏膑 臟脏 髒脏 臺台 艙舱
+艤舣 艦舰 艫舻 艱艰 艷艳 豔艳 藝艺 薌芗 蕪芜 蘆芦 蓯苁 葦苇 藶苈 莧苋 萇苌 蒼苍 苧苎 蘋苹
+莖茎 蘢茏 蔦茑 煢茕 薦荐 蕘荛 蓽荜 蕎荞 薈荟 薺荠 蓋盖 葷荤 蔭荫 蕁荨 藥药 蒞莅 蓮莲 蒔莳
+萵莴 獲获 鶯莺 蒓莼 蓴莼 蘿萝 螢萤 蕭萧 薩萨 蔥葱 蒐搜 蔞蒌 蔣蒋 薊蓟 蘊蕴 藹蔼 藺蔺 蘚藓
+蘄蕲 蘞蔹 藎荩 蕆蒇 蕓芸 蕢蒉 薟莶 藪薮 蘇苏 囌苏 甦苏 蔔卜 薑姜 蔴麻 虜虏 虛虚 蟲虫 虯虬
+蝦虾 雖虽 螞蚂 蟻蚁 蠶蚕 蠆虿 蟣虮 蠔蚝 蝕蚀 蜆蚬 蠱蛊 蠣蛎 蟶蛏 蠑蝾 蛺蛱 蟯蛲 螄蛳 蠐蛴
+蛻蜕 蝸蜗 蠟蜡 蠅蝇 蟈蝈 蟬蝉 蠍蝎 螻蝼 蟎螨 蟄蛰 蠻蛮 衊蔑 衚胡 補补 襯衬 袞衮 襖袄 裊袅
+褳裢 褸褛 裝装 襠裆 褲裤 襝裣 襤褴 襪袜 襲袭 製制 裡里 裏里 見见 觀观 規规 覓觅 視视 覘觇
+覽览 覺觉 覬觊 覡觋 覲觐 覷觑 覦觎 觴觞 觶觯 觸触 計计 訂订 訃讣 認认 譏讥 討讨 讓让 訕讪
+訖讫 訓训 議议 訊讯 記记 講讲 諱讳 謳讴 詎讵 訝讶 訥讷 許许 訛讹 論论 訟讼 諷讽 設设 訪访
+訣诀 證证 詁诂 訶诃 評评 詛诅 識识 詐诈 訴诉 診诊 詆诋 謅诌 詞词 詘诎 詔诏 譯译 詒诒 誆诓
+誄诔 試试 詿诖 詩诗 詰诘 詼诙 誠诚 誅诛 話话 誕诞 詬诟 詮诠 詭诡 詢询 詣诣 諍诤 該该 詳详
+詫诧 諢诨 詡诩 誡诫 誣诬 語语 誚诮 誤误 誥诰 誘诱 誨诲 誑诳 說说 誦诵 誒诶 請请 諸诸 諏诹
+諾诺 讀读 諑诼 誹诽 課课 諉诿 諛谀 誰谁 諗谂 調调 諂谄 諒谅 諄谆 誶谇 談谈 誼谊 謀谋 諶谌
+諜谍 謊谎 諫谏 諧谐 謔谑 謁谒 謂谓 諤谔 諭谕 諼谖 讒谗 諮谘 諳谙 諺谚 諦谛 謎谜 諞谝 謨谟
+讜谠 謝谢 謠谣 謗谤 謙谦 謐谧 謹谨 謾谩 謫谪 譾谫 謬谬 譚谭 譖谮 譙谯 讕谰 譜谱 譎谲 讞谳
+譴谴 譫谵 讖谶 譽誉 謄誊 讚赞 讎雠 託托 貝贝 貞贞 負负 貢贡 財财 責责 賢贤 敗败 賬账 貨货
+質质 販贩 貪贪 貧贫 貶贬 購购 貯贮 貫贯 貳贰 賁贲 貸贷 貿贸 費费 賀贺 貽贻 賊贼 贄贽 賈贾
+賄贿 貲赀 資资 賅赅 贓赃 賃赁 賂赂 賜赐 賦赋 賠赔 賤贱 賞赏 賡赓 賴赖 賺赚 賽赛 賻赙 賸剩
+贅赘 贈赠 贊赞 贍赡 贏赢 贐赆 贖赎 贗赝 贛赣 賭赌 賑赈 賒赊 賚赉 賙赒 貺贶 貰贳 貴贵 貼贴
+趕赶 趙赵 趨趋 躉趸 跡迹 蹟迹 踐践 蹌跄 躂跶 蹕跸 蹣蹒 蹤踪 蹺跷 躊踌 躋跻 躍跃 躑踯 躒跞
+躓踬 躚跹 躥蹿 躦躜 躪躏 踴踊 軀躯 車车 軋轧 軌轨 軒轩 軔轫 軟软 軛轭 軫轸 軸轴 軻轲 軼轶
+軲轱 軺轺 軹轵 輕轻 載载 輊轾 輒辄 輔辅 輛辆 輦辇 輩辈 輪轮 輟辍 輜辎 輝辉 輥辊 輞辋 輳辏
+輸输 輻辐 輯辑 輾辗 輿舆 轄辖 轅辕 轆辘 轉转 轍辙 轎轿 轟轰 轡辔 轢轹 轤轳 較较 辭辞 辯辩
+邊边 遼辽 達达 遷迁 過过 邁迈 運运 還还 這这 進进 遠远 違违 連连 遲迟 邇迩 逕迳 適适 選选
+遜逊 遞递 邐逦 邏逻 遺遗 遙遥 鄧邓 鄺邝 鄔邬 郵邮 鄒邹 鄴邺 鄰邻 鬱郁 郟郏 鄶郐 鄭郑 鄆郓
+酈郦 鄖郧 鄲郸 醞酝 醱酦 醬酱 釅酽 釃酾 釀酿 釋释 釐厘 鑒鉴 鑑鉴 釓钆 釔钇 針针 釘钉 釗钊
+釙钋 釕钌 釷钍 釺钎 釧钏 釤钐 釩钒 釣钓 鍆钔 釹钕 鈣钙 鈦钛 鈍钝 鈔钞 鈉钠 鈞钧 鈕钮 鈀钯
+鈈钚 鈄钭 鈥钬 鈧钪 鈐钤 鈁钫 鈺钰 鉦钲 鈷钴 鈸钹 鈽钸 鈾铀 鉀钾 鈿钿 鉗钳 鈹铍 鈰铈 鉛铅
+鈴铃 鉍铋 鉑铂 鉚铆 鉞钺 鉉铉 鉈铊 鉬钼 銬铐 銀银 銅铜 銘铭 銖铢 銑铣 銓铨 銜衔 銃铳 鋁铝
+銨铵 銻锑 銹锈 鏽锈 鋅锌 鋇钡 鋒锋 鋤锄 鋪铺 銷销 鋰锂 鋼钢 錐锥 錘锤 鎚锤 錢钱 錦锦 錫锡
+錯错 鍋锅 鍵键 鍍镀 鏈链 鍾钟 鐘钟 鏡镜 鏟铲 鏢镖 鐮镰 鐵铁 鑄铸 鑰钥 鑽钻 鑼锣 鑲镶 鎖锁
+鎮镇 鎢钨 鎳镍 鎊镑 鎂镁 錨锚 鍛锻 鍬锹 鋸锯 錠锭 錚铮 錙锱 鐳镭 鐺铛 鐸铎 鑠铄 鈎钩 鉤钩
+鋌铤 銳锐 鋏铗 鋃锒 鋯锆 鍺锗 鎰镒 鏗铿 鏘锵 鐲镯 鐐镣 鑷镊 鑾銮 鉻铬 鉸铰 鏵铧 鍔锷 鎗枪
+鏜镗 鏑镝 鏃镞 鐫镌 鑊镬 鑌镔 錳锰 鍁锨 鍘铡 銥铱 鉅巨 鎬镐 鉢钵 缽钵 長长 門门 閂闩 閃闪
+閆闫 閉闭 問问 闖闯 閏闰 閑闲 閒闲 間间 閔闵 閘闸 閡阂 閣阁 閥阀 閨闺 閩闽 聞闻 閭闾 閱阅
+閹阉 閶阊 閻阎 閼阏 閽阍 閾阈 闊阔 闌阑 闋阕 闈闱 闆板 闍阇 闐阗 闔阖 闕阙 闓闿 闡阐 闢辟
+闥闼 鬧闹 閿阌 闃阒 隊队 陽阳 陰阴 陣阵 階阶 際际 陸陆 隴陇 陳陈 陘陉 陝陕 隉陧 隕陨 險险
+隨随 隱隐 隸隶 雋隽 難难 雛雏 雞鸡 霧雾 霽霁 靂雳 靄霭 黴霉 靚靓 靜静 靦腼 韁缰 韃鞑 韆千
+鞦秋 韋韦 韌韧 韓韩 韙韪 韜韬 韞韫 韻韵 頁页 頂顶 頃顷 項项 順顺 須须 鬚须 頊顼 頑顽 顧顾
+頓顿 頎颀 頒颁 頌颂 頏颃 預预 領领 頗颇 頦颏 頡颉 頜颌 頲颋 頰颊 頸颈 頻频 頷颔 題题 額额
+顎颚 顏颜 顓颛 顛颠 顙颡 顢颟 顫颤 顰颦 顱颅 顴颧 頹颓 頤颐 顆颗 碩硕 囂嚣 風风 颳刮 颯飒
+颶飓 颱台 颺飏 颼飕 飆飙 飄飘 飛飞 飢饥 饑饥 飩饨 飪饪 飫饫 飭饬 飯饭 飲饮 飼饲 飽饱 飾饰
+餃饺 餅饼 餌饵 餉饷 餓饿 餒馁 餞饯 館馆 餡馅 餛馄 餵喂 餿馊 饅馒 饃馍 饈馐 饉馑 饋馈 饌馔
+饒饶 饗飨 饞馋 饜餍 餾馏 餼饩 餑饽 餳饧 飴饴 馬马 馭驭 馱驮 馳驰 馴驯 駁驳 駐驻 駝驼 駒驹
+駕驾 駑驽 駛驶 駟驷 駘骀 駭骇 駢骈 駱骆 駿骏 騁骋 驗验 騎骑 騙骗 騫骞 騰腾 騷骚 騶驺 驅驱
+驃骠 驀蓦 驕骄 驊骅 驍骁 驛驿 驟骤 驢驴 驥骥 驤骧 驪骊 騾骡 髏髅 髖髋 髕髌 鬆松 鬍胡 鬢鬓
+鬨哄 鬩阋 魎魉 魘魇 魚鱼 魯鲁 魷鱿 鮑鲍 鮒鲋 鮪鲔 鮫鲛 鮮鲜 鯉鲤 鯊鲨 鯨鲸 鯽鲫 鯧鲳 鰍鳅
+鰓鳃 鰭鳍 鰱鲢 鰻鳗 鱈鳕 鱉鳖 鱔鳝 鱗鳞 鱷鳄 鰐鳄 鱸鲈 鮭鲑 鯖鲭 鯛鲷 鰹鲣 鯡鲱 鰲鳌 鯪鲮
+鮐鲐 鯰鲶 鱒鳟 鰥鳏 鱘鲟 鯤鲲 鯇鲩 鯢鲵 鳥鸟 鳩鸠 鳴鸣 鳶鸢 鴆鸩 鴇鸨 鴉鸦 鴕鸵 鴛鸳 鴦鸯
+鴨鸭 鴣鸪 鴝鸲 鴞鸮 鴟鸱 鴻鸿 鴿鸽 鵑鹃 鵝鹅 鵠鹄 鵡鹉 鵪鹌 鵬鹏 鵲鹊 鶉鹑 鶴鹤 鷗鸥 鷂鹞
+鷓鹧 鷲鹫 鷹鹰 鷺鹭 鸚鹦 鸛鹳 鸞鸾 鶩鹜 鶻鹘 鷸鹬 鷯鹩 鶿鹚 鸕鸬 鸝鹂 鵰雕 鷥鸶 鹹咸 麥麦
+麩麸 麵面 麪面 黃黄 黽黾 鼉鼍 黲黪 黷黩 黶黡 鼴鼹 齊齐 齏齑 齒齿 齔龀 齙龅 齜龇 齟龃 齡龄
+齣出 齦龈 齪龊 齬龉 齲龋 齷龌 龍龙 龔龚 龕龛 龜龟 鬮阄 佈布 傢家 嚮向 儘尽 佔占 兇凶 隻只
+係系 髮发 迴回 週周 誌志 剋克 遊游 昇升 陞升 蹧糟 僱雇 牠它 唸念 喫吃 貍狸 徵征 慾欲
+侷局 倖幸 傯偬 僕仆 冑胄 剎刹 剷铲 卹恤 吶呐 噓嘘 嚥咽 堝埚 壯壮 嬤嬷 孃娘 弒弑 弔吊 彆别
+彫雕 彿佛 悶闷 悽凄 慄栗 慼戚 捱挨 撲扑 朮术 枴拐 榦干 槓杠 樑梁 樓楼 橢椭 檻槛 欽钦 殼壳
+汎泛 洩泄 洶汹 準准 溼湿 滅灭 滾滚 澱淀 濛蒙 濰潍 燬毁 燻熏 牆墙 犛牦 璿璇 癡痴 盃杯 祕秘
+祿禄 箇个 簑蓑 絃弦 絛绦 綞缍 縲缧 縵缦 羶膻 脣唇 脩修 荊荆 莢荚 菴庵 萊莱 蓀荪 蓆席 薔蔷
+藍蓝 蝨虱 訌讧 訐讦 証证 譟噪 躡蹑 軾轼 輓挽 轔辚 醣糖 釁衅 釦扣 釵钗 鈑钣 銼锉 錕锟 錮锢
+錶表 鍥锲 鍰锾 鎘镉 鏍镙 鏝镘 鏤镂 鏨錾 鐃铙 鑣镳 閎闳 霑沾 靨靥 韉鞯 顥颢 駙驸 騖骛 鯀鲧
+鰾鳔 鱖鳜 鱟鲎 黌黉 鼕冬
+"""
+
+# 词语对照表：优先于单字转换，按最长匹配替换
+_PHRASES: Dict[str, str] = {
+    # 保留原字的词
+    "乾隆": "乾隆",
+    "乾坤": "乾坤",
+    "乾卦": "乾卦",
+    "瞭望": "瞭望",
+    "徵羽": "徵羽",
+    # 「著」作助词时简化为「着」，其余保留
+    "隨著": "随着",
+    "接著": "接着",
+    "跟著": "跟着",
+    "有著": "有着",
+    "沿著": "沿着",
+    "朝著": "朝着",
+    "向著": "向着",
+    "帶著": "带着",
+    "過著": "过着",
+    "穿著": "穿着",
+    "看著": "看着",
+    "意味著": "意味着",
+    "代表著": "代表着",
+    "伴隨著": "伴随着",
+    "緊接著": "紧接着",
+    "本著": "本着",
+    "為著": "为着",
+    # 「藉」作「借」的词
+    "藉由": "借由",
+    "藉此": "借此",
+    "憑藉": "凭借",
+    "藉口": "借口",
+    # 「覆」作「复」的词
+    "答覆": "答复",
+    "回覆": "回复",
+    "反覆": "反复",
+    "覆核": "复核",
+    # 一简对多繁时的固定搭配
+    "甚麼": "什么",
+    "項鍊": "项链",
+    "鍊金": "炼金",
+    # 「X著名」「X著作」中的「著」不是助词
+    "有著名": "有著名",
+    "跟著名": "跟著名",
+    "向著名": "向著名",
+    "帶著名": "带著名",
+    "本著作": "本著作",
+}
+
+_END = ""
+
+
+class ChineseConverter:
+    """基于字符对照表和词语前缀树的文本转换器"""
+
+    def __init__(self, char_map: Dict[str, str], phrases: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            char_map: 单字对照表
+            phrases: 词语对照表（值为已转换的结果，不再做单字转换）
+        """
+        self._table = str.maketrans(char_map)
+        self._trie: Dict[str, dict] = {}
+        for source, target in (phrases or {}).items():
+            node = self._trie
+            for char in source:
+                node = node.setdefault(char, {})
+            node[_END] = target
+        self._phrase_initials = frozenset(self._trie)
+
+    def convert(self, text: str) -> str:
+        """
+        转换文本（线性时间）
+
+        Args:
+            text: 原文
+
+        Returns:
+            str: 转换后的文本
+        """
+        if not text:
+            return text
+        if self._phrase_initials.isdisjoint(text):
+            return text.translate(self._table)
+
+        pieces: List[str] = []
+        length = len(text)
+        start = i = 0
+        while i < length:
+            node = self._trie.get(text[i])
+            if node is None:
+                i += 1
+                continue
+            # 在前缀树中查找从 i 开始的最长词语
+            match_end, replacement = -1, None
+            j = i + 1
+            while True:
+                if _END in node:
+                    match_end, replacement = j, node[_END]
+                if j >= length:
+                    break
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+            if replacement is None:
+                i += 1
+                continue
+            pieces.append(text[start:i].translate(self._table))
+            pieces.append(replacement)
+            start = i = match_end
+        pieces.append(text[start:].translate(self._table))
+        return "".join(pieces)
+
+    def convert_many(self, texts: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """批量转换文本，None 和空字符串原样返回"""
+        return [self.convert(text) if text else text for text in texts]
+
+
+def _parse_pairs(pairs: str) -> Dict[str, str]:
+    char_map: Dict[str, str] = {}
+    for pair in pairs.split():
+        traditional, simplified = pair
+        if traditional != simplified:
+            char_map[traditional] = simplified
+    return char_map
+
+
+# 繁体 → 简体转换器（模块级单例）
+t2s_converter = ChineseConverter(_parse_pairs(_CHAR_PAIRS), _PHRASES)
+
+
+def convert_traditional_to_simplified(text: str) -> str:
+    """
+    将繁体中文转换为简体中文
+
+    Args:
+        text: 包含繁体中文的文本
+
+    Returns:
+        str: 转换后的简体中文文本
+    """
+    return t2s_converter.convert(text)
+
+
+def contains_kana(text: str) -> bool:
+    """文本是否包含日文假名（日文中的汉字不应做繁简转换）"""
+    return any("぀" <= char <= "ヿ" for char in text or "")
@@ -0,0 +1,190 @@
+"""
+上游熔断器 - 上游持续出错或变慢时快速失败，避免每个请求都等待完整超时
+
+每个上游一个熔断器（由 UpstreamClient 共享使用），状态：
+- closed：正常放行，按最近 N 次调用统计错误率和慢调用比例
+- open：错误率或慢调用比例超过阈值后打开，在冷却时间内直接抛出 CircuitOpenError
+- half_open：冷却结束后放行少量试探请求，全部正常则关闭，任一失败或变慢则重新打开
+
+CircuitOpenError 是 httpx.RequestError 的子类，各服务现有的网络错误回退逻辑
+（Mock 数据、过期缓存、数据库数据）无需修改即可生效。
+"""
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import httpx
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.RequestError):
+    """熔断器打开，请求未发送"""
+
+
+class CircuitBreaker:
+    """基于错误率和慢调用比例的熔断器"""
+
+    def __init__(self, name: str, slow_call_duration: float, window_size: int = 20, min_calls: int = 10,
+                 failure_rate_threshold: float = 0.5, slow_call_rate_threshold: float = 0.8,
+                 open_seconds: float = 30.0, half_open_calls: int = 3):
+        """
+        Args:
+            name: 上游名称
+            slow_call_duration: 超过该耗时（秒）的调用视为慢调用
+            window_size: 统计窗口（最近的调用次数）
+            min_calls: 窗口内至少有这么多次调用才会判断是否打开
+            failure_rate_threshold: 错误率阈值
+            slow_call_rate_threshold: 慢调用比例阈值
+            open_seconds: 打开后的冷却时间（秒）
+            half_open_calls: 半开状态下的试探请求数
+        """
+        self.name = name
+        self.slow_call_duration = slow_call_duration
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        # (是否失败, 是否慢调用)
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._stats: Dict[str, int] = {
+            "calls": 0,
+            "failures": 0,
+            "slow_calls": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    def before_call(self, method: str, url: str) -> None:
+        """
+        请求前检查是否放行
+
+        Raises:
+            CircuitOpenError: 熔断器打开，或半开状态下试探请求已满
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self._reject(method, url)
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._half_open_in_flight + self._half_open_successes >= self.half_open_calls:
+                self._reject(method, url)
+            self._half_open_in_flight += 1
+
+    def record(self, success: bool, duration: float) -> None:
+        """记录一次调用的结果（每次 before_call 放行后必须调用 record 或 release 之一）"""
+        slow = duration > self.slow_call_duration
+        self._stats["calls"] += 1
+        self._stats["failures"] += not success
+        self._stats["slow_calls"] += slow
+
+        if self.state == HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            if not success or slow:
+                self._open()
+            else:
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.half_open_calls:
+                    self._transition(CLOSED)
+            return
+
+        if self.state == CLOSED:
+            self._window.append((not success, slow))
+            if len(self._window) >= self.min_calls:
+                failure_rate = sum(failed for failed, _ in self._window) / len(self._window)
+                slow_rate = sum(is_slow for _, is_slow in self._window) / len(self._window)
+                if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+                    logger.warning(
+                        f"{self.name} circuit opening: failure rate {failure_rate:.0%}, "
+                        f"slow call rate {slow_rate:.0%} over last {len(self._window)} calls"
+                    )
+                    self._open()
+
+    def release(self) -> None:
+        """放行的请求没有可统计的结果（被取消、被限流）时释放半开试探名额"""
+        if self.state == HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def _reject(self, method: str, url: str) -> None:
+        self._stats["rejected"] += 1
+        raise CircuitOpenError(
+            f"{self.name} circuit is open, request not sent",
+            request=httpx.Request(method, url)
+        )
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._stats["opened"] += 1
+        self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        if state != self.state:
+            logger.warning(f"{self.name} circuit {self.state} -> {state}")
+        self.state = state
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        if state == CLOSED:
+            self._window.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """获取熔断器状态"""
+        failures = sum(failed for failed, _ in self._window)
+        slow = sum(is_slow for _, is_slow in self._window)
+        size = len(self._window)
+        return {
+            "name": self.name,
+            "state": self.state,
+            "open_for": round(max(0.0, self.open_seconds - (time.monotonic() - self._opened_at)), 3)
+            if self.state == OPEN else 0.0,
+            "window_calls": size,
+            "failure_rate": round(failures / size, 4) if size else 0.0,
+            "slow_call_rate": round(slow / size, 4) if size else 0.0,
+            "slow_call_duration": self.slow_call_duration,
+            **self._stats,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str, timeout: float) -> Optional[CircuitBreaker]:
+    """
+    获取指定上游共享的熔断器（进程内单例），CIRCUIT_BREAKER_ENABLED 关闭时返回 None
+
+    Args:
+        name: 上游名称
+        timeout: 该上游的请求超时（秒），慢调用阈值按其比例计算
+    """
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return None
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            name,
+            slow_call_duration=timeout * settings.CIRCUIT_BREAKER_SLOW_CALL_RATIO,
+            window_size=settings.CIRCUIT_BREAKER_WINDOW,
+            min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+            slow_call_rate_threshold=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_calls=settings.CIRCUIT_BREAKER_HALF_OPEN_CALLS
+        )
+        _breakers[name] = breaker
+    return breaker
+
+
+def get_all_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """获取所有已创建熔断器的状态"""
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
@@ -1,21 +1,56 @@
 """
 数据库服务 - 管理Supabase数据库连接和基础操作
+
+Supabase 客户端在第一次使用时才创建（导入 supabase 包和创建客户端都较慢），
+应用启动和 worker 启动不必等待；第一个访问数据库的请求完成初始化，之后复用同一个客户端。
 """
 import logging
-from typing import Optional, Dict, List, Any
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Dict, List, Any
 from datetime import datetime, timezone
-from supabase import create_client, Client
 from config import settings
+from services.metrics import record_upstream, status_outcome
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = logging.getLogger(__name__)
 
+
+def escape_like(value: str) -> str:
+    """
+    转义 LIKE 模式中的通配符，使 ilike 按不区分大小写的精确匹配处理
+
+    PostgREST 把 like/ilike 参数中的 * 当作 % 的别名，也一并转义。
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_").replace("*", "\\*")
+
+
 class DatabaseService:
     """数据库服务类"""
     
     def __init__(self):
-        """初始化数据库连接"""
-        self.supabase: Optional[Client] = None
-        self._initialize_client()
+        """只记录状态，客户端在第一次访问 supabase 属性时创建"""
+        self._client: Optional["Client"] = None
+        self._initialized = False
+        # 导出、聚合接口在线程池中访问数据库，初始化需要加锁
+        self._lock = threading.Lock()
+    
+    @property
+    def supabase(self) -> Optional["Client"]:
+        """Supabase 客户端（未配置或初始化失败时为 None）"""
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self._initialize_client()
+                    self._initialized = True
+        return self._client
+    
+    @supabase.setter
+    def supabase(self, client: Optional["Client"]):
+        self._client = client
+        self._initialized = True
     
     def _initialize_client(self):
         """初始化Supabase客户端"""
@@ -24,15 +59,51 @@ class DatabaseService:
                 logger.warning("Supabase configuration incomplete")
                 return
             
-            self.supabase = create_client(
+            from supabase import create_client
+            self._client = create_client(
                 settings.SUPABASE_URL,
                 settings.SUPABASE_SERVICE_ROLE_KEY
             )
+            self._instrument_client(self._client)
             logger.info("Supabase client initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {str(e)}")
-            self.supabase = None
+            self._client = None
+    
+    @staticmethod
+    def _instrument_client(client: "Client"):
+        """
+        在 PostgREST 的 httpx 会话上挂请求/响应钩子，记录每次查询的耗时和 5xx（见 services.metrics）
+
+        耗时为收到响应头的时间；连接失败不经过响应钩子，由调用方的异常日志体现。
+        """
+        try:
+            session = client.postgrest.session
+        except Exception as e:
+            logger.warning(f"Supabase metrics hooks not installed: {str(e)}")
+            return
+
+        def on_request(request):
+            request.extensions["metrics_started"] = time.perf_counter()
+
+        def on_response(response):
+            started = response.request.extensions.get("metrics_started")
+            if started is None:
+                return
+            record_upstream(
+                "supabase", time.perf_counter() - started, status_outcome(response.status_code),
+                "5xx" if response.status_code >= 500 else None
+            )
+
+        session.event_hooks["request"].append(on_request)
+        session.event_hooks["response"].append(on_response)
+    
+    def reset_client(self):
+        """丢弃当前客户端，下次访问时重新创建（多进程服务器 fork 后调用，避免各 worker 共用主进程的连接）"""
+        with self._lock:
+            self._client = None
+            self._initialized = False
     
     def is_connected(self) -> bool:
         """检查数据库连接状态"""
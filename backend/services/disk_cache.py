@@ -0,0 +1,179 @@
+"""
+上游响应磁盘缓存 - 基于 SQLite，按请求方法、URL 和参数缓存上游响应
+
+由 UpstreamClient 统一使用，模式由 HTTP_CACHE_MODE 控制：
+- off：关闭
+- cache：GET 响应在 TTL 内直接从磁盘返回，未命中时请求上游并写入
+- record：所有请求都访问上游，并记录响应（包括 POST，如 Spotify 令牌请求）
+- replay：只从磁盘回放已记录的响应（忽略 TTL），未记录的请求直接失败，不访问网络
+
+脚本中途失败后重新运行时，已请求过的艺术家会直接命中缓存；
+replay 模式可以离线重放真实流量，用于性能实验。
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("off", "cache", "record", "replay")
+
+# 只缓存这些状态码（404 也缓存，避免重复查询不存在的页面）
+CACHEABLE_STATUSES = frozenset({200, 203, 204, 300, 301, 404, 410})
+
+# 存储的内容已经解压，不能保留这些响应头
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+class ReplayMissError(httpx.RequestError):
+    """replay 模式下请求没有对应的记录"""
+
+
+class HTTPResponseCache:
+    """SQLite 上游响应缓存"""
+
+    def __init__(self, path: str, mode: str = "cache", default_ttl: float = 7 * 24 * 3600):
+        """
+        Args:
+            path: SQLite 数据库文件路径
+            mode: 缓存模式（cache / record / replay）
+            default_ttl: 默认有效期（秒）
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid HTTP cache mode '{mode}', expected one of {CACHE_MODES}")
+        self.path = path
+        self.mode = mode
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                upstream TEXT NOT NULL,
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Any = None, data: Any = None, json_body: Any = None) -> Tuple[str, str]:
+        """
+        生成缓存键（请求头不参与，避免访问令牌变化导致缓存失效）
+
+        Returns:
+            (缓存键, 规范化后的 URL)
+        """
+        full_url = httpx.URL(url, params=params) if params else httpx.URL(url)
+        query = urlencode(sorted(parse_qsl(full_url.query.decode(), keep_blank_values=True)))
+        canonical_url = str(full_url.copy_with(query=query.encode() or None))
+        body = ""
+        if data is not None:
+            body = json.dumps(data, sort_keys=True, default=str) if isinstance(data, dict) else str(data)
+        elif json_body is not None:
+            body = json.dumps(json_body, sort_keys=True, default=str)
+        digest = hashlib.sha256(f"{method.upper()} {canonical_url}\n{body}".encode()).hexdigest()
+        return digest, canonical_url
+
+    def should_read(self, method: str) -> bool:
+        """当前模式下该请求是否先查缓存"""
+        return self.mode == "replay" or (self.mode == "cache" and method.upper() == "GET")
+
+    def should_write(self, method: str) -> bool:
+        """当前模式下该请求的响应是否写入缓存"""
+        return self.mode == "record" or (self.mode == "cache" and method.upper() == "GET")
+
+    def get(self, key: str, method: str, url: str, ttl: Optional[float] = None) -> Optional[httpx.Response]:
+        """
+        读取缓存的响应
+
+        Returns:
+            缓存的响应；未命中或已过期时返回 None
+
+        Raises:
+            ReplayMissError: replay 模式下没有记录
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, content, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        ttl = self.default_ttl if ttl is None else ttl
+        if row is None or (self.mode != "replay" and time.time() - row[3] > ttl):
+            self._stats["misses"] += 1
+            if self.mode == "replay":
+                raise ReplayMissError(f"No recorded response for {method} {url}", request=httpx.Request(method, url))
+            return None
+
+        self._stats["hits"] += 1
+        status_code, headers, content, _ = row
+        return httpx.Response(
+            status_code,
+            headers=json.loads(headers),
+            content=content,
+            request=httpx.Request(method, url)
+        )
+
+    def set(self, key: str, upstream: str, method: str, url: str, response: httpx.Response) -> None:
+        """写入响应（只写入可缓存的状态码）"""
+        if response.status_code not in CACHEABLE_STATUSES:
+            return
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, upstream, method, url, status_code, headers, content, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, upstream, method.upper(), url, response.status_code,
+                 json.dumps(headers), response.content, time.time())
+            )
+            self._conn.commit()
+        self._stats["stores"] += 1
+
+    def purge_expired(self, ttl: Optional[float] = None) -> int:
+        """删除超过有效期的记录，返回删除条数"""
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - ttl,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """获取缓存统计信息"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"mode": self.mode, "path": self.path, "entries": size, **self._stats}
+
+
+_http_cache: Optional[HTTPResponseCache] = None
+
+
+def get_http_cache() -> Optional[HTTPResponseCache]:
+    """获取共享的磁盘缓存实例，HTTP_CACHE_MODE=off 时返回 None"""
+    global _http_cache
+    if settings.HTTP_CACHE_MODE == "off":
+        return None
+    if _http_cache is None:
+        _http_cache = HTTPResponseCache(settings.HTTP_CACHE_PATH, settings.HTTP_CACHE_MODE, settings.HTTP_CACHE_TTL)
+        logger.info(f"HTTP response cache enabled: mode={settings.HTTP_CACHE_MODE}, path={settings.HTTP_CACHE_PATH}")
+    return _http_cache
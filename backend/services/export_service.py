@@ -0,0 +1,117 @@
+"""
+数据导出服务 - 按主键分页（keyset pagination）逐页读取整张表
+
+不会一次 select("*") 整张表：每次只取 page_size 行（按 id 排序，下一页从上一页最后一个 id 之后开始），
+调用方逐行处理时内存占用与表大小无关。/export/*.ndjson 接口和脚本共用同一组生成器：
+
+    from services.export_service import export_service
+    for artist in export_service.iter_rows("artists", fields=["id", "name", "wiki_extract"]):
+        ...
+
+supabase 客户端是同步的，生成器也是同步的（在接口中由线程池驱动，不阻塞事件循环）。
+"""
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from config import settings
+from services.database_service import db_service
+
+logger = logging.getLogger(__name__)
+
+# 可导出的表 -> updated_since 过滤使用的时间列
+EXPORT_TABLES: Dict[str, str] = {
+    "artists": "updated_at",
+    "songs": "updated_at",
+    "ai_descriptions": "created_at",
+}
+
+_FIELD_PATTERN = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class ExportService:
+    """整表分页导出"""
+
+    def __init__(self):
+        self.db = db_service
+
+    @staticmethod
+    def normalize_fields(fields: Optional[Sequence[str]]) -> Optional[List[str]]:
+        """
+        校验字段投影
+
+        Raises:
+            ValueError: 字段名不合法
+        """
+        if not fields:
+            return None
+        normalized = []
+        for field in fields:
+            field = field.strip()
+            if not field:
+                continue
+            if not _FIELD_PATTERN.match(field):
+                raise ValueError(f"Invalid field name: {field!r}")
+            if field not in normalized:
+                normalized.append(field)
+        return normalized or None
+
+    def iter_pages(self, table: str, fields: Optional[Sequence[str]] = None,
+                   updated_since: Optional[datetime] = None,
+                   page_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        按 id 顺序逐页读取表中的行
+
+        Args:
+            table: 表名（EXPORT_TABLES 中的表）
+            fields: 只返回这些字段；为空时返回全部字段
+            updated_since: 只返回时间列（updated_at / created_at）不早于该时间的行
+            page_size: 每页行数，默认 EXPORT_PAGE_SIZE
+
+        Yields:
+            每页的行列表
+
+        Raises:
+            ValueError: 表名或字段名不合法
+            RuntimeError: 数据库未连接
+        """
+        if table not in EXPORT_TABLES:
+            raise ValueError(f"Table {table!r} cannot be exported")
+        fields = self.normalize_fields(fields)
+        if not self.db.is_connected():
+            raise RuntimeError("Database not connected")
+
+        page_size = page_size or settings.EXPORT_PAGE_SIZE
+        # 分页需要 id：未请求 id 时额外查询，输出前去掉
+        drop_id = fields is not None and "id" not in fields
+        columns = "*" if fields is None else ",".join((["id"] if drop_id else []) + fields)
+
+        after_id = None
+        while True:
+            query = self.db.supabase.table(table).select(columns)
+            if updated_since is not None:
+                query = query.gte(EXPORT_TABLES[table], updated_since.isoformat())
+            if after_id is not None:
+                query = query.gt("id", after_id)
+            rows = query.order("id").limit(page_size).execute().data or []
+            if not rows:
+                return
+            after_id = rows[-1]["id"]
+            if drop_id:
+                for row in rows:
+                    row.pop("id", None)
+            yield rows
+            if len(rows) < page_size:
+                return
+
+    def iter_rows(self, table: str, fields: Optional[Sequence[str]] = None,
+                  updated_since: Optional[datetime] = None,
+                  page_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """逐行读取表中的行，参数同 iter_pages"""
+        for page in self.iter_pages(table, fields, updated_since, page_size):
+            yield from page
+
+
+# 创建全局导出服务实例
+export_service = ExportService()
@@ -0,0 +1,121 @@
+"""
+对冲请求（hedged requests）- 降低上游偶发慢响应造成的长尾延迟
+
+第一次请求在该上游近期延迟的 p95 内没有返回时，再发送一个相同的请求，
+先返回的结果生效，另一个被取消。只用于幂等的 GET 请求，由 UpstreamClient 使用。
+
+对冲请求数受预算限制：每个普通请求积累 HTTP_HEDGE_BUDGET 个令牌（如 0.05 即最多多发 5% 的请求），
+上游出现故障、大量请求变慢时不会成倍放大负载；熔断器不处于 closed 状态时也不对冲。
+"""
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# 预算令牌上限（允许的短时突发对冲数）
+HEDGE_BUDGET_BURST = 10.0
+
+
+class HedgePolicy:
+    """按近期延迟分位数决定对冲延迟，并限制对冲请求的比例"""
+
+    def __init__(self, name: str, percentile: float = 0.95, budget_ratio: float = 0.05,
+                 min_samples: int = 20, min_delay: float = 0.02, window_size: int = 200):
+        """
+        Args:
+            name: 上游名称
+            percentile: 对冲延迟使用的延迟分位数
+            budget_ratio: 每个请求积累的对冲预算（对冲请求占比上限）
+            min_samples: 延迟样本数达到该值后才开始对冲
+            min_delay: 最小对冲延迟（秒）
+            window_size: 保留的最近延迟样本数
+        """
+        self.name = name
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._samples: Deque[float] = deque(maxlen=window_size)
+        self._sorted: Optional[List[float]] = None
+        self._tokens = 0.0
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "budget_exhausted": 0,
+        }
+
+    def record_latency(self, seconds: float) -> None:
+        """记录一次成功请求的延迟"""
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def delay(self) -> Optional[float]:
+        """
+        本次请求的对冲延迟，并为预算积累令牌
+
+        Returns:
+            对冲延迟（秒）；样本不足时返回 None（不对冲）
+        """
+        self._stats["requests"] += 1
+        self._tokens = min(HEDGE_BUDGET_BURST, self._tokens + self.budget_ratio)
+        if len(self._samples) < self.min_samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        return self._hedge_delay(self._sorted)
+
+    def _hedge_delay(self, samples: List[float]) -> float:
+        index = min(len(samples) - 1, int(len(samples) * self.percentile))
+        return max(self.min_delay, samples[index])
+
+    def try_hedge(self) -> bool:
+        """对冲延迟到期时调用：预算充足则消耗一个令牌并返回 True"""
+        if self._tokens < 1.0:
+            self._stats["budget_exhausted"] += 1
+            return False
+        self._tokens -= 1.0
+        self._stats["hedged"] += 1
+        return True
+
+    def record_hedge_win(self) -> None:
+        """对冲请求先于第一次请求返回"""
+        self._stats["hedge_wins"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """获取对冲统计信息"""
+        samples = sorted(self._samples)
+        return {
+            "name": self.name,
+            "samples": len(samples),
+            "p50": round(samples[len(samples) // 2], 4) if samples else None,
+            "hedge_delay": round(self._hedge_delay(samples), 4) if len(samples) >= self.min_samples else None,
+            "budget_tokens": round(self._tokens, 3),
+            **self._stats,
+        }
+
+
+_policies: Dict[str, HedgePolicy] = {}
+
+
+def get_hedge_policy(name: str) -> HedgePolicy:
+    """获取指定上游共享的对冲策略（进程内单例）"""
+    policy = _policies.get(name)
+    if policy is None:
+        policy = HedgePolicy(
+            name,
+            percentile=settings.HTTP_HEDGE_PERCENTILE,
+            budget_ratio=settings.HTTP_HEDGE_BUDGET,
+            min_samples=settings.HTTP_HEDGE_MIN_SAMPLES,
+            min_delay=settings.HTTP_HEDGE_MIN_DELAY
+        )
+        _policies[name] = policy
+    return policy
+
+
+def get_all_hedge_stats() -> Dict[str, Dict[str, Any]]:
+    """获取所有已启用对冲的上游的统计信息"""
+    return {name: policy.stats() for name, policy in _policies.items()}
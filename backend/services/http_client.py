@@ -0,0 +1,212 @@
+"""
+共享上游 HTTP 客户端 - Spotify、Wikipedia、iTunes 等服务统一通过此层访问外部 API
+
+- 每个上游复用一个 httpx.AsyncClient（连接池、Keep-Alive）
+- 每次请求前从该上游的令牌桶获取令牌
+- 429/503（以及 Wikipedia maxlag）响应按 Retry-After 暂停后自动重试
+- 开启 HTTP_CACHE_MODE 时读写 SQLite 磁盘缓存（见 services.disk_cache）
+- 每个上游一个熔断器，上游持续出错或变慢时直接抛出 CircuitOpenError（见 services.circuit_breaker）
+- 可选的对冲请求，降低偶发慢响应造成的长尾延迟（见 services.hedging）
+- 每次请求的耗时和失败原因记入 /metrics（见 services.metrics）
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Iterable, Optional, Tuple
+
+import httpx
+
+from config import settings
+from services.circuit_breaker import CLOSED, CircuitOpenError, get_circuit_breaker
+from services.disk_cache import get_http_cache
+from services.hedging import get_hedge_policy
+from services.metrics import record_upstream, status_outcome
+from services.rate_limiter import TokenBucketLimiter, get_rate_limiter, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THROTTLE_STATUSES = (429, 503)
+
+
+class UpstreamClient:
+    """带限流和限流退避的上游 HTTP 客户端"""
+
+    def __init__(self, name: str, timeout: float, max_retries: Optional[int] = None,
+                 throttle_statuses: Iterable[int] = DEFAULT_THROTTLE_STATUSES,
+                 limiter: Optional[TokenBucketLimiter] = None, cache_ttl: Optional[float] = None,
+                 hedge: bool = False):
+        """
+        Args:
+            name: 上游名称（spotify、wikipedia、itunes 等），同名上游共享限流器
+            timeout: 请求超时时间（秒）
+            max_retries: 被限流时的最大重试次数，默认使用 HTTP_RETRIES
+            throttle_statuses: 视为限流的 HTTP 状态码
+            limiter: 自定义限流器，默认使用该上游共享的限流器
+            cache_ttl: 磁盘缓存有效期（秒），默认使用 HTTP_CACHE_TTL
+            hedge: 是否对 GET 请求启用对冲请求
+        """
+        self.name = name
+        self.timeout = timeout
+        self.max_retries = settings.HTTP_RETRIES if max_retries is None else max_retries
+        self.throttle_statuses = frozenset(throttle_statuses)
+        self.limiter = limiter or get_rate_limiter(name)
+        self.cache_ttl = cache_ttl
+        self.breaker = get_circuit_breaker(name, timeout)
+        self.hedger = get_hedge_policy(name) if hedge else None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """获取当前事件循环下的 httpx 客户端（连接池与事件循环绑定）"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client_loop = loop
+        return self._client
+
+    def _throttle_delay(self, response: httpx.Response) -> Optional[float]:
+        """
+        判断响应是否为限流响应
+
+        Returns:
+            限流时返回 Retry-After 秒数（没有该头时为 -1），否则返回 None
+        """
+        is_throttled = response.status_code in self.throttle_statuses
+        # Wikipedia maxlag：HTTP 200 + X-Database-Lag + Retry-After
+        if not is_throttled and "X-Database-Lag" in response.headers and "Retry-After" in response.headers:
+            is_throttled = True
+        if not is_throttled:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return -1.0 if retry_after is None else retry_after
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        发送请求（参数与 httpx.AsyncClient.request 相同）
+
+        重试次数用尽后返回最后一次的限流响应，由调用方按原有逻辑处理状态码。
+        网络错误、超时和 5xx 响应计入熔断器统计；磁盘缓存命中不经过熔断器。
+
+        Raises:
+            CircuitOpenError: 该上游的熔断器打开，请求未发送
+        """
+        cache = get_http_cache()
+        cache_key = cache_url = None
+        if cache is not None and (cache.should_read(method) or cache.should_write(method)):
+            cache_key, cache_url = cache.make_key(
+                method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+            )
+            if cache.should_read(method):
+                cached = cache.get(cache_key, method, cache_url, self.cache_ttl)
+                if cached is not None:
+                    record_upstream(self.name, 0.0, "disk_cache")
+                    return cached
+
+        if self.breaker is not None:
+            try:
+                self.breaker.before_call(method, url)
+            except CircuitOpenError:
+                record_upstream(self.name, 0.0, "rejected", "circuit_open")
+                raise
+        recorded = False
+        attempt = 0
+        try:
+            while True:
+                await self.limiter.acquire()
+                started = time.monotonic()
+                try:
+                    response, hedged = await self._send(method, url, **kwargs)
+                except httpx.RequestError as e:
+                    record_upstream(self.name, time.monotonic() - started, "error", type(e).__name__)
+                    if self.breaker is not None:
+                        self.breaker.record(False, time.monotonic() - started)
+                        recorded = True
+                    raise
+                delay = self._throttle_delay(response)
+                if delay is None:
+                    record_upstream(
+                        self.name, time.monotonic() - started, status_outcome(response.status_code),
+                        "5xx" if response.status_code >= 500 else None
+                    )
+                    self.limiter.on_success()
+                    # 对冲请求胜出时的耗时不代表第一次请求的延迟，不计入对冲延迟的统计
+                    if self.hedger is not None and not hedged and response.status_code < 500:
+                        self.hedger.record_latency(time.monotonic() - started)
+                    if self.breaker is not None:
+                        self.breaker.record(response.status_code < 500, time.monotonic() - started)
+                        recorded = True
+                    if cache_key is not None and cache.should_write(method):
+                        cache.set(cache_key, self.name, method, cache_url, response)
+                    return response
+
+                record_upstream(self.name, time.monotonic() - started, "throttled", "throttled")
+                self.limiter.on_throttled(None if delay < 0 else delay)
+                if attempt >= self.max_retries:
+                    logger.error(f"{self.name} still throttled after {attempt} retries: {method} {url}")
+                    return response
+                attempt += 1
+                # 读取并释放连接，下一次 acquire 会等待到限流解除
+                await response.aread()
+        finally:
+            # 限流响应和被取消的请求不计入熔断统计
+            if self.breaker is not None and not recorded:
+                self.breaker.release()
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> Tuple[httpx.Response, bool]:
+        """
+        发送一次请求；启用对冲时，超过对冲延迟仍未返回则再发送一次相同请求，先成功返回的生效
+
+        两次请求都失败时抛出第一次请求的异常。
+
+        Returns:
+            (响应, 是否为对冲请求的响应)
+        """
+        hedge_delay = None
+        if self.hedger is not None and method.upper() == "GET" and (self.breaker is None or self.breaker.state == CLOSED):
+            hedge_delay = self.hedger.delay()
+        if hedge_delay is None:
+            return await self.client.request(method, url, **kwargs), False
+
+        async def hedge_attempt() -> httpx.Response:
+            await self.limiter.acquire()
+            return await self.client.request(method, url, **kwargs)
+
+        primary = asyncio.create_task(self.client.request(method, url, **kwargs))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done and self.hedger.try_hedge():
+                logger.debug(f"{self.name} hedging after {hedge_delay:.3f}s: {method} {url}")
+                tasks.append(asyncio.create_task(hedge_attempt()))
+
+            error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task not in done:
+                        continue
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedger.record_hedge_win()
+                        return task.result(), task is not primary
+                    if task is primary or error is None:
+                        error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """关闭底层连接池"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
@@ -8,20 +8,51 @@ import logging
 from typing import Optional, Dict, Any, List
 from urllib.parse import quote
 from config import settings
+from services.cache import TTLCache
+from services.http_client import UpstreamClient, DEFAULT_THROTTLE_STATUSES
+from services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+NO_MATCH_ERROR = "No matching tracks found in iTunes"
+
+
+class _SearchMiss(Exception):
+    """搜索未成功，携带返回给调用方的结果（未找到匹配时写入负缓存）"""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("error"))
+        self.result = result
+
+
 class iTunesService:
     """iTunes API服务类"""
     
     def __init__(self):
-        self.base_url = "https://itunes.apple.com/search"
+        self.base_url = settings.ITUNES_API_URL
         self.timeout = settings.ITUNES_TIMEOUT  # 使用专门的iTunes超时配置
+        # iTunes 超出频率限制时返回 403
+        self.http = UpstreamClient(
+            "itunes",
+            timeout=self.timeout,
+            throttle_statuses=(*DEFAULT_THROTTLE_STATUSES, 403),
+            cache_ttl=settings.ITUNES_HTTP_CACHE_TTL,
+            hedge=settings.ITUNES_HEDGE_REQUESTS
+        )
+        self._inflight = SingleFlight("itunes")  # 合并相同歌曲的并发搜索
+        self._cache = TTLCache(
+            "itunes",
+            max_size=settings.ITUNES_CACHE_MAX_SIZE,
+            ttl=settings.ITUNES_PREVIEW_CACHE_TTL,
+            negative_ttl=settings.ITUNES_NEGATIVE_CACHE_TTL
+        )
     
     async def search_track(self, artist_name: str, track_name: str, limit: int = 5) -> Optional[Dict[str, Any]]:
         """
         在iTunes中搜索歌曲
         
+        结果按归一化后的 (艺术家, 歌曲, limit) 缓存；未找到匹配也会短时间缓存。
+        
         Args:
             artist_name: 艺术家名称
             track_name: 歌曲名称
@@ -30,117 +61,104 @@ class iTunesService:
         Returns:
             iTunes搜索结果，包含预览URL
         """
+        cache_key = (" ".join(artist_name.split()).lower(), " ".join(track_name.split()).lower(), limit)
+        
+        async def load() -> Dict[str, Any]:
+            result = await self._inflight.do(cache_key, lambda: self._search_track(artist_name, track_name, limit))
+            if not result.get("success"):
+                raise _SearchMiss(result)
+            return result
+        
         try:
-            # 构建搜索查询
-            query = f"{artist_name} {track_name}"
+            return await self._cache.get_or_load(
+                cache_key,
+                load,
+                negative_if=lambda e: isinstance(e, _SearchMiss) and e.result.get("error") == NO_MATCH_ERROR
+            )
+        except _SearchMiss as e:
+            return e.result
+    
+    async def _search_track(self, artist_name: str, track_name: str, limit: int) -> Dict[str, Any]:
+        """
+        执行 iTunes 歌曲搜索（由 search_track 合并调用）
+        
+        先精确搜索（艺术家 + 歌曲），没有匹配时再只用歌曲名宽松搜索。
+        """
+        query = f"{artist_name} {track_name}"
+        logger.debug(f"Searching iTunes for: {query}")
+        
+        try:
+            match = self._find_best_match(await self._search(query, limit), artist_name, track_name)
             
-            params = {
-                "term": query,  # 不要手动编码，让httpx处理
-                "media": "music",
-                "entity": "song",
-                "limit": limit,
-                "country": "US"  # 使用美国区域获得更好的覆盖率
+            # 如果第一次搜索失败，尝试更宽松的搜索：只用歌曲名称搜索，增加结果数量
+            if not match and artist_name and track_name:
+                logger.debug(f"First search failed, trying fallback search for '{track_name}'")
+                match = self._find_best_match_fuzzy(await self._search(track_name, limit * 2), artist_name, track_name)
+        except Exception as e:
+            return self._format_error(e, artist_name, track_name)
+        
+        if match:
+            return self._format_match(match)
+        
+        logger.warning(f"No matching tracks found for: {query}")
+        return {
+            "success": False,
+            "error": NO_MATCH_ERROR
+        }
+    
+    async def _search(self, term: str, limit: int) -> List[Dict[str, Any]]:
+        """发送一次 iTunes 搜索请求，返回结果列表"""
+        params = {
+            "term": term,  # 不要手动编码，让httpx处理
+            "media": "music",
+            "entity": "song",
+            "limit": limit,
+            "country": "US"  # 使用美国区域获得更好的覆盖率
+        }
+        response = await self.http.get(self.base_url, params=params)
+        response.raise_for_status()
+        data = response.json()
+        logger.debug(f"iTunes search '{term}' returned {data.get('resultCount', 0)} results")
+        return data.get("results", [])
+    
+    @staticmethod
+    def _format_match(match: Dict[str, Any]) -> Dict[str, Any]:
+        """把 iTunes 搜索结果转换为接口返回格式"""
+        logger.info(f"Found iTunes match: {match.get('trackName')} by {match.get('artistName')}, "
+                    f"has preview: {bool(match.get('previewUrl'))}")
+        return {
+            "success": True,
+            "data": {
+                "track_name": match.get("trackName"),
+                "artist_name": match.get("artistName"),
+                "album_name": match.get("collectionName"),
+                "preview_url": match.get("previewUrl"),
+                "artwork_url": match.get("artworkUrl100"),
+                "track_time_millis": match.get("trackTimeMillis"),
+                "itunes_url": match.get("trackViewUrl"),
+                "genre": match.get("primaryGenreName"),
+                "release_date": match.get("releaseDate")
             }
-            
-            logger.info(f"Searching iTunes for: {query}")
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                logger.info(f"iTunes API returned {data.get('resultCount', 0)} results")
-                
-                if data.get("resultCount", 0) > 0:
-                    # 寻找最匹配的结果
-                    best_match = self._find_best_match(
-                        data["results"], 
-                        artist_name, 
-                        track_name
-                    )
-                    
-                    if best_match:
-                        has_preview = bool(best_match.get("previewUrl"))
-                        logger.info(f"Found match: {best_match.get('trackName')} by {best_match.get('artistName')}, has preview: {has_preview}")
-                        
-                        return {
-                            "success": True,
-                            "data": {
-                                "track_name": best_match.get("trackName"),
-                                "artist_name": best_match.get("artistName"),
-                                "album_name": best_match.get("collectionName"),
-                                "preview_url": best_match.get("previewUrl"),
-                                "artwork_url": best_match.get("artworkUrl100"),
-                                "track_time_millis": best_match.get("trackTimeMillis"),
-                                "itunes_url": best_match.get("trackViewUrl"),
-                                "genre": best_match.get("primaryGenreName"),
-                                "release_date": best_match.get("releaseDate")
-                            }
-                        }
-                
-                # 如果第一次搜索失败，尝试更宽松的搜索
-                if artist_name and track_name:
-                    logger.info(f"First search failed, trying fallback search strategies")
-                    
-                    # 策略1: 只用歌曲名称搜索
-                    fallback_params = {
-                        "term": track_name,
-                        "media": "music", 
-                        "entity": "song",
-                        "limit": limit * 2,  # 增加结果数量
-                        "country": "US"
-                    }
-                    
-                    response = await client.get(self.base_url, params=fallback_params)
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    logger.info(f"Fallback search returned {data.get('resultCount', 0)} results")
-                    
-                    if data.get("resultCount", 0) > 0:
-                        best_match = self._find_best_match_fuzzy(
-                            data["results"], 
-                            artist_name, 
-                            track_name
-                        )
-                        
-                        if best_match:
-                            has_preview = bool(best_match.get("previewUrl"))
-                            logger.info(f"Fallback found match: {best_match.get('trackName')} by {best_match.get('artistName')}, has preview: {has_preview}")
-                            
-                            return {
-                                "success": True,
-                                "data": {
-                                    "track_name": best_match.get("trackName"),
-                                    "artist_name": best_match.get("artistName"),
-                                    "album_name": best_match.get("collectionName"),
-                                    "preview_url": best_match.get("previewUrl"),
-                                    "artwork_url": best_match.get("artworkUrl100"),
-                                    "track_time_millis": best_match.get("trackTimeMillis"),
-                                    "itunes_url": best_match.get("trackViewUrl"),
-                                    "genre": best_match.get("primaryGenreName"),
-                                    "release_date": best_match.get("releaseDate")
-                                }
-                            }
-                
-                logger.warning(f"No matching tracks found for: {query}")
-                return {
-                    "success": False,
-                    "error": "No matching tracks found in iTunes"
-                }
-                
-        except httpx.TimeoutException:
+        }
+    
+    @staticmethod
+    def _format_error(error: Exception, artist_name: str, track_name: str) -> Dict[str, Any]:
+        """把搜索异常转换为接口返回格式"""
+        if isinstance(error, httpx.TimeoutException):
             logger.error(f"iTunes API timeout for query: {artist_name} - {track_name}")
             return {
                 "success": False,
                 "error": "iTunes API request timeout"
             }
-        except Exception as e:
-            logger.error(f"iTunes API error: {str(e)}")
-            return {
-                "success": False,
-                "error": f"iTunes API error: {str(e)}"
-            }
+        logger.error(f"iTunes API error: {str(error)}")
+        return {
+            "success": False,
+            "error": f"iTunes API error: {str(error)}"
+        }
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """获取 iTunes 搜索结果缓存统计信息"""
+        return self._cache.stats()
     
     def _find_best_match(self, results: List[Dict], artist_name: str, track_name: str) -> Optional[Dict]:
         """
@@ -157,17 +175,13 @@ class iTunesService:
         if not results:
             return None
         
-        logger.info(f"Searching through {len(results)} results for best match")
-        
         # 优先返回第一个有预览URL的结果（iTunes搜索通常按相关性排序）
-        for i, result in enumerate(results):
-            has_preview = bool(result.get("previewUrl"))
-            logger.info(f"Result {i+1}: {result.get('trackName')} by {result.get('artistName')}, has preview: {has_preview}")
-            if has_preview:
+        for result in results:
+            if result.get("previewUrl"):
                 return result
         
         # 如果没有找到有预览URL的结果，返回第一个结果
-        logger.info(f"No results with preview found, returning first result: {results[0].get('trackName')}")
+        logger.debug(f"No results with preview found, returning first result: {results[0].get('trackName')}")
         return results[0]
     
     def _find_best_match_fuzzy(self, results: List[Dict], artist_name: str, track_name: str) -> Optional[Dict]:
@@ -185,8 +199,6 @@ class iTunesService:
         if not results:
             return None
         
-        logger.info(f"Fuzzy searching through {len(results)} results for best match")
-        
         def similarity_score(result_artist: str, result_track: str, target_artist: str, target_track: str) -> float:
             """计算相似度分数"""
             score = 0.0
@@ -213,6 +225,7 @@ class iTunesService:
         
         best_match = None
         best_score = 0.0
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for i, result in enumerate(results):
             has_preview = bool(result.get("previewUrl"))
@@ -225,17 +238,18 @@ class iTunesService:
             if has_preview:
                 score += 0.1
             
-            logger.info(f"Result {i+1}: {result_track} by {result_artist}, score: {score:.2f}, has preview: {has_preview}")
+            if debug:
+                logger.debug(f"Result {i+1}: {result_track} by {result_artist}, score: {score:.2f}, has preview: {has_preview}")
             
             if score > best_score:
                 best_score = score
                 best_match = result
         
         if best_match and best_score > 0.3:  # 最低相似度阈值
-            logger.info(f"Best fuzzy match: {best_match.get('trackName')} by {best_match.get('artistName')}, score: {best_score:.2f}")
+            logger.debug(f"Best fuzzy match: {best_match.get('trackName')} by {best_match.get('artistName')}, score: {best_score:.2f}")
             return best_match
         
-        logger.info("No good fuzzy match found")
+        logger.debug("No good fuzzy match found")
         return None
     
     async def get_artist_top_tracks(self, artist_name: str, limit: int = 10) -> Optional[Dict[str, Any]]:
@@ -258,42 +272,41 @@ class iTunesService:
                 "country": "US"
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if data.get("resultCount", 0) > 0:
-                    tracks = []
-                    for result in data["results"]:
-                        # 只包含有预览URL的歌曲
-                        if result.get("previewUrl"):
-                            tracks.append({
-                                "track_name": result.get("trackName"),
-                                "artist_name": result.get("artistName"),
-                                "album_name": result.get("collectionName"),
-                                "preview_url": result.get("previewUrl"),
-                                "artwork_url": result.get("artworkUrl100"),
-                                "track_time_millis": result.get("trackTimeMillis"),
-                                "itunes_url": result.get("trackViewUrl"),
-                                "genre": result.get("primaryGenreName")
-                            })
-                    
-                    return {
-                        "success": True,
-                        "data": {
-                            "artist_name": artist_name,
-                            "tracks": tracks,
-                            "total_count": len(tracks)
-                        }
-                    }
+            response = await self.http.get(self.base_url, params=params)
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            if data.get("resultCount", 0) > 0:
+                tracks = []
+                for result in data["results"]:
+                    # 只包含有预览URL的歌曲
+                    if result.get("previewUrl"):
+                        tracks.append({
+                            "track_name": result.get("trackName"),
+                            "artist_name": result.get("artistName"),
+                            "album_name": result.get("collectionName"),
+                            "preview_url": result.get("previewUrl"),
+                            "artwork_url": result.get("artworkUrl100"),
+                            "track_time_millis": result.get("trackTimeMillis"),
+                            "itunes_url": result.get("trackViewUrl"),
+                            "genre": result.get("primaryGenreName")
+                        })
                 
                 return {
-                    "success": False,
-                    "error": "No tracks found for this artist in iTunes"
+                    "success": True,
+                    "data": {
+                        "artist_name": artist_name,
+                        "tracks": tracks,
+                        "total_count": len(tracks)
+                    }
                 }
-                
+            
+            return {
+                "success": False,
+                "error": "No tracks found for this artist in iTunes"
+            }
+            
         except Exception as e:
             logger.error(f"iTunes API error for artist {artist_name}: {str(e)}")
             return {
@@ -0,0 +1,291 @@
+"""
+运行指标 - 计数器、仪表和直方图，按 Prometheus 文本格式输出（/metrics）
+
+记录路径不加锁、不分配新对象（已有标签组合时）：
+- 事件循环中的记录在单线程内完成；线程池中的记录（数据库调用）依赖 GIL，极少数并发更新可能丢失，可以接受
+- 直方图只累加命中的那个桶（二分查找），输出时再计算累计值
+- 缓存命中率、熔断器状态等已有统计在抓取时读取，不在请求路径上重复记录
+
+每个进程单独统计：输出的每个序列都带 pid 标签（抓取时的进程号），多 worker 部署时
+不同 worker 的计数是不同的序列，rate() 等按序列计算的结果不会因为抓取落在不同 worker 上而错乱；
+需要整体数值时在查询中 sum without (pid)。
+"""
+import asyncio
+import logging
+import os
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 秒；覆盖从缓存命中到上游超时的范围
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], *extra: str) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    pairs.extend(item for item in extra if item)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    def render(self, const_labels: str = "") -> List[str]:
+        """
+        Args:
+            const_labels: 附加到每个序列的标签（已格式化，如 pid="123"）
+        """
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """单调递增计数器"""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def reset(self) -> None:
+        self._values.clear()
+
+    def render(self, const_labels: str = "") -> List[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels, const_labels)} {_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Gauge(Metric):
+    """可增可减的当前值"""
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def reset(self) -> None:
+        self._values.clear()
+
+    def render(self, const_labels: str = "") -> List[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels, const_labels)} {_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    """直方图：每个标签组合保存各桶计数、总数和总和"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 每个序列：[各桶计数..., +Inf 桶计数, 总和]（各桶不累计，输出时再累加）
+        self._series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def reset(self) -> None:
+        self._series.clear()
+
+    def render(self, const_labels: str = "") -> List[str]:
+        lines = self.header()
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, const_labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels, const_labels)
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """指标注册表：记录型指标 + 抓取时调用的采集函数"""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        """清空所有记录型指标的数值"""
+        for metric in self._metrics:
+            metric.reset()
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """注册抓取时调用的采集函数（返回临时创建的指标）"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """输出 Prometheus 文本格式（每个序列附加当前进程的 pid 标签）"""
+        # 抓取时读取：预加载模式下模块在主进程导入，fork 后 worker 的进程号不同
+        const_labels = f'pid="{os.getpid()}"'
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render(const_labels))
+        for collector in self._collectors:
+            try:
+                for metric in collector():
+                    lines.extend(metric.render(const_labels))
+            except Exception as e:
+                logger.warning(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {str(e)}")
+        return "\n".join(lines) + "\n"
+
+
+# 全局注册表
+registry = MetricsRegistry()
+
+# ---- HTTP 请求 ----
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template, method and status code",
+    ("method", "route", "status")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed", ("method",)
+)
+
+# ---- 上游调用 ----
+upstream_request_duration = registry.histogram(
+    "upstream_request_duration_seconds", "Upstream call latency by service and outcome",
+    ("upstream", "outcome")
+)
+upstream_errors = registry.counter(
+    "upstream_errors_total", "Upstream calls that failed, by service and reason",
+    ("upstream", "reason")
+)
+
+# ---- 事件循环 ----
+event_loop_lag = registry.histogram(
+    "event_loop_lag_seconds", "Delay between a scheduled wake-up and when the event loop ran it",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+event_loop_lag_last = registry.gauge("event_loop_lag_last_seconds", "Most recent event loop lag sample")
+
+process_start_time = registry.gauge("process_start_time_seconds", "Start time of the process since unix epoch")
+process_start_time.set(time.time())
+
+
+def _reset_after_fork() -> None:
+    """gunicorn 预加载模式下本模块在主进程导入：worker fork 后清空继承的数值并重新记录启动时间，
+    避免各 worker 重复计入主进程（预热阶段）的记录"""
+    registry.reset()
+    process_start_time.set(time.time())
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def status_outcome(status_code: int) -> str:
+    """HTTP 状态码 -> 结果标签（2xx/3xx/4xx/5xx，限流状态码单独列出）"""
+    if status_code in (429, 503):
+        return str(status_code)
+    return f"{status_code // 100}xx"
+
+
+def record_upstream(upstream: str, seconds: float, outcome: str, error_reason: Optional[str] = None) -> None:
+    """
+    记录一次上游调用
+
+    Args:
+        upstream: 上游名称（spotify、wikipedia、itunes、supabase 等）
+        seconds: 耗时（秒）
+        outcome: 结果标签（status_outcome() 的返回值或 "error"）
+        error_reason: 失败原因（异常类名、5xx 等），成功时为 None
+    """
+    upstream_request_duration.observe(seconds, upstream, outcome)
+    if error_reason is not None:
+        upstream_errors.inc(upstream, error_reason)
+
+
+class EventLoopLagMonitor:
+    """定时休眠并测量实际唤醒延迟，反映事件循环被阻塞的程度"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+
+        async def run():
+            while True:
+                scheduled = time.perf_counter()
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, time.perf_counter() - scheduled - self.interval)
+                event_loop_lag.observe(lag)
+                event_loop_lag_last.set(lag)
+
+        self._task = asyncio.create_task(run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,190 @@
+"""
+歌曲预览URL解析服务 - 为缺少 preview_url 的歌曲查询 iTunes 并写回 songs 表
+
+- 补全任务：按ID分页扫描缺少预览的歌曲，限制并发查询 iTunes，每页结果一次批量写入数据库
+- 播放接口：先读数据库中已保存的预览URL，未命中时才实时查询 iTunes
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from config import settings
+from services.artist_bundle_service import artist_bundle_service
+from services.itunes_service import itunes_service, NO_MATCH_ERROR
+from services.response_versions import invalidate_versions
+from services.song_db_service import song_db_service
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewResolver:
+    """歌曲预览URL解析器"""
+
+    def __init__(self):
+        self.song_db = song_db_service
+        self.itunes = itunes_service
+        self._task: Optional[asyncio.Task] = None
+        self._last_run: Optional[Dict[str, Any]] = None
+
+    async def get_preview(self, artist_name: str, track_name: str) -> Optional[Dict[str, Any]]:
+        """
+        获取歌曲预览URL（数据库优先，未命中时查询 iTunes）
+
+        Returns:
+            {"preview_url": ..., "source": "iTunes" / "Spotify", "itunes_info": ..., "from_database": bool}，
+            找不到预览时返回 None
+        """
+        stored = await self.song_db.find_song_preview(artist_name, track_name)
+        if stored.get("success"):
+            song = stored["data"]
+            itunes_data = song.get("itunes_data") or {}
+            from_itunes = song["preview_url"] in (itunes_data.get("preview_url"), itunes_data.get("previewUrl"))
+            return {
+                "preview_url": song["preview_url"],
+                # 其他预览URL来自 Spotify（update_song_spotify_data 写入）
+                "source": "iTunes" if from_itunes else "Spotify",
+                "itunes_info": itunes_data if from_itunes else None,
+                "from_database": True
+            }
+
+        result = await self.itunes.search_track(artist_name, track_name)
+        if result and result.get("success") and result["data"].get("preview_url"):
+            return {
+                "preview_url": result["data"]["preview_url"],
+                "source": "iTunes",
+                "itunes_info": result["data"],
+                "from_database": False
+            }
+        return None
+
+    async def resolve_missing(self, max_songs: Optional[int] = None, concurrency: Optional[int] = None,
+                              batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        补全缺少预览URL的歌曲
+
+        查询失败（超时等）的歌曲不写入数据库，下次运行时重试；
+        iTunes 中找不到的歌曲会记录查询时间，之后不再扫描。
+
+        Args:
+            max_songs: 本次最多处理的歌曲数，默认不限制
+            concurrency: 同时查询 iTunes 的歌曲数
+            batch_size: 每批扫描并写回数据库的歌曲数
+
+        Returns:
+            统计信息
+        """
+        concurrency = concurrency or settings.PREVIEW_RESOLVER_CONCURRENCY
+        batch_size = batch_size or settings.PREVIEW_RESOLVER_BATCH_SIZE
+        semaphore = asyncio.Semaphore(concurrency)
+        stats = {"scanned": 0, "resolved": 0, "without_preview": 0, "not_found": 0, "failed": 0, "persisted": 0}
+        started_at = datetime.now(timezone.utc)
+        after_id = None
+
+        while max_songs is None or stats["scanned"] < max_songs:
+            page_size = batch_size if max_songs is None else min(batch_size, max_songs - stats["scanned"])
+            page = await self.song_db.get_songs_missing_preview(limit=page_size, after_id=after_id)
+            if not page.get("success"):
+                logger.error(f"Failed to load songs missing preview: {page.get('error')}")
+                break
+            songs = page["data"]
+            if not songs:
+                break
+            after_id = songs[-1]["id"]
+            stats["scanned"] += len(songs)
+
+            async def resolve(song: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._resolve_song(song)
+
+            results = await asyncio.gather(*(resolve(song) for song in songs))
+
+            updates = []
+            for song, itunes_data in zip(songs, results):
+                if itunes_data is None:
+                    stats["failed"] += 1
+                    continue
+                if itunes_data.get("not_found"):
+                    stats["not_found"] += 1
+                elif itunes_data.get("preview_url"):
+                    stats["resolved"] += 1
+                else:
+                    stats["without_preview"] += 1
+                updates.append({
+                    "id": song["id"],
+                    "artist_id": song["artist_id"],
+                    "title": song["title"],
+                    "itunes_data": itunes_data
+                })
+
+            persisted = await self.song_db.batch_update_song_itunes_data(updates)
+            if persisted.get("success"):
+                stats["persisted"] += persisted.get("count", 0)
+                invalidate_versions()
+                for artist_id in {update["artist_id"] for update in updates}:
+                    artist_bundle_service.invalidate(artist_id)
+            else:
+                logger.error(f"Failed to persist iTunes data for {len(updates)} songs: {persisted.get('error')}")
+
+            logger.info(f"Preview resolver progress: {stats}")
+            if len(songs) < page_size:
+                break
+
+        self._last_run = {
+            **stats,
+            "started_at": started_at.isoformat(),
+            "finished_at": datetime.now(timezone.utc).isoformat()
+        }
+        return self._last_run
+
+    async def _resolve_song(self, song: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """查询单首歌曲，返回要保存的 itunes_data；查询失败时返回 None"""
+        artist_name = (song.get("artists") or {}).get("name")
+        if not artist_name or not song.get("title"):
+            return None
+
+        result = await self.itunes.search_track(artist_name, song["title"])
+        if result.get("success"):
+            return result["data"]
+        if result.get("error") == NO_MATCH_ERROR:
+            return {"not_found": True, "checked_at": datetime.now(timezone.utc).isoformat()}
+        logger.debug(f"iTunes lookup failed for '{artist_name} - {song['title']}': {result.get('error')}")
+        return None
+
+    def start(self, interval: float) -> None:
+        """在后台按固定间隔运行补全任务"""
+        if self._task is not None and not self._task.done():
+            return
+
+        async def run_forever():
+            while True:
+                try:
+                    await self.resolve_missing()
+                except Exception as e:
+                    logger.error(f"Preview resolver run failed: {str(e)}")
+                await asyncio.sleep(interval)
+
+        self._task = asyncio.create_task(run_forever())
+        logger.info(f"Preview resolver started (interval={interval}s)")
+
+    async def stop(self) -> None:
+        """停止后台补全任务"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """获取后台任务状态和最近一次运行的统计"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "last_run": self._last_run
+        }
+
+
+# 全局实例
+preview_resolver = PreviewResolver()
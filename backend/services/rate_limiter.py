@@ -0,0 +1,177 @@
+"""
+上游限流器 - 按上游服务（Spotify、Wikipedia、iTunes、DeepSeek）共享的令牌桶
+
+- 请求按到达顺序排队获取令牌（FIFO 公平排队）
+- 收到 429/503 时按 Retry-After 精确暂停，没有 Retry-After 时指数退避
+- 被限流后速率减半，之后每次成功逐步恢复到配置的速率（AIMD）
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# 没有 Retry-After 时的退避参数（秒）
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析 Retry-After 头（秒数或 HTTP 日期）
+
+    Returns:
+        需要等待的秒数，无法解析时返回 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucketLimiter:
+    """自适应令牌桶限流器"""
+
+    def __init__(self, name: str, rate: float, burst: int, min_rate: Optional[float] = None):
+        """
+        Args:
+            name: 上游名称
+            rate: 每秒允许的请求数
+            burst: 桶容量（允许的突发请求数）
+            min_rate: 被限流后速率下降的下限，默认为 rate 的 10%
+        """
+        self.name = name
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate * 0.1
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0,
+        }
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """获取当前事件循环下的排队锁（asyncio.Lock 按等待顺序唤醒，保证排队公平；锁与事件循环绑定）"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+    async def acquire(self) -> None:
+        """获取一个令牌，必要时排队等待"""
+        started = time.monotonic()
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    break
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+        self._stats["requests"] += 1
+        self._stats["wait_seconds"] += time.monotonic() - started
+
+    def on_success(self) -> None:
+        """上游正常响应：逐步恢复速率"""
+        self._consecutive_throttles = 0
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> float:
+        """
+        上游返回限流响应：暂停发送并降低速率
+
+        Args:
+            retry_after: 上游要求的等待秒数，None 时使用指数退避
+
+        Returns:
+            实际暂停的秒数
+        """
+        self._consecutive_throttles += 1
+        self._stats["throttled"] += 1
+        if retry_after is None:
+            retry_after = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self._consecutive_throttles - 1))
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        self._tokens = 0.0
+        self.rate = max(self.min_rate, self.rate / 2)
+        logger.warning(f"{self.name} throttled, pausing {retry_after:.2f}s (rate now {self.rate:.2f}/s)")
+        return retry_after
+
+    def record_error(self, error: Exception) -> None:
+        """
+        根据 SDK 异常更新限流状态（用于不经过共享 HTTP 客户端的调用，如 DeepSeek SDK）
+        """
+        status_code = getattr(error, "status_code", None)
+        if status_code in (429, 503):
+            response = getattr(error, "response", None)
+            headers = getattr(response, "headers", None) or {}
+            self.on_throttled(parse_retry_after(headers.get("Retry-After")))
+
+    def stats(self) -> Dict[str, Any]:
+        """获取限流器状态"""
+        return {
+            "name": self.name,
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "burst": self.burst,
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+            **{key: round(value, 3) for key, value in self._stats.items()},
+        }
+
+
+# 各上游的默认速率配置：(每秒请求数, 突发容量)
+_LIMITER_CONFIG = {
+    "spotify": (settings.SPOTIFY_RATE_LIMIT, settings.SPOTIFY_RATE_BURST),
+    "wikipedia": (settings.WIKIPEDIA_RATE_LIMIT, settings.WIKIPEDIA_RATE_BURST),
+    "itunes": (settings.ITUNES_RATE_LIMIT, settings.ITUNES_RATE_BURST),
+    "deepseek": (settings.DEEPSEEK_RATE_LIMIT, settings.DEEPSEEK_RATE_BURST),
+}
+
+_limiters: Dict[str, TokenBucketLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> TokenBucketLimiter:
+    """获取指定上游共享的限流器（进程内单例）"""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        rate, burst = _LIMITER_CONFIG.get(name, (settings.DEFAULT_RATE_LIMIT, settings.DEFAULT_RATE_BURST))
+        limiter = TokenBucketLimiter(name, rate, burst)
+        _limiters[name] = limiter
+    return limiter
+
+
+def get_all_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """获取所有已创建限流器的状态"""
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
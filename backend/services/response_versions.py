@@ -0,0 +1,32 @@
+"""
+响应校验值记录 - 条件请求（api.conditional）在不查询数据库的情况下返回 304 的依据
+
+每个 URL 最近一次响应的 (ETag, Last-Modified) 在进程内保留 CONDITIONAL_VERSION_TTL 秒。
+记录只在当前进程内有效，因此：
+- 所有在进程内修改艺术家/歌曲数据的地方（API 写操作、预览补全、Wikipedia 副本刷新）都要调用 invalidate_versions()
+- 多 worker 部署时其他 worker 的记录无法清除，CONDITIONAL_VERSION_TTL 默认为 0（每次条件请求都查询数据库），
+  只有实际 worker 数为 1 时（SERVER_WORKERS=1，或未设置且只有一个 CPU 核）默认开启
+"""
+from typing import Any, Dict
+
+from config import settings
+from services.cache import TTLCache
+
+# 创建全局校验值缓存实例
+response_versions = TTLCache(
+    "http_validators",
+    max_size=settings.CONDITIONAL_VERSION_CACHE_SIZE,
+    ttl=settings.CONDITIONAL_VERSION_TTL
+)
+_stats = {"invalidations": 0}
+
+
+def invalidate_versions() -> None:
+    """清空已记录的校验值（艺术家/歌曲数据被修改后调用）"""
+    response_versions.clear()
+    _stats["invalidations"] += 1
+
+
+def get_version_stats() -> Dict[str, Any]:
+    """获取校验值记录的统计信息"""
+    return {"version_ttl": settings.CONDITIONAL_VERSION_TTL, "tracked_urls": len(response_versions), **_stats}
@@ -0,0 +1,72 @@
+"""
+请求合并（single-flight）- 相同键的并发调用共享同一个进行中的上游请求
+
+热门艺术家页面被大量用户同时打开时，缓存写入之前的所有并发请求
+只会触发一次上游调用，其余调用等待并共享同一结果（或同一异常）。
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """按键合并并发调用"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 名称（用于日志和统计）
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats: Dict[str, int] = {
+            "calls": 0,
+            "shared": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行 fn，若相同 key 的调用正在进行则等待其结果
+
+        单个等待方被取消不会取消共享的上游请求。
+
+        Args:
+            key: 合并键（调用方负责归一化）
+            fn: 无参数的异步函数
+
+        Returns:
+            fn 的返回值
+
+        Raises:
+            fn 抛出的异常（所有等待方收到同一个异常）
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self._stats["calls"] += 1
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            self._stats["shared"] += 1
+            logger.debug(f"{self.name}: joining in-flight request for {key!r}")
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 所有等待方都已取消时，避免 "exception was never retrieved" 警告
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """获取合并统计信息"""
+        return {
+            "name": self.name,
+            "in_flight": len(self._inflight),
+            **self._stats,
+        }
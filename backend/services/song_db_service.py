@@ -5,11 +5,12 @@ import logging
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone, date
-from services.database_service import db_service
+from services.database_service import db_service, escape_like
 from models.database import SongModel, CreateSongRequest
 
 logger = logging.getLogger(__name__)
 
+
 class SongDatabaseService:
     """歌曲数据库服务类"""
     
@@ -166,6 +167,10 @@ class SongDatabaseService:
         Returns:
             歌曲列表
         """
+        return self.get_songs_by_artist_sync(artist_id, limit, offset)
+    
+    def get_songs_by_artist_sync(self, artist_id: UUID, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+        """get_songs_by_artist 的同步版本（直接执行 supabase 查询，供线程池调用）"""
         if not self.db.is_connected():
             return {"success": False, "error": "Database not connected"}
         
@@ -239,6 +244,36 @@ class SongDatabaseService:
             logger.error(f"Error updating song Spotify data: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    @staticmethod
+    def _build_itunes_update(itunes_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        从iTunes数据中提取需要写入 songs 表的字段
+        
+        同时支持 iTunes 原始字段（previewUrl）和 itunes_service 返回的字段（preview_url）
+        """
+        update_data = {
+            "itunes_data": itunes_data,
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }
+        
+        preview_url = itunes_data.get("previewUrl") or itunes_data.get("preview_url")
+        track_time_millis = itunes_data.get("trackTimeMillis") or itunes_data.get("track_time_millis")
+        album_name = itunes_data.get("collectionName") or itunes_data.get("album_name")
+        release_date = itunes_data.get("releaseDate") or itunes_data.get("release_date")
+        
+        if preview_url:
+            update_data["preview_url"] = preview_url
+        if track_time_millis and track_time_millis >= 1000:
+            update_data["duration_seconds"] = track_time_millis // 1000
+        if album_name:
+            update_data["album_name"] = album_name
+        if release_date:
+            try:
+                update_data["release_date"] = datetime.strptime(release_date[:10], "%Y-%m-%d").date().isoformat()
+            except ValueError:
+                pass  # 忽略日期解析错误
+        return update_data
+    
     async def update_song_itunes_data(self, song_id: UUID, itunes_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         更新歌曲的iTunes数据
@@ -254,24 +289,7 @@ class SongDatabaseService:
             return {"success": False, "error": "Database not connected"}
         
         try:
-            update_data = {
-                "itunes_data": itunes_data,
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }
-            
-            # 从iTunes数据中提取有用信息
-            if "previewUrl" in itunes_data and itunes_data["previewUrl"]:
-                update_data["preview_url"] = itunes_data["previewUrl"]
-            if "trackTimeMillis" in itunes_data:
-                update_data["duration_seconds"] = itunes_data["trackTimeMillis"] // 1000
-            if "collectionName" in itunes_data:
-                update_data["album_name"] = itunes_data["collectionName"]
-            if "releaseDate" in itunes_data:
-                try:
-                    release_date = datetime.strptime(itunes_data["releaseDate"][:10], "%Y-%m-%d").date()
-                    update_data["release_date"] = release_date.isoformat()
-                except:
-                    pass  # 忽略日期解析错误
+            update_data = self._build_itunes_update(itunes_data)
             
             result = self.db.supabase.table("songs").update(update_data).eq("id", str(song_id)).execute()
             
@@ -289,6 +307,111 @@ class SongDatabaseService:
             logger.error(f"Error updating song iTunes data: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    async def batch_update_song_itunes_data(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        批量写入多首歌曲的iTunes数据（一次 upsert 请求）
+        
+        Args:
+            updates: 列表，每项包含 id、artist_id、title（满足非空约束）和 itunes_data
+            
+        Returns:
+            更新结果
+        """
+        if not self.db.is_connected():
+            return {"success": False, "error": "Database not connected"}
+        if not updates:
+            return {"success": True, "count": 0}
+        
+        try:
+            rows = [
+                {
+                    "id": str(update["id"]),
+                    "artist_id": str(update["artist_id"]),
+                    "title": update["title"],
+                    **self._build_itunes_update(update["itunes_data"])
+                }
+                for update in updates
+            ]
+            
+            result = self.db.supabase.table("songs").upsert(rows, on_conflict="id").execute()
+            
+            count = len(result.data) if result.data else 0
+            logger.info(f"Batch updated iTunes data for {count} songs")
+            return {
+                "success": True,
+                "count": count,
+                "message": f"iTunes data updated for {count} songs"
+            }
+                
+        except Exception as e:
+            logger.error(f"Error batch updating song iTunes data: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def get_songs_missing_preview(self, limit: int = 100, after_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        获取没有预览URL、且尚未查询过iTunes的歌曲（按ID分页）
+        
+        Args:
+            limit: 返回结果数量限制
+            after_id: 只返回ID大于该值的歌曲（上一页最后一条的ID）
+            
+        Returns:
+            歌曲列表（包含艺术家名称）
+        """
+        if not self.db.is_connected():
+            return {"success": False, "error": "Database not connected"}
+        
+        try:
+            query = self.db.supabase.table("songs").select("id, artist_id, title, artists(name)").is_(
+                "preview_url", "null"
+            ).is_("itunes_data", "null")
+            if after_id:
+                query = query.gt("id", after_id)
+            result = query.order("id").limit(limit).execute()
+            
+            return {
+                "success": True,
+                "data": result.data,
+                "count": len(result.data)
+            }
+                
+        except Exception as e:
+            logger.error(f"Error getting songs missing preview: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def find_song_preview(self, artist_name: str, title: str) -> Dict[str, Any]:
+        """
+        按艺术家名称和歌曲标题（不区分大小写）查找已保存预览URL的歌曲
+        
+        Args:
+            artist_name: 艺术家名称
+            title: 歌曲标题
+            
+        Returns:
+            歌曲信息（包含 preview_url 和 itunes_data）
+        """
+        if not self.db.is_connected():
+            return {"success": False, "error": "Database not connected"}
+        
+        try:
+            result = self.db.supabase.table("songs").select(
+                "id, title, preview_url, itunes_data, artists!inner(name)"
+            ).ilike("title", escape_like(title)).ilike("artists.name", escape_like(artist_name)).not_.is_(
+                "preview_url", "null"
+            ).limit(1).execute()
+            
+            if result.data:
+                return {
+                    "success": True,
+                    "data": result.data[0]
+                }
+            else:
+                return {"success": False, "error": "Song not found"}
+                
+        except Exception as e:
+            logger.error(f"Error finding song preview: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
     async def batch_create_songs(self, songs_data: List[CreateSongRequest]) -> Dict[str, Any]:
         """
         批量创建歌曲（用于从Spotify API获取艺术家热门歌曲后批量插入）
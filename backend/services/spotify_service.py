@@ -1,13 +1,19 @@
 """
 Spotify 服务 - 处理 Spotify API 相关逻辑
 """
+import asyncio
 import httpx
 import logging
 import base64
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from fastapi import HTTPException
 
 from config import settings
+from services.artist_db_service import artist_db_service
+from services.cache import TTLCache
+from services.http_client import UpstreamClient
+from services.response_versions import invalidate_versions
+from services.single_flight import SingleFlight
 from models.spotify import (
     SpotifyArtist, SpotifyImage, SpotifyTrack, SpotifyAlbum, 
     SpotifyPlaylist, SpotifyPlaylistRequest
@@ -15,6 +21,24 @@ from models.spotify import (
 
 logger = logging.getLogger(__name__)
 
+# Spotify 多 ID 接口（/artists?ids=、/tracks?ids=）单次请求的最大 ID 数量
+SPOTIFY_MAX_IDS_PER_REQUEST = 50
+
+def _is_not_found(error: Exception) -> bool:
+    """判断异常是否为 404（用于负缓存）"""
+    return isinstance(error, HTTPException) and error.status_code == 404
+
+def _normalize_name(name: str) -> str:
+    """比较艺术家名称用：合并空白并转小写"""
+    return " ".join(name.split()).lower()
+
+class _UnconfirmedArtistMatch(Exception):
+    """搜索结果的名称与查询不一致：ID 只返回给本次调用，不写入缓存和数据库"""
+
+    def __init__(self, spotify_id: str):
+        super().__init__(spotify_id)
+        self.spotify_id = spotify_id
+
 class SpotifyService:
     """Spotify API 服务类"""
     
@@ -24,8 +48,20 @@ class SpotifyService:
         self.api_url = settings.SPOTIFY_API_URL
         self.auth_url = settings.SPOTIFY_AUTH_URL
         self.timeout = settings.SPOTIFY_TIMEOUT  # 使用专门的Spotify超时配置
+        self.http = UpstreamClient("spotify", timeout=self.timeout, cache_ttl=settings.SPOTIFY_HTTP_CACHE_TTL)  # 共享连接池与限流
         self._access_token = None
         self._token_expires_at = None
+        # 艺术家、热门曲目和搜索结果的响应缓存（键包含接口类型、ID、市场和数量）
+        self._cache = TTLCache(
+            "spotify",
+            max_size=settings.SPOTIFY_CACHE_MAX_SIZE,
+            negative_ttl=settings.SPOTIFY_NEGATIVE_CACHE_TTL,
+            stale_ttl=settings.SPOTIFY_CACHE_STALE_TTL
+        )
+        # 合并缓存写入前相同键的并发请求（包括访问令牌刷新）
+        self._inflight = SingleFlight("spotify")
+        # 艺术家名称 -> Spotify ID 的解析来源统计
+        self._resolve_stats = {"database": 0, "search": 0, "unconfirmed": 0, "written_back": 0, "not_found": 0}
     
     async def get_mock_artist_data(self, artist_name: str) -> SpotifyArtist:
         """获取 Mock 艺术家数据"""
@@ -256,7 +292,11 @@ class SpotifyService:
             if time.time() < self._token_expires_at:
                 return self._access_token
         
-        # 获取新的访问令牌
+        # 令牌过期时并发请求只刷新一次
+        return await self._inflight.do(("token",), self._request_access_token)
+    
+    async def _request_access_token(self) -> str:
+        """向 Spotify 请求新的访问令牌"""
         auth_string = f"{self.client_id}:{self.client_secret}"
         auth_bytes = auth_string.encode("ascii")
         auth_base64 = base64.b64encode(auth_bytes).decode("ascii")
@@ -268,76 +308,140 @@ class SpotifyService:
         
         data = {"grant_type": "client_credentials"}
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    self.auth_url,
-                    headers=headers,
-                    data=data
-                )
-                
-                if response.status_code == 400:
-                    error_data = response.json() if response.content else {}
-                    raise HTTPException(
-                        status_code=400,
-                        detail={
-                            "error": "Invalid credentials",
-                            "message": error_data.get("error_description", "Invalid Spotify API credentials"),
-                            "service": "Spotify"
-                        }
-                    )
-                elif response.status_code != 200:
-                    raise HTTPException(
-                        status_code=response.status_code,
-                        detail={
-                            "error": "Authentication failed",
-                            "message": f"Failed to authenticate with Spotify API: {response.status_code}",
-                            "service": "Spotify"
-                        }
-                    )
-                
-                token_data = response.json()
-                self._access_token = token_data["access_token"]
-                
-                # 计算 token 过期时间（提前 5 分钟刷新）
-                import time
-                expires_in = token_data.get("expires_in", 3600)
-                self._token_expires_at = time.time() + expires_in - 300
-                
-                return self._access_token
-                
-            except httpx.TimeoutException:
-                logger.error("Spotify authentication timeout")
+        try:
+            response = await self.http.post(
+                self.auth_url,
+                headers=headers,
+                data=data
+            )
+            
+            if response.status_code == 400:
+                error_data = response.json() if response.content else {}
                 raise HTTPException(
-                    status_code=408,
+                    status_code=400,
                     detail={
-                        "error": "Authentication timeout",
-                        "message": f"Spotify authentication timeout after {self.timeout} seconds",
+                        "error": "Invalid credentials",
+                        "message": error_data.get("error_description", "Invalid Spotify API credentials"),
                         "service": "Spotify"
                     }
                 )
-            except httpx.RequestError as e:
-                logger.error(f"Spotify authentication network error: {str(e)}")
+            elif response.status_code != 200:
                 raise HTTPException(
-                    status_code=503,
+                    status_code=response.status_code,
                     detail={
-                        "error": "Network error",
-                        "message": f"Failed to connect to Spotify authentication service: {str(e)}",
+                        "error": "Authentication failed",
+                        "message": f"Failed to authenticate with Spotify API: {response.status_code}",
                         "service": "Spotify"
                     }
                 )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error in Spotify authentication: {str(e)}")
-                raise HTTPException(
-                    status_code=500,
-                    detail={
-                        "error": "Authentication error",
-                        "message": "An unexpected error occurred during Spotify authentication",
-                        "details": str(e)
-                    }
-                )
+            
+            token_data = response.json()
+            self._access_token = token_data["access_token"]
+            
+            # 计算 token 过期时间（提前 5 分钟刷新）
+            import time
+            expires_in = token_data.get("expires_in", 3600)
+            self._token_expires_at = time.time() + expires_in - 300
+            
+            return self._access_token
+            
+        except httpx.TimeoutException:
+            logger.error("Spotify authentication timeout")
+            raise HTTPException(
+                status_code=408,
+                detail={
+                    "error": "Authentication timeout",
+                    "message": f"Spotify authentication timeout after {self.timeout} seconds",
+                    "service": "Spotify"
+                }
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Spotify authentication network error: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "Network error",
+                    "message": f"Failed to connect to Spotify authentication service: {str(e)}",
+                    "service": "Spotify"
+                }
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in Spotify authentication: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Authentication error",
+                    "message": "An unexpected error occurred during Spotify authentication",
+                    "details": str(e)
+                }
+            )
+    
+    @staticmethod
+    def _parse_artist(data: Dict[str, Any]) -> SpotifyArtist:
+        """将 Spotify 艺术家 JSON 解析为 SpotifyArtist"""
+        images = [
+            SpotifyImage(
+                url=img["url"],
+                height=img["height"],
+                width=img["width"]
+            )
+            for img in data.get("images", [])
+        ]
+        
+        return SpotifyArtist(
+            id=data["id"],
+            name=data["name"],
+            images=images,
+            genres=data.get("genres", []),
+            popularity=data.get("popularity", 0),
+            followers=data.get("followers", {"total": 0}),
+            external_urls=data.get("external_urls", {})
+        )
+    
+    @staticmethod
+    def _parse_track(track_data: Dict[str, Any]) -> SpotifyTrack:
+        """将 Spotify 曲目 JSON 解析为 SpotifyTrack"""
+        # 解析专辑信息
+        album_data = track_data.get("album", {})
+        album_images = [
+            SpotifyImage(
+                url=img["url"],
+                height=img["height"],
+                width=img["width"]
+            )
+            for img in album_data.get("images", [])
+        ]
+        
+        album = SpotifyAlbum(
+            id=album_data.get("id", ""),
+            name=album_data.get("name", ""),
+            images=album_images,
+            release_date=album_data.get("release_date", ""),
+            total_tracks=album_data.get("total_tracks", 0)
+        )
+        
+        # 解析艺术家信息
+        artists = []
+        for artist_data in track_data.get("artists", []):
+            artists.append({
+                "id": artist_data.get("id", ""),
+                "name": artist_data.get("name", ""),
+                "external_urls": artist_data.get("external_urls", {})
+            })
+        
+        return SpotifyTrack(
+            id=track_data["id"],
+            name=track_data["name"],
+            album=album,
+            artists=artists,  # 添加艺术家信息
+            duration_ms=track_data.get("duration_ms", 0),
+            popularity=track_data.get("popularity", 0),
+            preview_url=track_data.get("preview_url"),
+            explicit=track_data.get("explicit", False),
+            external_urls=track_data.get("external_urls", {})
+        )
     
     async def get_real_artist_data(self, spotify_id: str) -> SpotifyArtist:
         """获取真实 Spotify 艺术家数据"""
@@ -349,104 +453,83 @@ class SpotifyService:
             "Content-Type": "application/json"
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(
-                    f"{self.api_url}/artists/{spotify_id}",
-                    headers=headers
-                )
-                
-                if response.status_code == 400:
-                    raise HTTPException(
-                        status_code=400,
-                        detail={
-                            "error": "Invalid artist ID",
-                            "message": f"Invalid Spotify artist ID: {spotify_id}",
-                            "service": "Spotify"
-                        }
-                    )
-                elif response.status_code == 404:
-                    raise HTTPException(
-                        status_code=404,
-                        detail={
-                            "error": "Artist not found",
-                            "message": f"Artist with ID '{spotify_id}' not found on Spotify",
-                            "service": "Spotify"
-                        }
-                    )
-                elif response.status_code == 401:
-                    raise HTTPException(
-                        status_code=401,
-                        detail={
-                            "error": "Authentication failed",
-                            "message": "Spotify API authentication failed",
-                            "service": "Spotify"
-                        }
-                    )
-                elif response.status_code != 200:
-                    raise HTTPException(
-                        status_code=response.status_code,
-                        detail={
-                            "error": "Spotify API error",
-                            "message": f"Spotify API returned status {response.status_code}",
-                            "service": "Spotify"
-                        }
-                    )
-                
-                data = response.json()
-                
-                # 解析图片
-                images = [
-                    SpotifyImage(
-                        url=img["url"],
-                        height=img["height"],
-                        width=img["width"]
-                    )
-                    for img in data.get("images", [])
-                ]
-                
-                return SpotifyArtist(
-                    id=data["id"],
-                    name=data["name"],
-                    images=images,
-                    genres=data.get("genres", []),
-                    popularity=data.get("popularity", 0),
-                    followers=data.get("followers", {"total": 0}),
-                    external_urls=data.get("external_urls", {})
+        try:
+            response = await self.http.get(
+                f"{self.api_url}/artists/{spotify_id}",
+                headers=headers
+            )
+            
+            if response.status_code == 400:
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "error": "Invalid artist ID",
+                        "message": f"Invalid Spotify artist ID: {spotify_id}",
+                        "service": "Spotify"
+                    }
                 )
-                
-            except httpx.TimeoutException:
-                logger.error(f"Spotify API timeout for artist {spotify_id}")
+            elif response.status_code == 404:
                 raise HTTPException(
-                    status_code=408,
+                    status_code=404,
                     detail={
-                        "error": "Request timeout",
-                        "message": f"Spotify API request timeout after {self.timeout} seconds",
+                        "error": "Artist not found",
+                        "message": f"Artist with ID '{spotify_id}' not found on Spotify",
                         "service": "Spotify"
                     }
                 )
-            except httpx.RequestError as e:
-                logger.error(f"Spotify API network error: {str(e)}")
+            elif response.status_code == 401:
                 raise HTTPException(
-                    status_code=503,
+                    status_code=401,
                     detail={
-                        "error": "Network error",
-                        "message": f"Failed to connect to Spotify API: {str(e)}",
+                        "error": "Authentication failed",
+                        "message": "Spotify API authentication failed",
                         "service": "Spotify"
                     }
                 )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error in Spotify artist service: {str(e)}")
+            elif response.status_code != 200:
                 raise HTTPException(
-                    status_code=500,
+                    status_code=response.status_code,
                     detail={
-                        "error": "Internal server error",
-                        "message": "An unexpected error occurred while processing Spotify artist data",
-                        "details": str(e)
+                        "error": "Spotify API error",
+                        "message": f"Spotify API returned status {response.status_code}",
+                        "service": "Spotify"
                     }
                 )
+            
+            return self._parse_artist(response.json())
+            
+        except httpx.TimeoutException:
+            logger.error(f"Spotify API timeout for artist {spotify_id}")
+            raise HTTPException(
+                status_code=408,
+                detail={
+                    "error": "Request timeout",
+                    "message": f"Spotify API request timeout after {self.timeout} seconds",
+                    "service": "Spotify"
+                }
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Spotify API network error: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "Network error",
+                    "message": f"Failed to connect to Spotify API: {str(e)}",
+                    "service": "Spotify"
+                }
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in Spotify artist service: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Internal server error",
+                    "message": "An unexpected error occurred while processing Spotify artist data",
+                    "details": str(e)
+                }
+            )
     
     async def get_real_tracks_data(self, spotify_id: str, limit: int = 10, market: str = "JP") -> List[SpotifyTrack]:
         """获取真实 Spotify 热门曲目数据"""
@@ -458,121 +541,76 @@ class SpotifyService:
             "Content-Type": "application/json"
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(
-                    f"{self.api_url}/artists/{spotify_id}/top-tracks",
-                    headers=headers,
-                    params={"market": market}
-                )
-                
-                if response.status_code == 400:
-                    raise HTTPException(
-                        status_code=400,
-                        detail={
-                            "error": "Invalid request",
-                            "message": f"Invalid artist ID or market code: {spotify_id}, {market}",
-                            "service": "Spotify"
-                        }
-                    )
-                elif response.status_code == 404:
-                    raise HTTPException(
-                        status_code=404,
-                        detail={
-                            "error": "Artist not found",
-                            "message": f"Artist with ID '{spotify_id}' not found",
-                            "service": "Spotify"
-                        }
-                    )
-                elif response.status_code != 200:
-                    raise HTTPException(
-                        status_code=response.status_code,
-                        detail={
-                            "error": "Spotify API error",
-                            "message": f"Failed to get top tracks from Spotify: {response.status_code}",
-                            "service": "Spotify"
-                        }
-                    )
-                
-                data = response.json()
-                tracks = []
-                
-                for track_data in data.get("tracks", [])[:limit]:
-                    # 解析专辑信息
-                    album_data = track_data.get("album", {})
-                    album_images = [
-                        SpotifyImage(
-                            url=img["url"],
-                            height=img["height"],
-                            width=img["width"]
-                        )
-                        for img in album_data.get("images", [])
-                    ]
-                    
-                    album = SpotifyAlbum(
-                        id=album_data.get("id", ""),
-                        name=album_data.get("name", ""),
-                        images=album_images,
-                        release_date=album_data.get("release_date", ""),
-                        total_tracks=album_data.get("total_tracks", 0)
-                    )
-                    
-                    # 解析艺术家信息
-                    artists = []
-                    for artist_data in track_data.get("artists", []):
-                        artists.append({
-                            "id": artist_data.get("id", ""),
-                            "name": artist_data.get("name", ""),
-                            "external_urls": artist_data.get("external_urls", {})
-                        })
-                    
-                    track = SpotifyTrack(
-                        id=track_data["id"],
-                        name=track_data["name"],
-                        album=album,
-                        artists=artists,  # 添加艺术家信息
-                        duration_ms=track_data.get("duration_ms", 0),
-                        popularity=track_data.get("popularity", 0),
-                        preview_url=track_data.get("preview_url"),
-                        explicit=track_data.get("explicit", False),
-                        external_urls=track_data.get("external_urls", {})
-                    )
-                    tracks.append(track)
-                
-                return tracks
-                
-            except httpx.TimeoutException:
-                logger.error(f"Spotify API timeout for tracks of {spotify_id}")
+        try:
+            response = await self.http.get(
+                f"{self.api_url}/artists/{spotify_id}/top-tracks",
+                headers=headers,
+                params={"market": market}
+            )
+            
+            if response.status_code == 400:
                 raise HTTPException(
-                    status_code=408,
+                    status_code=400,
                     detail={
-                        "error": "Request timeout",
-                        "message": f"Spotify API request timeout after {self.timeout} seconds",
+                        "error": "Invalid request",
+                        "message": f"Invalid artist ID or market code: {spotify_id}, {market}",
                         "service": "Spotify"
                     }
                 )
-            except httpx.RequestError as e:
-                logger.error(f"Spotify API network error: {str(e)}")
+            elif response.status_code == 404:
                 raise HTTPException(
-                    status_code=503,
+                    status_code=404,
                     detail={
-                        "error": "Network error",
-                        "message": f"Failed to connect to Spotify API: {str(e)}",
+                        "error": "Artist not found",
+                        "message": f"Artist with ID '{spotify_id}' not found",
                         "service": "Spotify"
                     }
                 )
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error in Spotify tracks service: {str(e)}")
+            elif response.status_code != 200:
                 raise HTTPException(
-                    status_code=500,
+                    status_code=response.status_code,
                     detail={
-                        "error": "Internal server error",
-                        "message": "An unexpected error occurred while processing Spotify tracks data",
-                        "details": str(e)
+                        "error": "Spotify API error",
+                        "message": f"Failed to get top tracks from Spotify: {response.status_code}",
+                        "service": "Spotify"
                     }
                 )
+            
+            data = response.json()
+            return [self._parse_track(track_data) for track_data in data.get("tracks", [])[:limit]]
+            
+        except httpx.TimeoutException:
+            logger.error(f"Spotify API timeout for tracks of {spotify_id}")
+            raise HTTPException(
+                status_code=408,
+                detail={
+                    "error": "Request timeout",
+                    "message": f"Spotify API request timeout after {self.timeout} seconds",
+                    "service": "Spotify"
+                }
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Spotify API network error: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "Network error",
+                    "message": f"Failed to connect to Spotify API: {str(e)}",
+                    "service": "Spotify"
+                }
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in Spotify tracks service: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Internal server error",
+                    "message": "An unexpected error occurred while processing Spotify tracks data",
+                    "details": str(e)
+                }
+            )
     
     async def get_artist_info(self, spotify_id: str) -> SpotifyArtist:
         """
@@ -588,7 +626,13 @@ class SpotifyService:
             HTTPException: 当 API 调用失败时
         """
         if settings.is_production and self.is_available():
-            return await self.get_real_artist_data(spotify_id)
+            key = ("artist", spotify_id)
+            return await self._inflight.do(key, lambda: self._cache.get_or_load(
+                key,
+                lambda: self.get_real_artist_data(spotify_id),
+                ttl=settings.SPOTIFY_ARTIST_CACHE_TTL,
+                negative_if=_is_not_found
+            ))
         else:
             # 在开发环境下，根据ID映射到艺术家名称
             id_to_name = {
@@ -617,10 +661,155 @@ class SpotifyService:
             HTTPException: 当 API 调用失败时
         """
         if settings.is_production and self.is_available():
-            return await self.get_real_tracks_data(spotify_id, limit, market)
+            return await self._cache.get_or_load(
+                ("top_tracks", spotify_id, market, limit),
+                lambda: self.get_real_tracks_data(spotify_id, limit, market),
+                ttl=settings.SPOTIFY_TOP_TRACKS_CACHE_TTL,
+                negative_if=_is_not_found
+            )
         else:
             return await self.get_mock_tracks_data(spotify_id, limit)
     
+    async def _fetch_bulk(self, resource: str, spotify_ids: List[str],
+                          params: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        分块并发调用 Spotify 多 ID 接口
+        
+        Args:
+            resource: 资源类型（artists 或 tracks）
+            spotify_ids: Spotify ID 列表（自动去重，每 50 个为一块）
+            params: 额外查询参数（如 market）
+            
+        Returns:
+            (请求的 Spotify ID -> 原始 JSON 数据, 所在分块请求失败的 ID 列表)；
+            Spotify 返回 null（不存在）的 ID 两者都不包含
+            
+        Raises:
+            HTTPException: 所有分块都失败时抛出（超时、网络错误、限流为 503，其他非 200 响应为 502）
+        """
+        unique_ids = list(dict.fromkeys(sid for sid in spotify_ids if sid))
+        chunks = [
+            unique_ids[i:i + SPOTIFY_MAX_IDS_PER_REQUEST]
+            for i in range(0, len(unique_ids), SPOTIFY_MAX_IDS_PER_REQUEST)
+        ]
+        if not chunks:
+            return {}, []
+        
+        logger.info(f"Fetching {len(unique_ids)} Spotify {resource} in {len(chunks)} requests")
+        
+        access_token = await self._get_access_token()
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
+        semaphore = asyncio.Semaphore(settings.SPOTIFY_BULK_CONCURRENCY)
+        results: Dict[str, Dict[str, Any]] = {}
+        failed: List[str] = []
+        # 每个失败分块的原因：HTTP 状态码，或 "timeout" / "network"
+        errors: List[Any] = []
+        
+        async def fetch_chunk(chunk: List[str]):
+            async with semaphore:
+                try:
+                    response = await self.http.get(
+                        f"{self.api_url}/{resource}",
+                        headers=headers,
+                        params={"ids": ",".join(chunk), **(params or {})}
+                    )
+                    if response.status_code != 200:
+                        logger.error(f"Spotify bulk {resource} error: {response.status_code}")
+                        errors.append(response.status_code)
+                        failed.extend(chunk)
+                        return
+                    
+                    # Spotify 按请求顺序返回结果，未找到的 ID 对应 null
+                    items = response.json().get(resource, [])
+                    for spotify_id, item in zip(chunk, items):
+                        if item:
+                            results[spotify_id] = item
+                except httpx.TimeoutException:
+                    logger.error(f"Spotify bulk {resource} timeout after {self.timeout} seconds")
+                    errors.append("timeout")
+                    failed.extend(chunk)
+                except httpx.RequestError as e:
+                    logger.error(f"Spotify bulk {resource} network error: {str(e)}")
+                    errors.append("network")
+                    failed.extend(chunk)
+        
+        await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        
+        if len(errors) == len(chunks):
+            unavailable = all(error in ("timeout", "network", 429, 503) for error in errors)
+            raise HTTPException(
+                status_code=503 if unavailable else 502,
+                detail={
+                    "error": "Service unavailable" if unavailable else "Spotify API error",
+                    "message": f"All {len(chunks)} Spotify bulk {resource} requests failed",
+                    "errors": sorted({str(error) for error in errors}),
+                    "service": "Spotify"
+                }
+            )
+        
+        # 按请求顺序返回失败的 ID
+        failed_set = set(failed)
+        return results, [spotify_id for spotify_id in unique_ids if spotify_id in failed_set]
+    
+    async def get_artists_bulk(self, spotify_ids: List[str]) -> Tuple[Dict[str, SpotifyArtist], List[str]]:
+        """
+        批量获取艺术家信息 - 使用 /artists?ids= 接口，每次请求最多 50 个 ID
+        
+        Args:
+            spotify_ids: Spotify 艺术家 ID 列表
+            
+        Returns:
+            (Spotify ID -> 艺术家信息, 请求失败的 ID 列表)；Spotify 上不存在的 ID 两者都不包含
+            
+        Raises:
+            HTTPException: 需要请求的分块全部失败时（见 _fetch_bulk）
+        """
+        if settings.is_production and self.is_available():
+            # 已缓存的艺术家直接返回，只请求其余 ID，并回填单个艺术家缓存
+            artists: Dict[str, SpotifyArtist] = {}
+            for spotify_id in dict.fromkeys(spotify_ids):
+                cached = self._cache.get(("artist", spotify_id))
+                if cached is not None:
+                    artists[spotify_id] = cached
+            
+            missing_ids = [spotify_id for spotify_id in spotify_ids if spotify_id and spotify_id not in artists]
+            raw_artists, failed = await self._fetch_bulk("artists", missing_ids)
+            for spotify_id, data in raw_artists.items():
+                artist = self._parse_artist(data)
+                self._cache.set(("artist", spotify_id), artist, ttl=settings.SPOTIFY_ARTIST_CACHE_TTL)
+                artists[spotify_id] = artist
+            return artists, failed
+        
+        # 开发环境下逐个返回 Mock 数据
+        return {
+            spotify_id: await self.get_artist_info(spotify_id)
+            for spotify_id in dict.fromkeys(spotify_ids) if spotify_id
+        }, []
+    
+    async def get_tracks_bulk(self, spotify_ids: List[str], market: str = "JP") -> Tuple[Dict[str, SpotifyTrack], List[str]]:
+        """
+        批量获取曲目信息 - 使用 /tracks?ids= 接口，每次请求最多 50 个 ID
+        
+        Args:
+            spotify_ids: Spotify 曲目 ID 列表
+            market: 市场代码
+            
+        Returns:
+            (Spotify ID -> 曲目信息, 请求失败的 ID 列表)；Spotify 上不存在的 ID 两者都不包含
+            
+        Raises:
+            HTTPException: 所有分块都失败时（见 _fetch_bulk）
+        """
+        if not settings.is_production or not self.is_available():
+            logger.info(f"Using MOCK Spotify API, bulk track lookup for {len(spotify_ids)} IDs is not available")
+            return {}, []
+        
+        raw_tracks, failed = await self._fetch_bulk("tracks", spotify_ids, {"market": market})
+        return {spotify_id: self._parse_track(data) for spotify_id, data in raw_tracks.items()}, failed
+    
     async def create_playlist(self, spotify_id: str, request: SpotifyPlaylistRequest) -> SpotifyPlaylist:
         """
         创建播放列表 - 目前返回 Mock 数据
@@ -742,54 +931,73 @@ class SpotifyService:
             
             return results[:limit]
         
-        # 真实搜索实现
+        try:
+            return await self._search_artists_cached(query, limit, market)
+        except Exception as e:
+            logger.error(f"Spotify search error: {str(e)}")
+            return []
+    
+    async def _search_artists_cached(self, query: str, limit: int, market: str) -> List[Dict[str, Any]]:
+        """真实搜索实现（按查询、数量和市场缓存，失败时不缓存并抛出异常）"""
+        return await self._cache.get_or_load(
+            ("search", query.strip().lower(), limit, market),
+            lambda: self._search_artists_real(query, limit, market),
+            ttl=settings.SPOTIFY_SEARCH_CACHE_TTL
+        )
+    
+    async def _search_artists_real(self, query: str, limit: int, market: str) -> List[Dict[str, Any]]:
+        """调用 Spotify 搜索接口"""
         access_token = await self._get_access_token()
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(
-                    f"{self.api_url}/search",
-                    headers=headers,
-                    params={
-                        "q": query,
-                        "type": "artist",
-                        "limit": limit,
-                        "market": market
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    artists = data.get("artists", {}).get("items", [])
-                    
-                    results = []
-                    for artist in artists:
-                        results.append({
-                            "id": artist.get("id"),
-                            "name": artist.get("name"),
-                            "popularity": artist.get("popularity", 0),
-                            "genres": artist.get("genres", []),
-                            "external_urls": artist.get("external_urls", {}),
-                            "images": artist.get("images", [])
-                        })
-                    
-                    return results
-                else:
-                    logger.error(f"Spotify search API error: {response.status_code}")
-                    return []
-                    
-            except Exception as e:
-                logger.error(f"Spotify search error: {str(e)}")
-                return []
+        response = await self.http.get(
+            f"{self.api_url}/search",
+            headers=headers,
+            params={
+                "q": query,
+                "type": "artist",
+                "limit": limit,
+                "market": market
+            }
+        )
+        
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail={
+                    "error": "Spotify API error",
+                    "message": f"Spotify search API error: {response.status_code}",
+                    "service": "Spotify"
+                }
+            )
+        
+        data = response.json()
+        artists = data.get("artists", {}).get("items", [])
+        
+        results = []
+        for artist in artists:
+            results.append({
+                "id": artist.get("id"),
+                "name": artist.get("name"),
+                "popularity": artist.get("popularity", 0),
+                "genres": artist.get("genres", []),
+                "external_urls": artist.get("external_urls", {}),
+                "images": artist.get("images", [])
+            })
+        
+        return results
     
     def is_available(self) -> bool:
         """检查 Spotify 服务是否可用"""
         return bool(self.client_id and self.client_secret)
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """获取 Spotify 响应缓存统计信息"""
+        return self._cache.stats()
+    
     async def get_service_status(self) -> Dict[str, Any]:
         """
         获取服务状态信息
@@ -802,7 +1010,10 @@ class SpotifyService:
             "credentials_configured": bool(self.client_id and self.client_secret),
             "has_access_token": bool(self._access_token),
             "environment": settings.ENVIRONMENT,
-            "api_url": self.api_url
+            "api_url": self.api_url,
+            "cache": self._cache.stats(),
+            "single_flight": self._inflight.stats(),
+            "artist_id_resolution": dict(self._resolve_stats)
         }
         
         if self.is_available():
@@ -816,6 +1027,115 @@ class SpotifyService:
         
         return status
 
+    async def resolve_artist_id(self, artist_name: str, market: str = "JP", clean_name: bool = True) -> str:
+        """
+        将艺术家名称解析为 Spotify ID
+        
+        依次查找进程内缓存、数据库 artists.spotify_id，都没有时才调用 Spotify 搜索。
+        只有第一个搜索结果的名称与查询一致时才缓存并写回数据库中同名的艺术家，
+        否则该 ID 只用于本次调用。
+        
+        Args:
+            artist_name: 艺术家名称
+            market: 市场代码（仅用于搜索）
+            clean_name: 为 True 时先搜索清理后的名称（去掉括号、& 之后的部分），再搜索原名；
+                为 False 时先搜索原名，清理后的名称只作为后备
+            
+        Returns:
+            str: Spotify 艺术家 ID
+            
+        Raises:
+            HTTPException: 找不到艺术家时为 404，搜索失败时为上游错误
+        """
+        name = " ".join(artist_name.split())
+        if not settings.is_production or not self.is_available():
+            results = await self.search_artists(name, limit=5, market=market)
+            if not results:
+                raise self._artist_not_found(artist_name)
+            return results[0]["id"]
+        
+        key = ("artist_id", name.lower())
+        try:
+            return await self._inflight.do((key, clean_name), lambda: self._cache.get_or_load(
+                key,
+                lambda: self._resolve_artist_id(name, market, clean_name),
+                ttl=settings.SPOTIFY_ARTIST_ID_CACHE_TTL,
+                negative_if=_is_not_found
+            ))
+        except _UnconfirmedArtistMatch as e:
+            return e.spotify_id
+    
+    def prime_artist_ids(self, artists: Iterable[Dict[str, Any]]) -> int:
+        """
+        用数据库中已保存的 Spotify ID 预先填充名称解析缓存（生产服务器在 fork 前调用）
+        
+        Args:
+            artists: 含 name 和 spotify_id 的行
+            
+        Returns:
+            int: 写入缓存的条目数（不超过缓存容量的一半，避免挤掉其他数据）
+        """
+        limit = self._cache.max_size // 2
+        count = 0
+        for artist in artists:
+            name = " ".join((artist.get("name") or "").split())
+            if not name or not artist.get("spotify_id"):
+                continue
+            self._cache.set(("artist_id", name.lower()), artist["spotify_id"], ttl=settings.SPOTIFY_ARTIST_ID_CACHE_TTL)
+            count += 1
+            if count >= limit:
+                break
+        return count
+    
+    async def _resolve_artist_id(self, name: str, market: str, clean_name: bool) -> str:
+        stored = await artist_db_service.get_spotify_id_by_name(name)
+        if stored.get("success"):
+            self._resolve_stats["database"] += 1
+            return stored["data"]["spotify_id"]
+        
+        # 尝试清理艺术家名字以提高匹配率
+        # 例如 "ARTIST (Band Set)" -> "ARTIST"
+        # "ARTIST & OTHER" -> "ARTIST"
+        cleaned_name = name.split('(')[0].split('&')[0].split('（')[0].strip() or name
+        queries = [cleaned_name, name] if clean_name else [name, cleaned_name]
+        query = queries[0]
+        search_results = await self._search_artists_cached(query, 5, market)
+        if not search_results and queries[1] != query:
+            logger.info(f"Could not find '{query}', trying '{queries[1]}'")
+            query = queries[1]
+            search_results = await self._search_artists_cached(query, 5, market)
+        
+        # 假设第一个结果是最佳匹配
+        spotify_id = search_results[0].get("id") if search_results else None
+        if not spotify_id:
+            self._resolve_stats["not_found"] += 1
+            raise self._artist_not_found(name)
+        self._resolve_stats["search"] += 1
+        
+        # 第一个结果的名称与查询不一致时可能是别的艺术家，不缓存也不写回
+        if _normalize_name(search_results[0].get("name") or "") != _normalize_name(query):
+            self._resolve_stats["unconfirmed"] += 1
+            raise _UnconfirmedArtistMatch(spotify_id)
+        
+        # 数据库中有同名艺术家但还没有 Spotify ID 时写回，下次直接从数据库解析
+        if stored.get("error") == "Artist not found":
+            saved = await artist_db_service.set_spotify_id_by_name(name, spotify_id)
+            self._resolve_stats["written_back"] += saved.get("count", 0)
+            if saved.get("count"):
+                invalidate_versions()
+        return spotify_id
+    
+    @staticmethod
+    def _artist_not_found(artist_name: str) -> HTTPException:
+        return HTTPException(
+            status_code=404,
+            detail={
+                "error": "Artist not found",
+                "message": f"No artist found with name '{artist_name}'",
+                "service": "Spotify"
+            }
+        )
+    
     async def get_artist_by_name(self, artist_name: str) -> Dict[str, Any]:
         """通过艺术家姓名获取其 Spotify 信息"""
         if not self.is_available():
@@ -823,31 +1143,8 @@ class SpotifyService:
             artist_data = await self.get_mock_artist_data(artist_name)
             return artist_data.model_dump() if artist_data else {}
 
-        # 尝试清理艺术家名字以提高匹配率
-        # 例如 "ARTIST (Band Set)" -> "ARTIST"
-        # "ARTIST & OTHER" -> "ARTIST"
-        cleaned_name = artist_name.split('(')[0].split('&')[0].split('（')[0].strip()
-
         try:
-            # 优先使用清理过的名字搜索
-            search_results = await self.search_artists(cleaned_name)
-            
-            # 如果清理后的名字找不到，尝试使用原名
-            if not search_results:
-                logger.info(f"Could not find '{cleaned_name}', trying original name '{artist_name}'")
-                search_results = await self.search_artists(artist_name)
-
-            if not search_results:
-                logger.warning(f"No Spotify search results for '{artist_name}'")
-                return {}
-
-            # 假设第一个结果是最佳匹配
-            best_match = search_results[0]
-            spotify_id = best_match.get("id")
-
-            if not spotify_id:
-                logger.warning(f"No Spotify ID found for '{artist_name}'")
-                return {}
+            spotify_id = await self.resolve_artist_id(artist_name)
 
             # 获取完整的艺术家信息
             artist_info = await self.get_artist_info(spotify_id)
@@ -858,6 +1155,12 @@ class SpotifyService:
             # ** 关键修复：返回完整的模型数据 **
             return artist_info.model_dump()
 
+        except HTTPException as e:
+            if e.status_code == 404:
+                logger.warning(f"No Spotify search results for '{artist_name}'")
+            else:
+                logger.error(f"Error getting artist by name '{artist_name}': {e.detail}")
+            return {}
         except Exception as e:
             logger.error(f"Error getting artist by name '{artist_name}': {str(e)}")
             return {}
@@ -0,0 +1,44 @@
+"""
+启动预热 - 生产服务器在主进程 fork worker 之前调用
+
+预加载模式下，应用、模块级单例（如繁简转换表）和这里填充的缓存只在主进程构建一次，
+fork 后各 worker 以写时复制方式共享，不必每个 worker 各自查询数据库。
+预热只做同步操作，不创建事件循环或异步连接（这些必须在 worker 内创建）。
+"""
+import logging
+import time
+from typing import Any, Dict
+
+from config import settings
+from services.database_service import db_service
+from services.export_service import export_service
+from services.spotify_service import spotify_service
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up() -> Dict[str, Any]:
+    """
+    预热缓存
+
+    Returns:
+        各项预热的结果统计
+    """
+    started = time.perf_counter()
+    stats: Dict[str, Any] = {}
+
+    # 艺术家名称 -> Spotify ID：生产环境按名称查询 Spotify 时直接命中，不再查询数据库
+    if settings.is_production and db_service.is_connected():
+        try:
+            rows = (
+                row for row in export_service.iter_rows("artists", fields=["name", "spotify_id"])
+                if row.get("spotify_id")
+            )
+            stats["spotify_artist_ids"] = spotify_service.prime_artist_ids(rows)
+        except Exception as e:
+            logger.warning(f"Failed to warm Spotify artist ID cache: {str(e)}")
+            stats["spotify_artist_ids"] = 0
+
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(f"Warm-up finished: {stats}")
+    return stats
@@ -1,69 +1,67 @@
 """
 Wikipedia 服务 - 处理 Wikipedia API 相关逻辑
 """
+import asyncio
 import httpx
 import logging
-import time
+import re
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
+from urllib.parse import urlsplit
 from fastapi import HTTPException
 
 from config import settings
+from services.artist_bundle_service import artist_bundle_service
+from services.artist_db_service import artist_db_service
+from services.cache import TTLCache
+from services.chinese_converter import convert_traditional_to_simplified
+from services.http_client import UpstreamClient
+from services.response_versions import invalidate_versions
+from services.single_flight import SingleFlight
 from models.wikipedia import WikipediaData, WikiThumbnail, WikiReference
 
 logger = logging.getLogger(__name__)
 
-# 简单的内存缓存
-_wikipedia_cache = {}
-CACHE_DURATION = 3600  # 缓存1小时
+# MediaWiki action API 每次请求最多查询的标题数
+WIKIPEDIA_MAX_TITLES_PER_REQUEST = 50
+# 单个艺术家返回的外部链接（参考资料）数量上限
+WIKIPEDIA_MAX_REFERENCES = 20
 
-# 简单的繁体转简体字典（常用字符）
-TRADITIONAL_TO_SIMPLIFIED = {
-    '電': '电', '臺': '台', '司': '司', '令': '令', '來': '来', '自': '自', '英': '英', '國': '国',
-    '牛': '牛', '津': '津', '郡': '郡', '阿': '阿', '賓': '宾', '頓': '顿', '男': '男', '類': '类',
-    '搖': '摇', '滾': '滚', '樂': '乐', '團': '团', '組': '组', '建': '建', '於': '于', '年': '年',
-    '樂': '乐', '團': '团', '由': '由', '湯': '汤', '姆': '姆', '約': '约', '克': '克', '主': '主',
-    '唱': '唱', '吉': '吉', '他': '他', '鋼': '钢', '琴': '琴', '強': '强', '尼': '尼', '格': '格',
-    '林': '林', '伍': '伍', '德': '德', '委': '委', '吉': '吉', '他': '他', '鍵': '键', '盤': '盘',
-    '其': '其', '他': '他', '樂': '乐', '器': '器', '艾': '艾', '德': '德', '歐': '欧', '布': '布',
-    '萊': '莱', '恩': '恩', '吉': '吉', '他': '他', '合': '合', '聲': '声', '科': '科', '林': '林',
-    '格': '格', '林': '林', '伍': '伍', '德': '德', '貝': '贝', '斯': '斯', '與': '与', '菲': '菲',
-    '利': '利', '普': '普', '塞': '塞', '爾': '尔', '章': '章', '鼓': '鼓', '打': '打', '擊': '击',
-    '樂': '乐', '器': '器', '組': '组', '成': '成', '樂': '乐', '隊': '队', '風': '风', '格': '格',
-    '實': '实', '驗': '验', '性': '性', '搖': '摇', '滾': '滚', '電': '电', '子': '子', '音': '音',
-    '樂': '乐', '藝': '艺', '術': '术', '搖': '摇', '滾': '滚', '另': '另', '類': '类', '搖': '摇',
-    '滾': '滚', '後': '后', '搖': '摇', '滾': '滚', '等': '等', '多': '多', '種': '种', '風': '风',
-    '格': '格', '融': '融', '合': '合', '創': '创', '作': '作', '出': '出', '獨': '独', '特': '特',
-    '音': '音', '樂': '乐', '風': '风', '格': '格', '專': '专', '輯': '辑', '發': '发', '行': '行',
-    '後': '后', '獲': '获', '得': '得', '廣': '广', '泛': '泛', '讚': '赞', '譽': '誉', '並': '并',
-    '確': '确', '立': '立', '樂': '乐', '壇': '坛', '地': '地', '位': '位', '樂': '乐', '團': '团',
-    '持': '持', '續': '续', '創': '创', '新': '新', '實': '实', '驗': '验', '音': '音', '樂': '乐',
-    '風': '风', '格': '格', '影': '影', '響': '响', '無': '无', '數': '数', '後': '后', '輩': '辈',
-    '音': '音', '樂': '乐', '人': '人', '被': '被', '認': '认', '為': '为', '當': '当', '代': '代',
-    '最': '最', '重': '重', '要': '要', '樂': '乐', '團': '团', '之': '之', '一': '一', '樂': '乐',
-    '團': '团', '作': '作', '品': '品', '深': '深', '受': '受', '樂': '乐', '迷': '迷', '喜': '喜',
-    '愛': '爱', '並': '并', '在': '在', '全': '全', '球': '球', '範': '范', '圍': '围', '內': '内',
-    '擁': '拥', '有': '有', '龐': '庞', '大': '大', '粉': '粉', '絲': '丝', '群': '群', '體': '体'
-}
+# Wikipedia 响应缓存（所有 WikipediaService 实例共享）
+_wikipedia_cache = TTLCache(
+    "wikipedia",
+    max_size=settings.WIKIPEDIA_CACHE_MAX_SIZE,
+    ttl=settings.WIKIPEDIA_CACHE_TTL,
+    negative_ttl=settings.WIKIPEDIA_NEGATIVE_CACHE_TTL,
+    stale_ttl=settings.WIKIPEDIA_CACHE_STALE_TTL,
+    refresh_ahead=settings.WIKIPEDIA_CACHE_REFRESH_AHEAD
+)
 
-def convert_traditional_to_simplified(text: str) -> str:
-    """
-    将繁体中文转换为简体中文
-    
-    Args:
-        text: 包含繁体中文的文本
-        
-    Returns:
-        str: 转换后的简体中文文本
-    """
-    if not text:
-        return text
-        
-    result = ""
-    for char in text:
-        # 如果字符在转换字典中，使用简体字符，否则保持原字符
-        result += TRADITIONAL_TO_SIMPLIFIED.get(char, char)
-    
-    return result
+
+def _is_cacheable_failure(error: Exception) -> bool:
+    """页面不存在（404）和超时（408）的结果进入负缓存，避免反复等待上游"""
+    return isinstance(error, HTTPException) and error.status_code in (404, 408)
+
+
+def get_wikipedia_cache_stats() -> Dict[str, Any]:
+    """获取 Wikipedia 缓存统计信息"""
+    return _wikipedia_cache.stats()
+
+
+_KANA_RE = re.compile(r"[\u3040-\u30ff]")
+_HANGUL_RE = re.compile(r"[\uac00-\ud7af]")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
+
+def _guess_extract_language(extract: str) -> str:
+    """推断没有记录语言的旧数据库副本的语言（假名 -> ja，谚文 -> ko，汉字 -> zh，其他 -> en）"""
+    if _KANA_RE.search(extract):
+        return "ja"
+    if _HANGUL_RE.search(extract):
+        return "ko"
+    if _CJK_RE.search(extract):
+        return "zh"
+    return "en"
 
 class WikipediaService:
     """Wikipedia API 服务类"""
@@ -72,6 +70,17 @@ class WikipediaService:
         self.timeout = settings.WIKIPEDIA_TIMEOUT  # 使用专门的Wikipedia超时配置
         self.retries = settings.HTTP_RETRIES
         self.user_agent = settings.WIKIPEDIA_USER_AGENT
+        # 共享连接池与限流；可选对冲请求降低长尾延迟
+        self.http = UpstreamClient(
+            "wikipedia",
+            timeout=self.timeout,
+            cache_ttl=settings.WIKIPEDIA_HTTP_CACHE_TTL,
+            hedge=settings.WIKIPEDIA_HEDGE_REQUESTS
+        )
+        self._inflight = SingleFlight("wikipedia")  # 合并相同艺术家的并发请求
+        # 数据库副本的后台刷新任务（按艺术家ID去重）
+        self._db_refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._db_stats = {"fresh": 0, "stale": 0, "miss": 0, "refreshed": 0, "refresh_failed": 0}
     
     async def get_mock_data(self, artist_name: str, language: str) -> WikipediaData:
         """获取 Mock 数据"""
@@ -134,130 +143,379 @@ class WikipediaService:
         )
     
     async def get_real_data(self, artist_name: str, language: str) -> WikipediaData:
-        """获取真实 Wikipedia 数据"""
+        """
+        获取真实 Wikipedia 数据
+        
+        摘要、缩略图、分类和外部链接通过一次 action API 查询获取（自动跟随重定向）。
+        """
         logger.info(f"Using REAL Wikipedia API for {artist_name} in {language}")
         
-        base_url = f"https://{language}.wikipedia.org/api/rest_v1"
+        api_url = f"{self._site_url(language)}/w/api.php"
         headers = {
             "User-Agent": self.user_agent,
             "Accept": "application/json"
         }
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": 2,
+            "titles": artist_name,
+            "prop": "extracts|categories|extlinks|pageimages",
+            "exintro": 1,
+            "explaintext": 1,
+            "clshow": "!hidden",
+            "cllimit": "max",
+            "ellimit": WIKIPEDIA_MAX_REFERENCES,
+            "piprop": "thumbnail",
+            "pithumbsize": 500,
+            "redirects": 1,
+            "maxlag": settings.WIKIPEDIA_MAXLAG
+        }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                # 获取页面摘要
-                summary_response = await client.get(
-                    f"{base_url}/page/summary/{artist_name}",
-                    headers=headers
-                )
-                
-                if summary_response.status_code == 404:
-                    raise HTTPException(
-                        status_code=404,
-                        detail={
-                            "error": "Artist not found",
-                            "message": f"Wikipedia page for '{artist_name}' not found in {language}",
-                            "suggestion": "Try searching with a different name or language"
-                        }
-                    )
-                elif summary_response.status_code != 200:
-                    raise HTTPException(
-                        status_code=summary_response.status_code,
-                        detail={
-                            "error": "Wikipedia API error",
-                            "message": f"Failed to fetch data from Wikipedia: {summary_response.text}",
-                            "status_code": summary_response.status_code
-                        }
-                    )
-                
-                summary_data = summary_response.json()
-                
-                # 解析缩略图
-                thumbnail = None
-                if summary_data.get("thumbnail"):
-                    thumbnail_data = summary_data["thumbnail"]
-                    thumbnail = WikiThumbnail(
-                        source=thumbnail_data["source"],
-                        width=thumbnail_data["width"],
-                        height=thumbnail_data["height"]
-                    )
-                
-                # 获取页面分类（可选）
-                categories = await self._get_page_categories(client, base_url, artist_name, headers)
-                
-                # 获取外部链接作为参考资料（可选）
-                references = await self._get_page_references(client, base_url, artist_name, headers)
-                
-                return WikipediaData(
-                    title=summary_data.get("title", artist_name),
-                    extract=convert_traditional_to_simplified(summary_data.get("extract", "No description available")),
-                    thumbnail=thumbnail,
-                    categories=categories,
-                    references=references
-                )
-                
-            except httpx.TimeoutException:
-                logger.error(f"Wikipedia API timeout for {artist_name}")
+        try:
+            response = await self.http.get(api_url, params=params, headers=headers)
+            
+            if response.status_code != 200:
                 raise HTTPException(
-                    status_code=408,
+                    status_code=response.status_code,
                     detail={
-                        "error": "Request timeout",
-                        "message": f"Wikipedia API request timeout after {self.timeout} seconds",
-                        "retry_suggestion": "Please try again later"
+                        "error": "Wikipedia API error",
+                        "message": f"Failed to fetch data from Wikipedia: {response.text}",
+                        "status_code": response.status_code
                     }
                 )
-            except httpx.RequestError as e:
-                logger.error(f"Wikipedia API network error: {str(e)}")
+            
+            payload = response.json()
+            self._raise_for_api_error(payload)
+            pages = payload.get("query", {}).get("pages", [])
+            page = pages[0] if pages else None
+            if not page or page.get("missing") or page.get("invalid") or not page.get("extract"):
                 raise HTTPException(
-                    status_code=503,
+                    status_code=404,
                     detail={
-                        "error": "Network error",
-                        "message": f"Failed to connect to Wikipedia API: {str(e)}",
-                        "service": "Wikipedia"
+                        "error": "Artist not found",
+                        "message": f"Wikipedia page for '{artist_name}' not found in {language}",
+                        "suggestion": "Try searching with a different name or language"
                     }
                 )
-            except HTTPException:
-                # 重新抛出已处理的 HTTP 异常
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error in Wikipedia service: {str(e)}")
-                raise HTTPException(
-                    status_code=500,
-                    detail={
-                        "error": "Internal server error",
-                        "message": "An unexpected error occurred while processing Wikipedia data",
-                        "details": str(e)
-                    }
+            
+            # 解析缩略图
+            thumbnail = None
+            if page.get("thumbnail"):
+                thumbnail_data = page["thumbnail"]
+                thumbnail = WikiThumbnail(
+                    source=thumbnail_data["source"],
+                    width=thumbnail_data["width"],
+                    height=thumbnail_data["height"]
                 )
-    
-    async def _get_page_categories(self, client: httpx.AsyncClient, base_url: str, 
-                                 page_title: str, headers: Dict[str, str]) -> List[str]:
-        """获取页面分类"""
-        try:
-            # TODO: 实现页面分类获取逻辑
-            # Wikipedia API 需要额外的调用来获取分类信息
-            # 这里返回空列表，可以后续实现
-            return []
+            
+            return WikipediaData(
+                title=page.get("title", artist_name),
+                extract=self._normalize_extract(page["extract"], language),
+                thumbnail=thumbnail,
+                categories=self._parse_categories(page, language),
+                references=self._parse_references(page)
+            )
+            
+        except httpx.TimeoutException:
+            logger.error(f"Wikipedia API timeout for {artist_name}")
+            raise HTTPException(
+                status_code=408,
+                detail={
+                    "error": "Request timeout",
+                    "message": f"Wikipedia API request timeout after {self.timeout} seconds",
+                    "retry_suggestion": "Please try again later"
+                }
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Wikipedia API network error: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail={
+                    "error": "Network error",
+                    "message": f"Failed to connect to Wikipedia API: {str(e)}",
+                    "service": "Wikipedia"
+                }
+            )
+        except HTTPException:
+            # 重新抛出已处理的 HTTP 异常
+            raise
         except Exception as e:
-            logger.warning(f"Failed to get categories for {page_title}: {str(e)}")
-            return []
+            logger.error(f"Unexpected error in Wikipedia service: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "Internal server error",
+                    "message": "An unexpected error occurred while processing Wikipedia data",
+                    "details": str(e)
+                }
+            )
+
+    @staticmethod
+    def _site_url(language: str) -> str:
+        """指定语言的 Wikipedia 站点地址（WIKIPEDIA_SITE_URL 可指向本地模拟服务）"""
+        return settings.WIKIPEDIA_SITE_URL.format(language=language).rstrip("/")
+
+    @staticmethod
+    def _raise_for_api_error(payload: Dict[str, Any]) -> None:
+        """
+        action API 的错误以 HTTP 200 + error 字段返回（如重试用尽后仍为 maxlag），
+        按 503 抛出：不是页面不存在，不能进入负缓存
+        """
+        error = payload.get("error")
+        if not error:
+            return
+        code = error.get("code") if isinstance(error, dict) else str(error)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "Wikipedia API error",
+                "message": f"Wikipedia API returned error '{code}'",
+                "code": code,
+                "service": "Wikipedia"
+            }
+        )
+    
+    @staticmethod
+    def _normalize_extract(extract: str, language: str) -> str:
+        """中文维基的摘要统一转为简体；其他语言保持原文（日文汉字不能按繁简转换）"""
+        if language == "zh":
+            return convert_traditional_to_simplified(extract)
+        return extract
+
+    @classmethod
+    def _parse_categories(cls, page: Dict[str, Any], language: str) -> List[str]:
+        """页面分类名称（去掉 "Category:" 等命名空间前缀，已排除隐藏的维护分类）"""
+        categories = []
+        for category in page.get("categories", []):
+            title = category.get("title", "")
+            name = title.split(":", 1)[1] if ":" in title else title
+            if name:
+                categories.append(cls._normalize_extract(name, language))
+        return categories
     
-    async def _get_page_references(self, client: httpx.AsyncClient, base_url: str, 
-                                 page_title: str, headers: Dict[str, str]) -> List[WikiReference]:
-        """获取页面参考资料"""
+    @staticmethod
+    def _parse_references(page: Dict[str, Any]) -> List[WikiReference]:
+        """把页面外部链接转换为参考资料（标题为链接的域名）"""
+        references = []
+        seen = set()
+        for link in page.get("extlinks", []):
+            url = link.get("url", "")
+            if url.startswith("//"):
+                url = f"https:{url}"
+            host = urlsplit(url).hostname
+            if not host or url in seen:
+                continue
+            seen.add(url)
+            references.append(WikiReference(title=host.removeprefix("www."), url=url))
+        return references[:WIKIPEDIA_MAX_REFERENCES]
+    
+    async def find_artist(self, variations: List[str], languages: Optional[List[str]] = None,
+                          min_extract_length: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        并发查找艺术家的 Wikipedia 页面（多语言 × 多个名称变体）
+        
+        所有候选按 languages、variations 的顺序确定优先级，并发请求（受 WIKIPEDIA_LOOKUP_CONCURRENCY 限制）。
+        只有当优先级更高的候选都已失败时才采用后面的结果，因此多个候选同时成功时结果是确定的；
+        确定结果后立即取消其余未完成的请求。
+        
+        Args:
+            variations: 名称变体（按优先级排列）
+            languages: 语言代码（按优先级排列），默认为 ["en"]
+            min_extract_length: 摘要的最小长度，默认使用 WIKIPEDIA_MIN_EXTRACT_LENGTH
+            
+        Returns:
+            {"data": WikipediaData, "language": 语言, "search_term": 命中的变体}，全部未找到时返回 None
+        """
+        languages = languages or ["en"]
+        if min_extract_length is None:
+            min_extract_length = settings.WIKIPEDIA_MIN_EXTRACT_LENGTH
+        terms = list(dict.fromkeys(v.strip() for v in variations if v and v.strip()))
+        candidates = [(language, term) for language in languages for term in terms]
+        if not candidates:
+            return None
+        
+        semaphore = asyncio.Semaphore(settings.WIKIPEDIA_LOOKUP_CONCURRENCY)
+        
+        async def attempt(language: str, term: str) -> Optional[WikipediaData]:
+            async with semaphore:
+                try:
+                    data = await _wikipedia_cache.get_or_load(
+                        (term, language),
+                        lambda: self.get_real_data(term, language),
+                        negative_if=_is_cacheable_failure
+                    )
+                except Exception as e:
+                    logger.debug(f"Wikipedia lookup failed for '{term}' in {language}: {str(e)}")
+                    return None
+            if data.extract and len(data.extract.strip()) >= min_extract_length:
+                return data
+            return None
+        
+        tasks = [asyncio.create_task(attempt(language, term)) for language, term in candidates]
         try:
-            # TODO: 实现参考资料获取逻辑
-            # 可以通过获取页面的外部链接来作为参考资料
-            # 这里返回空列表，可以后续实现
-            return []
-        except Exception as e:
-            logger.warning(f"Failed to get references for {page_title}: {str(e)}")
-            return []
+            pending = set(tasks)
+            next_index = 0
+            while pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # 按优先级顺序检查已完成的候选
+                while next_index < len(tasks) and tasks[next_index].done():
+                    data = tasks[next_index].result()
+                    if data is not None:
+                        language, term = candidates[next_index]
+                        logger.info(f"Found Wikipedia page '{data.title}' via '{term}' in {language}")
+                        return {"data": data, "language": language, "search_term": term}
+                    next_index += 1
+            return None
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def get_artists_bulk(self, artist_names: List[str], language: str = "en") -> Dict[str, WikipediaData]:
+        """
+        批量获取艺术家的 Wikipedia 摘要（MediaWiki action API，每次请求最多 50 个标题）
+        
+        一次请求同时返回摘要、缩略图和页面属性，并自动解析重定向和标题规范化。
+        已缓存的艺术家（完整信息或摘要）不会重复请求。批量结果不含分类和参考资料，
+        单独缓存在 ("summary", 名称, 语言) 下，不会被 get_artist_info 当作完整信息返回。
+        
+        Args:
+            artist_names: 艺术家名称列表
+            language: 语言代码
+            
+        Returns:
+            Dict[str, WikipediaData]: 请求的名称 -> Wikipedia 数据（未找到的页面、消歧义页不包含在内）
+        """
+        results: Dict[str, WikipediaData] = {}
+        pending: List[str] = []
+        for name in dict.fromkeys(artist_names):
+            if not name or "|" in name:
+                continue
+            cached = _wikipedia_cache.get((name, language))
+            if cached is None:
+                cached = _wikipedia_cache.get(("summary", name, language))
+            if cached is not None:
+                results[name] = cached
+            else:
+                pending.append(name)
+        
+        if not pending:
+            return results
+        
+        chunks = [
+            pending[i:i + WIKIPEDIA_MAX_TITLES_PER_REQUEST]
+            for i in range(0, len(pending), WIKIPEDIA_MAX_TITLES_PER_REQUEST)
+        ]
+        semaphore = asyncio.Semaphore(settings.WIKIPEDIA_BULK_CONCURRENCY)
+        
+        async def fetch_chunk(titles: List[str]) -> Dict[str, WikipediaData]:
+            async with semaphore:
+                try:
+                    return await self._query_summaries(titles, language)
+                except Exception as e:
+                    logger.error(f"Wikipedia bulk fetch failed for {len(titles)} titles in {language}: {str(e)}")
+                    return {}
+        
+        for chunk_results in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+            for name, data in chunk_results.items():
+                _wikipedia_cache.set(("summary", name, language), data)
+                results[name] = data
+        
+        logger.info(f"Wikipedia bulk fetch ({language}): {len(results)}/{len(artist_names)} found with {len(chunks)} queries")
+        return results
+    
+    async def _query_summaries(self, titles: List[str], language: str) -> Dict[str, WikipediaData]:
+        """用一次 action API 查询（含 continue 分页）获取最多 50 个标题的摘要"""
+        api_url = f"{self._site_url(language)}/w/api.php"
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "application/json"
+        }
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": 2,
+            "titles": "|".join(titles),
+            "prop": "extracts|pageimages|pageprops",
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": "max",
+            "piprop": "thumbnail",
+            "pithumbsize": 500,
+            "pilimit": WIKIPEDIA_MAX_TITLES_PER_REQUEST,
+            "ppprop": "disambiguation|wikibase_item",
+            "redirects": 1,
+            "maxlag": settings.WIKIPEDIA_MAXLAG
+        }
+        
+        pages: Dict[str, Dict[str, Any]] = {}
+        aliases: Dict[str, str] = {}
+        continuation: Dict[str, Any] = {}
+        while True:
+            response = await self.http.get(api_url, params={**params, **continuation}, headers=headers)
+            if response.status_code != 200:
+                raise HTTPException(
+                    status_code=response.status_code,
+                    detail={
+                        "error": "Wikipedia API error",
+                        "message": f"Failed to fetch data from Wikipedia: {response.status_code}",
+                        "status_code": response.status_code
+                    }
+                )
+            data = response.json()
+            self._raise_for_api_error(data)
+            query = data.get("query", {})
+            # 标题规范化、繁简转换和重定向：原标题 -> 目标标题
+            for key in ("normalized", "converted", "redirects"):
+                for item in query.get(key, []):
+                    aliases[item["from"]] = item["to"]
+            # extracts 每次最多返回 20 条，其余通过 continue 分页，按页面合并
+            for page in query.get("pages", []):
+                merged = pages.setdefault(page["title"], {})
+                for field, value in page.items():
+                    if value or field not in merged:
+                        merged[field] = value
+            if "continue" not in data:
+                break
+            continuation = data["continue"]
+        
+        results: Dict[str, WikipediaData] = {}
+        for name in titles:
+            title = name
+            for _ in range(3):
+                if title not in aliases:
+                    break
+                title = aliases[title]
+            page = pages.get(title)
+            if not page or page.get("missing") or page.get("invalid"):
+                continue
+            if "disambiguation" in page.get("pageprops", {}):
+                logger.debug(f"Skipping disambiguation page '{title}' for '{name}'")
+                continue
+            extract = page.get("extract")
+            if not extract:
+                continue
+            
+            thumbnail = None
+            if page.get("thumbnail"):
+                thumbnail = WikiThumbnail(
+                    source=page["thumbnail"]["source"],
+                    width=page["thumbnail"]["width"],
+                    height=page["thumbnail"]["height"]
+                )
+            results[name] = WikipediaData(
+                title=page["title"],
+                extract=self._normalize_extract(extract, language),
+                thumbnail=thumbnail
+            )
+        return results
     
     async def get_artist_info(self, artist_name: str, language: str = "en") -> WikipediaData:
         """
         获取艺术家信息 - 优先使用真实数据，失败时回退到 Mock 数据
-        支持缓存以提高性能
+        支持缓存以提高性能，同一艺术家的并发请求只会访问一次上游
         
         Args:
             artist_name: 艺术家名称
@@ -269,29 +527,18 @@ class WikipediaService:
         Raises:
             HTTPException: 当所有方法都失败时
         """
-        # 检查缓存
-        cache_key = f"{artist_name}_{language}"
-        current_time = time.time()
-        
-        if cache_key in _wikipedia_cache:
-            cached_data, cached_time = _wikipedia_cache[cache_key]
-            if current_time - cached_time < CACHE_DURATION:
-                logger.info(f"Using cached Wikipedia data for {artist_name}")
-                return cached_data
-            else:
-                # 缓存过期，删除旧数据
-                del _wikipedia_cache[cache_key]
-        
+        flight_key = (" ".join(artist_name.split()).lower(), language)
+        return await self._inflight.do(flight_key, lambda: self._load_artist_info(artist_name, language))
+    
+    async def _load_artist_info(self, artist_name: str, language: str) -> WikipediaData:
+        """读取缓存或从上游加载艺术家信息（由 get_artist_info 合并调用）"""
         try:
-            # 首先尝试获取真实数据
-            logger.info(f"Attempting to fetch real Wikipedia data for {artist_name}")
-            result = await self.get_real_data(artist_name, language)
-            
-            # 缓存成功的结果
-            _wikipedia_cache[cache_key] = (result, current_time)
-            logger.info(f"Cached Wikipedia data for {artist_name}")
-            
-            return result
+            # 首先尝试获取真实数据（缓存命中、负缓存命中时不访问上游）
+            return await _wikipedia_cache.get_or_load(
+                (artist_name, language),
+                lambda: self.get_real_data(artist_name, language),
+                negative_if=_is_cacheable_failure
+            )
         except (httpx.TimeoutException, httpx.RequestError, HTTPException) as e:
             # 网络错误或超时时，回退到 Mock 数据
             logger.warning(f"Failed to fetch real Wikipedia data for {artist_name}: {str(e)}")
@@ -327,6 +574,99 @@ class WikipediaService:
                     }
                 )
     
+    async def get_artist_info_db_first(self, artist_name: str, language: str = "en") -> WikipediaData:
+        """
+        获取艺术家信息 - 优先使用数据库中保存的副本（artists.wiki_data）
+        
+        副本语言与请求一致时直接返回，不访问上游；副本超过 WIKIPEDIA_DB_MAX_AGE 时
+        仍返回旧副本，同时在后台从 Wikipedia 刷新并写回数据库。
+        数据库中没有该语言的副本时使用 get_artist_info。
+        
+        Args:
+            artist_name: 艺术家名称
+            language: 语言代码 (zh, en, ja, ko)
+            
+        Returns:
+            WikipediaData: 艺术家的 Wikipedia 信息
+        """
+        if settings.WIKIPEDIA_DB_MAX_AGE > 0:
+            stored = await artist_db_service.get_artist_wiki_by_name(artist_name)
+            if stored.get("success"):
+                artist = stored["data"]
+                data = self._stored_wiki_data(artist, language)
+                if data is not None:
+                    if self._is_db_copy_stale(artist.get("wiki_last_updated")):
+                        self._db_stats["stale"] += 1
+                        self._schedule_db_refresh(artist["id"], data.title, language)
+                    else:
+                        self._db_stats["fresh"] += 1
+                    return data
+        
+        self._db_stats["miss"] += 1
+        return await self.get_artist_info(artist_name, language)
+    
+    @staticmethod
+    def _stored_wiki_data(artist: Dict[str, Any], language: str) -> Optional[WikipediaData]:
+        """把数据库副本转换为 WikipediaData，副本为空或语言不一致时返回 None"""
+        wiki_data = artist.get("wiki_data") or {}
+        extract = wiki_data.get("extract") or artist.get("wiki_extract")
+        if not extract or not wiki_data.get("title"):
+            return None
+        if (wiki_data.get("language") or _guess_extract_language(extract)) != language:
+            return None
+        try:
+            return WikipediaData.model_validate({**wiki_data, "extract": extract})
+        except ValueError as e:
+            logger.warning(f"Invalid stored Wikipedia data for artist {artist.get('id')}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _is_db_copy_stale(last_updated: Optional[str]) -> bool:
+        if not last_updated:
+            return True
+        try:
+            updated_at = datetime.fromisoformat(last_updated.replace("Z", "+00:00"))
+        except ValueError:
+            return True
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - updated_at).total_seconds() > settings.WIKIPEDIA_DB_MAX_AGE
+    
+    def _schedule_db_refresh(self, artist_id: str, title: str, language: str) -> None:
+        """在后台刷新数据库副本（同一艺术家同时只有一个刷新任务）"""
+        if artist_id in self._db_refresh_tasks:
+            return
+        task = asyncio.create_task(self._refresh_db_copy(artist_id, title, language))
+        self._db_refresh_tasks[artist_id] = task
+        task.add_done_callback(lambda _: self._db_refresh_tasks.pop(artist_id, None))
+    
+    async def _refresh_db_copy(self, artist_id: str, title: str, language: str) -> None:
+        try:
+            # 直接请求上游（不经过响应缓存，也不回退到 Mock 数据）
+            data = await self.get_real_data(title, language)
+            result = await artist_db_service.update_artist_wikipedia_data(
+                artist_id,
+                {**data.model_dump(), "language": language},
+                data.extract
+            )
+            if not result.get("success"):
+                raise RuntimeError(result.get("error"))
+            invalidate_versions()
+            artist_bundle_service.invalidate(artist_id)
+            self._db_stats["refreshed"] += 1
+        except Exception as e:
+            self._db_stats["refresh_failed"] += 1
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            logger.warning(f"Failed to refresh stored Wikipedia data for artist {artist_id} ('{title}'): {detail}")
+    
+    def get_db_copy_stats(self) -> Dict[str, Any]:
+        """获取数据库副本读取统计"""
+        return {
+            "max_age": settings.WIKIPEDIA_DB_MAX_AGE,
+            "refreshing": len(self._db_refresh_tasks),
+            **self._db_stats
+        }
+    
     async def search_artists(self, query: str, language: str = "zh", limit: int = 10) -> List[Dict[str, Any]]:
         """
         搜索艺术家
@@ -352,47 +692,46 @@ class WikipediaService:
             ]
         
         # 真实搜索实现
-        base_url = f"https://{language}.wikipedia.org/api/rest_v1"
         headers = {
             "User-Agent": self.user_agent,
             "Accept": "application/json"
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                # TODO: 实现真实的 Wikipedia 搜索 API 调用
-                # 使用 Wikipedia 的搜索 API
-                search_response = await client.get(
-                    f"https://{language}.wikipedia.org/w/api.php",
-                    params={
-                        "action": "query",
-                        "format": "json",
-                        "list": "search",
-                        "srsearch": query,
-                        "srlimit": limit
-                    },
-                    headers=headers
-                )
+        try:
+            # TODO: 实现真实的 Wikipedia 搜索 API 调用
+            # 使用 Wikipedia 的搜索 API
+            search_response = await self.http.get(
+                f"{self._site_url(language)}/w/api.php",
+                params={
+                    "action": "query",
+                    "format": "json",
+                    "list": "search",
+                    "srsearch": query,
+                    "srlimit": limit,
+                    "maxlag": settings.WIKIPEDIA_MAXLAG
+                },
+                headers=headers
+            )
+            
+            if search_response.status_code == 200:
+                search_data = search_response.json()
+                results = []
+                
+                for item in search_data.get("query", {}).get("search", []):
+                    results.append({
+                        "title": item.get("title", ""),
+                        "description": item.get("snippet", "").replace("<span class=\"searchmatch\">", "").replace("</span>", ""),
+                        "url": f"https://{language}.wikipedia.org/wiki/{item.get('title', '').replace(' ', '_')}"
+                    })
                 
-                if search_response.status_code == 200:
-                    search_data = search_response.json()
-                    results = []
-                    
-                    for item in search_data.get("query", {}).get("search", []):
-                        results.append({
-                            "title": item.get("title", ""),
-                            "description": item.get("snippet", "").replace("<span class=\"searchmatch\">", "").replace("</span>", ""),
-                            "url": f"https://{language}.wikipedia.org/wiki/{item.get('title', '').replace(' ', '_')}"
-                        })
-                    
-                    return results
-                else:
-                    logger.error(f"Wikipedia search API error: {search_response.status_code}")
-                    return []
-                    
-            except Exception as e:
-                logger.error(f"Wikipedia search error: {str(e)}")
+                return results
+            else:
+                logger.error(f"Wikipedia search API error: {search_response.status_code}")
                 return []
+                
+        except Exception as e:
+            logger.error(f"Wikipedia search error: {str(e)}")
+            return []
 
 # 创建全局实例供其他模块使用
 wikipedia_service = WikipediaService() 
\ No newline at end of file
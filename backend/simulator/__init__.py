@@ -0,0 +1,3 @@
+"""
+本地上游模拟服务（离线压测用），启动方式：在 backend 目录下运行 python -m simulator
+"""
@@ -0,0 +1,30 @@
+"""
+启动本地上游模拟服务
+
+    cd backend && python -m simulator
+
+监听地址由 SIMULATOR_HOST / SIMULATOR_PORT 配置（默认 127.0.0.1:8900），
+启动时打印让后端服务指向模拟服务所需的环境变量。
+"""
+import os
+
+import uvicorn
+
+
+def main():
+    host = os.getenv("SIMULATOR_HOST", "127.0.0.1")
+    port = int(os.getenv("SIMULATOR_PORT", "8900"))
+    base = f"http://{host}:{port}"
+    print("Upstream simulator environment for the backend:")
+    print("  ENVIRONMENT=production")
+    print("  SPOTIFY_CLIENT_ID=simulator SPOTIFY_CLIENT_SECRET=simulator")
+    print(f"  SPOTIFY_API_URL={base}/spotify/v1")
+    print(f"  SPOTIFY_AUTH_URL={base}/spotify/api/token")
+    print(f"  WIKIPEDIA_SITE_URL={base}/wikipedia/{{language}}")
+    print(f"  ITUNES_API_URL={base}/itunes/search")
+    print(f"  DEEPSEEK_API_URL={base}/deepseek")
+    uvicorn.run("simulator.app:app", host=host, port=port, log_level=os.getenv("SIMULATOR_LOG_LEVEL", "warning"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+本地上游模拟服务 - 用与真实上游相同的路径提供 Spotify、Wikipedia、iTunes、DeepSeek 接口
+
+各服务的 Mock 分支完全不经过 HTTP，无法用来压测真实代码路径（限流、缓存、熔断、对冲等）。
+把各服务的上游地址指向本服务后，真实 HTTP 代码路径可以在离线环境下压测：
+
+    SPOTIFY_API_URL=http://127.0.0.1:8900/spotify/v1
+    SPOTIFY_AUTH_URL=http://127.0.0.1:8900/spotify/api/token
+    WIKIPEDIA_SITE_URL=http://127.0.0.1:8900/wikipedia/{language}
+    ITUNES_API_URL=http://127.0.0.1:8900/itunes/search
+    DEEPSEEK_API_URL=http://127.0.0.1:8900/deepseek
+
+Spotify 只在生产模式下调用真实接口，还需要设置 ENVIRONMENT=production 和任意的
+SPOTIFY_CLIENT_ID / SPOTIFY_CLIENT_SECRET。
+
+每个上游的延迟分布、错误率和 429 比例可以通过环境变量配置（SIMULATOR_<UPSTREAM>_* 优先于
+SIMULATOR_*），也可以在运行时通过 PUT /_simulator/profiles/{upstream} 修改。
+响应内容由请求参数确定性生成；延迟和故障由按上游独立的随机数生成器产生，SIMULATOR_SEED 相同时可复现。
+"""
+import asyncio
+import os
+import random
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+
+from simulator import fixtures
+
+UPSTREAMS = ("spotify", "wikipedia", "itunes", "deepseek")
+DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+# 各上游的默认延迟中位数（毫秒），大致与真实上游相当
+DEFAULT_LATENCY_MS = {
+    "spotify": 120.0,
+    "wikipedia": 150.0,
+    "itunes": 250.0,
+    "deepseek": 1500.0,
+}
+
+
+@dataclass
+class UpstreamProfile:
+    """单个上游的延迟和故障配置"""
+    latency_ms: float = 100.0       # 延迟中位数（毫秒）
+    distribution: str = "lognormal"  # fixed / uniform / lognormal
+    sigma: float = 0.5              # lognormal 的形状参数；uniform 时为相对中位数的抖动幅度
+    error_rate: float = 0.0         # 返回 500 的比例
+    throttle_rate: float = 0.0      # 返回 429 的比例
+    retry_after: float = 1.0        # 429 响应的 Retry-After（秒）
+
+    def validate(self) -> None:
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {DISTRIBUTIONS}")
+        if self.latency_ms < 0 or self.sigma < 0 or self.retry_after < 0:
+            raise ValueError("latency_ms, sigma and retry_after must be non-negative")
+        if not 0 <= self.error_rate <= 1 or not 0 <= self.throttle_rate <= 1:
+            raise ValueError("error_rate and throttle_rate must be between 0 and 1")
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """按分布采样一次延迟（秒）"""
+        median = self.latency_ms / 1000
+        if self.distribution == "fixed":
+            return median
+        if self.distribution == "uniform":
+            return max(0.0, rng.uniform(median * (1 - self.sigma), median * (1 + self.sigma)))
+        # lognormal 的中位数为 exp(mu)，长尾由 sigma 控制
+        return rng.lognormvariate(0.0, self.sigma) * median
+
+
+def _profile_from_env(upstream: str) -> UpstreamProfile:
+    values: Dict[str, Any] = {"latency_ms": DEFAULT_LATENCY_MS[upstream]}
+    for field in fields(UpstreamProfile):
+        env_name = field.name.upper()
+        raw = os.getenv(f"SIMULATOR_{upstream.upper()}_{env_name}", os.getenv(f"SIMULATOR_{env_name}"))
+        if raw is not None:
+            values[field.name] = raw if field.type is str else float(raw)
+    profile = UpstreamProfile(**values)
+    profile.validate()
+    return profile
+
+
+class Simulator:
+    """保存各上游的配置、随机数生成器和请求统计"""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.profiles: Dict[str, UpstreamProfile] = {name: _profile_from_env(name) for name in UPSTREAMS}
+        self.reset()
+
+    def reset(self) -> None:
+        """重置随机数生成器和统计，之后的延迟 / 故障序列与启动时相同"""
+        self._rngs = {name: random.Random(f"{self.seed}:{name}") for name in UPSTREAMS}
+        self._stats = {name: {"requests": 0, "errors": 0, "throttled": 0, "latency_total": 0.0}
+                       for name in UPSTREAMS}
+
+    def decide(self, upstream: str):
+        """为一次请求决定延迟和注入的故障，返回 (延迟秒数, 状态码或 None)"""
+        profile = self.profiles[upstream]
+        rng = self._rngs[upstream]
+        delay = profile.sample_latency(rng)
+        roll = rng.random()
+        status = None
+        if roll < profile.throttle_rate:
+            status = 429
+        elif roll < profile.throttle_rate + profile.error_rate:
+            status = 500
+
+        stats = self._stats[upstream]
+        stats["requests"] += 1
+        stats["latency_total"] += delay
+        if status == 429:
+            stats["throttled"] += 1
+        elif status == 500:
+            stats["errors"] += 1
+        return delay, status
+
+    def stats(self) -> Dict[str, Any]:
+        result = {}
+        for name, stats in self._stats.items():
+            requests = stats["requests"]
+            result[name] = {
+                "requests": requests,
+                "errors": stats["errors"],
+                "throttled": stats["throttled"],
+                "avg_latency_ms": round(stats["latency_total"] / requests * 1000, 2) if requests else None,
+                "profile": asdict(self.profiles[name]),
+            }
+        return result
+
+
+simulator = Simulator(seed=int(os.getenv("SIMULATOR_SEED", "0")))
+
+app = FastAPI(
+    title="Upstream Simulator",
+    description="Deterministic fake Spotify / Wikipedia / iTunes / DeepSeek upstreams for offline load testing",
+)
+
+
+@app.middleware("http")
+async def inject_latency_and_faults(request: Request, call_next):
+    """按路径第一段识别上游，注入延迟和故障"""
+    upstream = request.url.path.strip("/").split("/", 1)[0]
+    if upstream not in UPSTREAMS:
+        return await call_next(request)
+
+    delay, status = simulator.decide(upstream)
+    if delay > 0:
+        await asyncio.sleep(delay)
+    if status == 429:
+        profile = simulator.profiles[upstream]
+        return JSONResponse(
+            status_code=429,
+            content={"error": {"status": 429, "message": "API rate limit exceeded"}},
+            headers={"Retry-After": f"{profile.retry_after:g}"}
+        )
+    if status == 500:
+        return JSONResponse(status_code=500, content={"error": {"status": 500, "message": "Simulated upstream error"}})
+    return await call_next(request)
+
+
+# ---------------------------------------------------------------- 控制接口
+
+@app.get("/_simulator/stats")
+async def get_stats():
+    """各上游的请求统计和当前配置"""
+    return {"seed": simulator.seed, "upstreams": simulator.stats()}
+
+
+@app.put("/_simulator/profiles/{upstream}")
+async def update_profile(upstream: str, changes: Dict[str, Any]):
+    """修改某个上游的配置（只需传要修改的字段）"""
+    if upstream not in UPSTREAMS:
+        raise HTTPException(status_code=404, detail={"error": "Unknown upstream", "upstreams": list(UPSTREAMS)})
+    known = {field.name for field in fields(UpstreamProfile)}
+    unknown = set(changes) - known
+    if unknown:
+        raise HTTPException(status_code=400, detail={"error": "Unknown fields", "fields": sorted(unknown)})
+    try:
+        profile = UpstreamProfile(**{**asdict(simulator.profiles[upstream]), **changes})
+        profile.validate()
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail={"error": "Invalid profile", "message": str(e)})
+    simulator.profiles[upstream] = profile
+    return asdict(profile)
+
+
+@app.post("/_simulator/reset")
+async def reset():
+    """重置随机数生成器和统计"""
+    simulator.reset()
+    return {"seed": simulator.seed}
+
+
+# ---------------------------------------------------------------- Spotify
+
+def _spotify_not_found(message: str) -> JSONResponse:
+    return JSONResponse(status_code=404, content={"error": {"status": 404, "message": message}})
+
+
+def _split_ids(ids: str):
+    return [spotify_id for spotify_id in ids.split(",") if spotify_id]
+
+
+@app.post("/spotify/api/token")
+async def spotify_token():
+    return {"access_token": "simulated-access-token", "token_type": "Bearer", "expires_in": 3600}
+
+
+@app.get("/spotify/v1/artists")
+async def spotify_artists(ids: str = Query(...)):
+    artist_ids = _split_ids(ids)
+    if len(artist_ids) > 50:
+        return JSONResponse(status_code=400, content={"error": {"status": 400, "message": "Too many ids requested"}})
+    return {"artists": [fixtures.spotify_artist(fixtures.artist_by_id(artist_id)) for artist_id in artist_ids]}
+
+
+@app.get("/spotify/v1/artists/{artist_id}")
+async def spotify_artist(artist_id: str):
+    return fixtures.spotify_artist(fixtures.artist_by_id(artist_id))
+
+
+@app.get("/spotify/v1/artists/{artist_id}/top-tracks")
+async def spotify_top_tracks(artist_id: str, market: Optional[str] = None):
+    return {"tracks": fixtures.top_tracks(artist_id)}
+
+
+@app.get("/spotify/v1/tracks")
+async def spotify_tracks(ids: str = Query(...), market: Optional[str] = None):
+    track_ids = _split_ids(ids)
+    if len(track_ids) > 50:
+        return JSONResponse(status_code=400, content={"error": {"status": 400, "message": "Too many ids requested"}})
+    return {"tracks": [fixtures.track_by_id(track_id) for track_id in track_ids]}
+
+
+@app.get("/spotify/v1/tracks/{track_id}")
+async def spotify_track(track_id: str, market: Optional[str] = None):
+    track = fixtures.track_by_id(track_id)
+    if track is None:
+        return _spotify_not_found("non existing id")
+    return track
+
+
+@app.get("/spotify/v1/search")
+async def spotify_search(q: str, type: str = "artist", limit: int = 20, market: Optional[str] = None):
+    limit = max(1, min(limit, 50))
+    return {"artists": {"items": fixtures.search_artists(q, limit), "limit": limit, "offset": 0}}
+
+
+# ---------------------------------------------------------------- Wikipedia
+
+@app.get("/wikipedia/{language}/api/rest_v1/page/summary/{title:path}")
+async def wikipedia_summary(language: str, title: str):
+    page = fixtures.wikipedia_page(title, language)
+    if page is None:
+        return JSONResponse(status_code=404, content={
+            "type": "https://mediawiki.org/wiki/HyperSwitch/errors/not_found",
+            "title": "Not found.",
+            "detail": "Page or revision not found."
+        })
+    return {
+        "type": "standard",
+        "title": page["title"],
+        "pageid": page["pageid"],
+        "extract": page["extract"],
+        "thumbnail": page["thumbnail"],
+        "lang": language,
+    }
+
+
+@app.get("/wikipedia/{language}/w/api.php")
+async def wikipedia_action_api(language: str, request: Request):
+    params = request.query_params
+    if params.get("action") != "query":
+        return {"error": {"code": "badvalue", "info": "Only action=query is simulated"}}
+
+    if params.get("list") == "search":
+        query = params.get("srsearch", "")
+        limit = int(params.get("srlimit", 10))
+        results = []
+        for index in range(min(limit, 5)):
+            title = query if index == 0 else f"{query} ({['album', 'song', 'band', 'festival'][index % 4]})"
+            page = fixtures.wikipedia_page(title, language)
+            if page:
+                results.append({"ns": 0, "title": page["title"], "pageid": page["pageid"],
+                                "snippet": f"<span class=\"searchmatch\">{query}</span> {page['extract'][:80]}"})
+        return {"batchcomplete": True, "query": {"searchinfo": {"totalhits": len(results)}, "search": results}}
+
+    titles = [title for title in params.get("titles", "").split("|") if title]
+    if len(titles) > 50:
+        return {"error": {"code": "toomanyvalues", "info": "Too many values supplied for parameter \"titles\""}}
+
+    props = set(params.get("prop", "").split("|"))
+    optional_props = {"extract": "extracts", "thumbnail": "pageimages", "pageprops": "pageprops",
+                      "categories": "categories", "extlinks": "extlinks"}
+    normalized = []
+    pages = []
+    for title in titles:
+        target = title.replace("_", " ").strip()
+        target = target[:1].upper() + target[1:]
+        if target != title:
+            normalized.append({"fromencoded": False, "from": title, "to": target})
+        page = fixtures.wikipedia_page(target, language)
+        if page is None:
+            pages.append({"ns": 0, "title": target, "missing": True})
+        else:
+            pages.append({
+                "ns": 0,
+                **{key: value for key, value in page.items() if key not in optional_props or optional_props[key] in props}
+            })
+
+    query: Dict[str, Any] = {"pages": pages}
+    if normalized:
+        query["normalized"] = normalized
+    return {"batchcomplete": True, "query": query}
+
+
+# ---------------------------------------------------------------- iTunes
+
+@app.get("/itunes/search")
+async def itunes_search(term: str = "", limit: int = 50, media: Optional[str] = None,
+                        entity: Optional[str] = None, country: Optional[str] = None):
+    results = fixtures.itunes_results(term, max(1, min(limit, 200)))
+    return {"resultCount": len(results), "results": results}
+
+
+# ---------------------------------------------------------------- DeepSeek
+
+@app.post("/deepseek/chat/completions")
+@app.post("/deepseek/v1/chat/completions")
+async def deepseek_chat(request: Request):
+    body = await request.json()
+    if not isinstance(body.get("messages"), list):
+        return JSONResponse(status_code=400, content={"error": {"message": "messages is required", "type": "invalid_request_error"}})
+    return fixtures.chat_completion(body.get("model", "deepseek-chat"), body["messages"])
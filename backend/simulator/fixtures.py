@@ -0,0 +1,308 @@
+"""
+模拟上游的固定数据
+
+几个常用艺术家使用手写数据，其他任意名称 / ID 按哈希确定性生成：
+同一个输入在任何机器、任何一次运行中得到的响应都相同，便于对比压测结果。
+"""
+import hashlib
+from typing import Any, Dict, List, Optional
+
+_BASE62 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# 按哈希生成的 Wikipedia 标题中找不到页面的比例
+WIKIPEDIA_MISS_RATE = 0.1
+# 按哈希生成的 iTunes 查询中没有结果 / 没有预览的比例
+ITUNES_MISS_RATE = 0.1
+ITUNES_NO_PREVIEW_RATE = 0.1
+
+KNOWN_ARTISTS: List[Dict[str, Any]] = [
+    {
+        "id": "4Z8W4fKeB5YxbusRsdQVPb",
+        "name": "Radiohead",
+        "genres": ["alternative rock", "art rock", "permanent wave"],
+        "popularity": 82,
+        "followers": 9200000,
+        "extract": "Radiohead are an English rock band formed in Abingdon, Oxfordshire, in 1985. "
+                   "The band consists of Thom Yorke, brothers Jonny Greenwood and Colin Greenwood, "
+                   "Ed O'Brien and Philip Selway.",
+        "tracks": ["Creep", "Karma Police", "No Surprises", "Paranoid Android", "High and Dry"],
+    },
+    {
+        "id": "6olE6TJLqED3rqDCT0FyPh",
+        "name": "Nirvana",
+        "genres": ["grunge", "permanent wave", "rock"],
+        "popularity": 80,
+        "followers": 19000000,
+        "extract": "Nirvana was an American rock band formed in Aberdeen, Washington, in 1987. "
+                   "Founded by lead singer and guitarist Kurt Cobain and bassist Krist Novoselic.",
+        "tracks": ["Smells Like Teen Spirit", "Come As You Are", "Lithium", "Heart-Shaped Box", "In Bloom"],
+    },
+    {
+        "id": "3WrFJ7ztbogyGnTHbHJFl2",
+        "name": "The Beatles",
+        "genres": ["british invasion", "merseybeat", "rock"],
+        "popularity": 85,
+        "followers": 30000000,
+        "extract": "The Beatles were an English rock band formed in Liverpool in 1960, comprising "
+                   "John Lennon, Paul McCartney, George Harrison and Ringo Starr.",
+        "tracks": ["Here Comes The Sun", "Let It Be", "Yesterday", "Hey Jude", "Come Together"],
+    },
+    {
+        "id": "4gzpq5DPGxSnKTe4SA8HAU",
+        "name": "Coldplay",
+        "genres": ["permanent wave", "pop"],
+        "popularity": 88,
+        "followers": 45000000,
+        "extract": "Coldplay are a British rock band formed in London in 1997, consisting of "
+                   "vocalist and pianist Chris Martin, guitarist Jonny Buckland, bassist Guy Berryman "
+                   "and drummer Will Champion.",
+        "tracks": ["Yellow", "Viva La Vida", "The Scientist", "Fix You", "Clocks"],
+    },
+]
+
+_KNOWN_BY_ID = {artist["id"]: artist for artist in KNOWN_ARTISTS}
+_KNOWN_BY_NAME = {artist["name"].lower(): artist for artist in KNOWN_ARTISTS}
+
+_GENRES = [
+    "j-rock", "indie rock", "electronica", "shoegaze", "city pop", "post-rock",
+    "hip hop", "dream pop", "techno", "folk", "punk", "soul",
+]
+_TRACK_WORDS = [
+    "Summer", "Mountain", "Rain", "Echo", "Night", "Signal", "Forest", "Light",
+    "River", "Static", "Dawn", "Fever", "Glass", "Horizon", "Neon", "Tide",
+]
+
+
+def stable_hash(*parts: Any) -> int:
+    """与进程无关的稳定哈希（内置 hash() 对字符串会随机化）"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _fraction(*parts: Any) -> float:
+    """[0, 1) 之间的稳定伪随机数"""
+    return stable_hash(*parts) / 2 ** 64
+
+
+def spotify_id_for(*parts: Any) -> str:
+    """生成 22 位 base62 的 Spotify 风格 ID"""
+    digest = hashlib.sha1("|".join(str(part) for part in ("spotify", *parts)).encode("utf-8")).digest()
+    value = int.from_bytes(digest, "big")
+    chars = []
+    for _ in range(22):
+        value, index = divmod(value, 62)
+        chars.append(_BASE62[index])
+    return "".join(chars)
+
+
+def _synthetic_artist(artist_id: str, name: str) -> Dict[str, Any]:
+    seed = stable_hash("artist", artist_id)
+    genres = [_GENRES[seed % len(_GENRES)], _GENRES[(seed >> 8) % len(_GENRES)]]
+    tracks = [
+        f"{_TRACK_WORDS[(seed >> (4 * i)) % len(_TRACK_WORDS)]} {_TRACK_WORDS[(seed >> (4 * i + 2)) % len(_TRACK_WORDS)]}"
+        for i in range(10)
+    ]
+    return {
+        "id": artist_id,
+        "name": name,
+        "genres": sorted(set(genres)),
+        "popularity": 20 + seed % 70,
+        "followers": (seed >> 16) % 2000000,
+        "extract": None,
+        "tracks": tracks,
+    }
+
+
+def artist_by_id(artist_id: str) -> Dict[str, Any]:
+    """按 Spotify ID 获取艺术家（未知 ID 生成合成艺术家）"""
+    known = _KNOWN_BY_ID.get(artist_id)
+    if known:
+        return known
+    return _synthetic_artist(artist_id, f"Simulated Artist {artist_id[:6]}")
+
+
+def artist_by_name(name: str) -> Dict[str, Any]:
+    """按名称获取艺术家（未知名称生成合成艺术家，ID 由名称决定）"""
+    known = _KNOWN_BY_NAME.get(name.strip().lower())
+    if known:
+        return known
+    return _synthetic_artist(spotify_id_for("artist", name.strip().lower()), name.strip())
+
+
+def _image(kind: str, key: str, size: int) -> Dict[str, Any]:
+    return {"url": f"https://images.simulator.local/{kind}/{key}/{size}.jpg", "height": size, "width": size}
+
+
+def spotify_artist(artist: Dict[str, Any]) -> Dict[str, Any]:
+    """Spotify 艺术家对象"""
+    return {
+        "id": artist["id"],
+        "name": artist["name"],
+        "type": "artist",
+        "images": [_image("artist", artist["id"], size) for size in (640, 320, 160)],
+        "genres": artist["genres"],
+        "popularity": artist["popularity"],
+        "followers": {"href": None, "total": artist["followers"]},
+        "external_urls": {"spotify": f"https://open.spotify.com/artist/{artist['id']}"},
+    }
+
+
+def spotify_track(artist: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Spotify 曲目对象（ID = 艺术家ID + 两位序号，可反向解析）"""
+    track_id = f"{artist['id']}{index:02d}"
+    seed = stable_hash("track", track_id)
+    album_id = spotify_id_for("album", artist["id"], index // 4)
+    name = artist["tracks"][index % len(artist["tracks"])]
+    if index >= len(artist["tracks"]):
+        name = f"{name} (Live {index})"
+    return {
+        "id": track_id,
+        "name": name,
+        "type": "track",
+        "album": {
+            "id": album_id,
+            "name": f"{artist['name']} Vol. {index // 4 + 1}",
+            "images": [_image("album", album_id, size) for size in (640, 300, 64)],
+            "release_date": f"{2000 + seed % 25}-{1 + (seed >> 8) % 12:02d}-{1 + (seed >> 16) % 28:02d}",
+            "total_tracks": 8 + seed % 8,
+        },
+        "artists": [{
+            "id": artist["id"],
+            "name": artist["name"],
+            "external_urls": {"spotify": f"https://open.spotify.com/artist/{artist['id']}"},
+        }],
+        "duration_ms": 150000 + seed % 150000,
+        "popularity": max(0, artist["popularity"] - index * 3),
+        # Spotify 已停止为大部分曲目返回 preview_url，按比例保留一部分
+        "preview_url": f"https://p.scdn.simulator.local/mp3-preview/{track_id}" if seed % 4 == 0 else None,
+        "explicit": seed % 7 == 0,
+        "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+    }
+
+
+def top_tracks(artist_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """艺术家热门曲目"""
+    artist = artist_by_id(artist_id)
+    return [spotify_track(artist, index) for index in range(limit)]
+
+
+def track_by_id(track_id: str) -> Optional[Dict[str, Any]]:
+    """按曲目ID获取曲目，ID 格式不符时返回 None"""
+    if len(track_id) < 3 or not track_id[-2:].isdigit():
+        return None
+    return spotify_track(artist_by_id(track_id[:-2]), int(track_id[-2:]))
+
+
+def search_artists(query: str, limit: int) -> List[Dict[str, Any]]:
+    """艺术家搜索：精确匹配优先，其余为确定性生成的相似艺术家"""
+    artist = artist_by_name(query)
+    results = [spotify_artist(artist)]
+    for index in range(1, limit):
+        similar = artist_by_name(f"{artist['name']} {_TRACK_WORDS[stable_hash(query, index) % len(_TRACK_WORDS)]}")
+        results.append(spotify_artist(similar))
+    return results[:limit]
+
+
+def _extract_for(title: str, language: str, artist: Dict[str, Any]) -> str:
+    if artist.get("extract") and language == "en":
+        return artist["extract"]
+    genre = artist["genres"][0] if artist["genres"] else "rock"
+    if language == "ja":
+        return f"{title}は、日本で活動する{genre}のアーティストである。シミュレーターが生成した説明文。"
+    if language == "zh":
+        return f"{title}是一位{genre}音乐人，曾多次参加音乐节演出。这是模拟服务生成的简介。"
+    return (f"{title} is a {genre} act known for energetic festival performances. "
+            f"This description was generated by the upstream simulator.")
+
+
+def wikipedia_page(title: str, language: str) -> Optional[Dict[str, Any]]:
+    """
+    Wikipedia 页面；页面不存在时返回 None
+
+    标题首字母按 Wikipedia 规则大写，下划线视为空格。
+    """
+    normalized = title.replace("_", " ").strip()
+    if not normalized:
+        return None
+    normalized = normalized[0].upper() + normalized[1:]
+    artist = artist_by_name(normalized)
+    if not artist.get("extract") and _fraction("wiki-miss", language, normalized) < WIKIPEDIA_MISS_RATE:
+        return None
+    page_id = stable_hash("wiki", language, normalized) % 10000000
+    return {
+        "pageid": page_id,
+        "title": normalized,
+        "extract": _extract_for(normalized, language, artist),
+        "thumbnail": {
+            "source": f"https://upload.simulator.local/wikipedia/{language}/thumb/{page_id}/500px.jpg",
+            "width": 500,
+            "height": 333,
+        },
+        "pageprops": {"wikibase_item": f"Q{page_id}"},
+        "categories": [
+            {"ns": 14, "title": f"Category:{genre.title()} musicians"} for genre in artist["genres"]
+        ],
+        "extlinks": [
+            {"url": f"https://www.{artist['id'].lower()}.simulator.local/"},
+            {"url": f"//open.spotify.com/artist/{artist['id']}"},
+        ],
+    }
+
+
+def itunes_results(term: str, limit: int) -> List[Dict[str, Any]]:
+    """iTunes 搜索结果：检索词中包含已知艺术家名称时返回该艺术家，否则生成合成结果"""
+    term = term.strip()
+    if not term or _fraction("itunes-miss", term.lower()) < ITUNES_MISS_RATE:
+        return []
+    artist = next((a for a in KNOWN_ARTISTS if a["name"].lower() in term.lower()), None)
+    artist_name = artist["name"] if artist else term.split(" ")[0]
+    track_name = term[len(artist_name):].strip() if artist and term.lower().startswith(artist["name"].lower()) else term
+    track_name = track_name or (artist["tracks"][0] if artist else term)
+
+    results = []
+    for index in range(min(limit, 5)):
+        seed = stable_hash("itunes", term.lower(), index)
+        track_id = 1000000000 + seed % 900000000
+        has_preview = _fraction("itunes-preview", term.lower(), index) >= ITUNES_NO_PREVIEW_RATE
+        results.append({
+            "wrapperType": "track",
+            "kind": "song",
+            "trackId": track_id,
+            "trackName": track_name if index == 0 else f"{track_name} ({['Live', 'Remastered', 'Acoustic', 'Demo'][index % 4]})",
+            "artistName": artist_name,
+            "collectionName": f"{artist_name} Collection {1 + seed % 5}",
+            "previewUrl": f"https://audio.simulator.local/itunes/{track_id}.m4a" if has_preview else None,
+            "artworkUrl100": f"https://is1.simulator.local/image/{track_id}/100x100bb.jpg",
+            "trackTimeMillis": 150000 + seed % 150000,
+            "trackViewUrl": f"https://music.apple.com/jp/album/{track_id}",
+            "primaryGenreName": artist["genres"][0].title() if artist else "Rock",
+            "releaseDate": f"{2000 + seed % 25}-01-01T00:00:00Z",
+        })
+    return results
+
+
+def chat_completion(model: str, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """OpenAI 格式的对话补全，内容由最后一条用户消息确定性生成"""
+    prompt = next((m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), "")
+    if not isinstance(prompt, str):
+        prompt = str(prompt)
+    seed = stable_hash("chat", model, prompt)
+    content = f"（模拟生成）这位艺术家以独特的现场表演风格著称，风格编号 {seed % 1000}。"
+    prompt_tokens = max(1, len(prompt) // 2)
+    completion_tokens = len(content)
+    return {
+        "id": f"chatcmpl-sim-{seed % 10 ** 12:012d}",
+        "object": "chat.completion",
+        "created": 1700000000,
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
@@ -0,0 +1,9 @@
+"""
+测试配置 - 把 backend 目录加入导入路径（与 python main.py 的运行方式一致）
+
+在 backend 目录下运行：python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
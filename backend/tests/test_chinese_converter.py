@@ -0,0 +1,30 @@
+"""
+繁简转换：对照表替换旧的单字字典后，旧字典的映射和常见音乐词汇必须保持不变
+"""
+import pytest
+
+from services.chinese_converter import convert_traditional_to_simplified
+
+# 旧版 wikipedia_service.TRADITIONAL_TO_SIMPLIFIED 中所有繁简不同的字（繁简交替排列）
+OLD_DICT_PAIRS = "電电臺台來来國国賓宾頓顿類类搖摇滾滚樂乐團团組组於于湯汤約约鋼钢強强鍵键盤盘歐欧萊莱聲声貝贝與与爾尔擊击隊队風风實实驗验藝艺術术後后種种創创獨独專专輯辑發发獲获廣广讚赞譽誉並并確确壇坛續续響响無无數数輩辈認认為为當当愛爱範范圍围內内擁拥龐庞絲丝體体"
+
+
+@pytest.mark.parametrize(
+    "traditional, simplified",
+    [(OLD_DICT_PAIRS[i], OLD_DICT_PAIRS[i + 1]) for i in range(0, len(OLD_DICT_PAIRS), 2)]
+)
+def test_old_dict_mappings_preserved(traditional, simplified):
+    assert convert_traditional_to_simplified(traditional) == simplified
+
+
+@pytest.mark.parametrize("traditional, simplified", [
+    ("搖滾樂", "摇滚乐"),
+    ("另類搖滾樂團", "另类摇滚乐团"),
+    ("樂團", "乐团"),
+    ("專輯", "专辑"),
+    ("鐘錶", "钟表"),
+    ("萊恩", "莱恩"),
+    ("樂隊主唱", "乐队主唱"),
+])
+def test_music_phrases(traditional, simplified):
+    assert convert_traditional_to_simplified(traditional) == simplified
@@ -0,0 +1,62 @@
+"""
+Wikipedia 缓存：批量摘要不能被当作完整的艺术家信息返回；上游暂时性错误不能进入负缓存
+"""
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from services import wikipedia_service as wiki
+
+
+def _fake_response(params):
+    """按查询的 prop 返回批量摘要或完整页面"""
+    title = params["titles"].split("|")[0]
+    page = {"title": title, "extract": f"{title} is a band."}
+    if "categories" in params["prop"]:
+        page["categories"] = [{"title": "Category:Rock music groups"}]
+        page["extlinks"] = [{"url": "https://example.com/band"}]
+    return httpx.Response(200, json={"query": {"pages": [page]}})
+
+
+def test_bulk_summary_does_not_replace_full_artist_info(monkeypatch):
+    service = wiki.WikipediaService()
+    queried_props = []
+
+    async def fake_get(url, params=None, **kwargs):
+        queried_props.append(params["prop"])
+        return _fake_response(params)
+
+    monkeypatch.setattr(service.http, "get", fake_get)
+    wiki._wikipedia_cache.clear()
+
+    async def run():
+        bulk = await service.get_artists_bulk(["Test Band"], "en")
+        single = await service.get_artist_info("Test Band", "en")
+        return bulk, single
+
+    bulk, single = asyncio.run(run())
+
+    assert bulk["Test Band"].categories == []
+    assert single.categories == ["Rock music groups"]
+    assert [ref.url for ref in single.references] == ["https://example.com/band"]
+    # 单个查询不能命中批量摘要的缓存
+    assert len(queried_props) == 2 and "categories" in queried_props[1]
+
+
+def test_maxlag_error_is_not_negative_cached(monkeypatch):
+    service = wiki.WikipediaService()
+    maxlag = {"error": {"code": "maxlag", "info": "Waiting for a database server"}}
+
+    async def fake_get(url, params=None, **kwargs):
+        return httpx.Response(200, json=maxlag, headers={"Retry-After": "5"})
+
+    monkeypatch.setattr(service.http, "get", fake_get)
+    wiki._wikipedia_cache.clear()
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(service.get_real_data("Test Band", "en"))
+
+    assert excinfo.value.status_code == 503
+    assert not wiki._is_cacheable_failure(excinfo.value)
@@ -0,0 +1,98 @@
+"""
+响应序列化基准测试 - 对比各接口典型响应在原 JSONResponse 路径和 FastJSONResponse 路径下的序列化耗时
+
+原路径：jsonable_encoder + json.dumps（FastAPI 默认 JSONResponse）
+新路径：
+- 数据库接口直接返回 FastJSONResponse，只有 orjson.dumps
+- 其他没有 response_model 的接口仍经过 jsonable_encoder，之后由 orjson.dumps 输出
+（声明了 response_model 的接口由 FastAPI 直接用 pydantic 序列化，不受默认响应类影响，不在此列）
+
+用法：python scripts/benchmark_serialization.py [重复次数]
+响应数据由上游模拟服务的固定数据生成，不需要数据库或网络。
+"""
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root and backend to the Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "backend"))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from api.responses import dumps, orjson
+from models.spotify import SpotifyArtist, SpotifyTrack
+from simulator import fixtures
+
+
+def _artist_row(index: int) -> dict:
+    """artists 表的一行（Supabase 返回的格式：UUID 和时间为字符串）"""
+    artist = fixtures.artist_by_name(f"Benchmark Artist {index}")
+    page = fixtures.wikipedia_page(artist["name"], "en") or fixtures.wikipedia_page("Radiohead", "en")
+    updated_at = datetime(2025, 6, 1, tzinfo=timezone.utc) + timedelta(minutes=index)
+    return {
+        "id": str(uuid.UUID(int=fixtures.stable_hash("row", index))),
+        "name": artist["name"],
+        "description": page["extract"],
+        "genres": artist["genres"],
+        "spotify_id": artist["id"],
+        "image_url": fixtures.spotify_artist(artist)["images"][0]["url"],
+        "is_fuji_rock_artist": True,
+        "wiki_data": {**page, "categories": [c["title"] for c in page["categories"]],
+                      "references": [{"title": "link", "url": link["url"]} for link in page["extlinks"]]},
+        "wiki_extract": page["extract"],
+        "wiki_last_updated": updated_at.isoformat(),
+        "spotify_data": {**fixtures.spotify_artist(artist), "top_tracks": fixtures.top_tracks(artist["id"], 5)},
+        "created_at": updated_at.isoformat(),
+        "updated_at": updated_at.isoformat(),
+    }
+
+
+def _payloads():
+    rows = [_artist_row(i) for i in range(50)]
+    artist = fixtures.artist_by_name("Radiohead")
+    tracks = [SpotifyTrack.model_validate(track) for track in fixtures.top_tracks(artist["id"], 10)]
+    return [
+        # (接口, 响应内容, 新路径是否跳过 jsonable_encoder)
+        ("GET /api/database/artists (50 rows)", {"success": True, "data": rows, "total": len(rows)}, True),
+        ("GET /api/database/artists/{id}", {"success": True, "data": rows[0]}, True),
+        ("GET /spotify/artist/{id}/top-tracks", {
+            "success": True,
+            "data": {"tracks": tracks, "total": len(tracks), "artist_id": artist["id"]},
+        }, False),
+        ("GET /spotify/artists/bulk", {
+            "success": True,
+            "data": {a["id"]: SpotifyArtist.model_validate(fixtures.spotify_artist(fixtures.artist_by_id(a["id"])))
+                     for a in fixtures.search_artists("Radiohead", 20)},
+        }, False),
+    ]
+
+
+def _bench(func, number: int) -> float:
+    """多次测量取最小值，返回单次耗时（微秒）"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    if orjson is None:
+        print("orjson is not installed: FastJSONResponse falls back to json.dumps, numbers below compare equal paths")
+
+    baseline_response = JSONResponse(content=None)
+    print(f"{'endpoint':<40} {'bytes':>8} {'before µs':>10} {'after µs':>10} {'speedup':>8}")
+    for name, content, direct in _payloads():
+        before = _bench(lambda: baseline_response.render(jsonable_encoder(content)), number)
+        if direct:
+            after = _bench(lambda: dumps(content), number)
+        else:
+            after = _bench(lambda: dumps(jsonable_encoder(content)), number)
+        size = len(dumps(content if direct else jsonable_encoder(content)))
+        print(f"{name:<40} {size:>8} {before:>10.1f} {after:>10.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,10 @@ from typing import List, Dict, Any
 from dotenv import load_dotenv
 load_dotenv()
 
+# 默认开启上游响应磁盘缓存，重复运行时已请求过的数据直接从缓存读取
+# （可通过环境变量 HTTP_CACHE_MODE=record / replay / off 覆盖）
+os.environ.setdefault("HTTP_CACHE_MODE", "cache")
+
 # 添加项目根目录到 Python 路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -0,0 +1,55 @@
+"""
+导出数据库表为 NDJSON 文件（每行一个 JSON 对象）
+
+按 id 分页读取（与 /export/{table}.ndjson 接口相同的生成器），内存占用与表大小无关。
+
+用法：
+    python scripts/export_table.py artists [输出文件] [--fields id,name,wiki_extract] [--updated-since 2025-06-01]
+输出文件为空或为 "-" 时写到标准输出。
+"""
+import argparse
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root and backend to the Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "backend"))
+
+from api.responses import dumps
+from services.export_service import EXPORT_TABLES, export_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', stream=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a database table as NDJSON")
+    parser.add_argument("table", choices=sorted(EXPORT_TABLES))
+    parser.add_argument("output", nargs="?", default="-")
+    parser.add_argument("--fields", help="comma-separated columns to export")
+    parser.add_argument("--updated-since", type=datetime.fromisoformat)
+    parser.add_argument("--page-size", type=int)
+    args = parser.parse_args()
+
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    count = 0
+    try:
+        for row in export_service.iter_rows(
+            args.table,
+            fields=args.fields.split(",") if args.fields else None,
+            updated_since=args.updated_since,
+            page_size=args.page_size
+        ):
+            output.write(dumps(row) + b"\n")
+            count += 1
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+    logging.info(f"Exported {count} rows from {args.table}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,12 @@ from supabase import create_client, Client
 # Load environment variables from .env file
 load_dotenv()
 
+# Add project root to the Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from services.rate_limiter import get_rate_limiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -36,10 +42,17 @@ class SimpleAIDescriptionFiller:
         self.api_key = os.getenv("ARK_API_KEY")
         self.model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
         self.client = None
+        # DeepSeek 共享限流器：按配置速率发送请求，被 429 限流时自动退避
+        self.limiter = get_rate_limiter("deepseek")
         
         if self.api_key:
             try:
-                self.client = Ark(api_key=self.api_key)
+                # DEEPSEEK_API_URL 可指向本地模拟服务
+                base_url = os.getenv("DEEPSEEK_API_URL")
+                if base_url:
+                    self.client = Ark(api_key=self.api_key, base_url=base_url)
+                else:
+                    self.client = Ark(api_key=self.api_key)
                 logging.info(f"✅ 成功初始化 Ark 客户端，模型: {self.model}")
             except Exception as e:
                 logging.error(f"❌ 初始化 Ark 客户端失败: {str(e)}")
@@ -78,6 +91,7 @@ class SimpleAIDescriptionFiller:
 """
         
         try:
+            await self.limiter.acquire()
             completion = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -97,6 +111,7 @@ class SimpleAIDescriptionFiller:
                 return None
                 
         except Exception as e:
+            self.limiter.record_error(e)
             logging.error(f"❌ 调用 DeepSeek API 失败 ({artist_name}): {e}")
             return None
 
@@ -255,9 +270,6 @@ class SimpleAIDescriptionFiller:
             except Exception as e:
                 logging.error(f"  ❌ 处理 {artist_name} 时出错: {e}")
                 failed_artists.append(artist_name)
-            
-            # 添加延迟避免 API 限流和数据库压力
-            await asyncio.sleep(2)  # 增加延迟到2秒
         
         # 输出最终结果
         print(f"\n{'='*60}")
@@ -10,6 +10,7 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
 from services.artist_db_service import artist_db_service
+from services.chinese_converter import t2s_converter, contains_kana
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -60,6 +61,15 @@ class WikiDescriptionGenerator:
         
         return result
 
+    @staticmethod
+    def is_chinese_extract(artist: Dict[str, Any]) -> bool:
+        """根据 wiki_data 中记录的语言判断摘要是否来自中文维基（没有记录时以不含假名为准）"""
+        language = (artist.get("wiki_data") or {}).get("language")
+        if language:
+            return language == "zh"
+        extract = artist.get("wiki_extract") or ""
+        return any('\u4e00' <= char <= '\u9fff' for char in extract) and not contains_kana(extract)
+
     async def get_artists_with_wiki_no_description(self) -> List[Dict[str, Any]]:
         """获取有 Wiki 数据但缺少 Description 的艺术家"""
         logging.info("Fetching artists with Wiki data but missing descriptions...")
@@ -95,6 +105,13 @@ class WikiDescriptionGenerator:
         
         logging.info(f"=== Starting Description Generation from Wiki for {total} Artists ===")
         
+        # 中文摘要批量转为简体（日文摘要保持原文）
+        chinese_artists = [artist for artist in artists_to_update if self.is_chinese_extract(artist)]
+        simplified = t2s_converter.convert_many(artist["wiki_extract"] for artist in chinese_artists)
+        for artist, extract in zip(chinese_artists, simplified):
+            artist["wiki_extract"] = extract
+        logging.info(f"Converted {len(chinese_artists)} Chinese extracts to Simplified Chinese")
+        
         for i, artist in enumerate(artists_to_update, 1):
             artist_name = artist["name"]
             artist_id = artist["id"]
@@ -26,40 +26,39 @@ async def get_spotify_images():
         
         image_mapping = {}
         
+        # 收集所有 Spotify ID，通过批量接口一次性获取（每 50 个 ID 一个请求）
+        artists_with_id = []
         for artist in result.data:
+            if artist.get("spotify_id"):
+                artists_with_id.append(artist)
+            else:
+                print(f"⚠️  {artist.get('name')} has no Spotify ID")
+        
+        print(f"🎵 Getting images for {len(artists_with_id)} artists in batch")
+        
+        try:
+            spotify_artists, failed_ids = await spotify_service.get_artists_bulk(
+                [artist["spotify_id"] for artist in artists_with_id]
+            )
+        except Exception as e:
+            print(f"  ❌ Error getting Spotify data: {str(e)}")
+            spotify_artists, failed_ids = {}, []
+        failed_ids = set(failed_ids)
+        
+        for artist in artists_with_id:
             artist_name = artist.get("name")
-            spotify_id = artist.get("spotify_id")
+            spotify_artist = spotify_artists.get(artist["spotify_id"])
             
-            if spotify_id:
-                print(f"🎵 Getting image for {artist_name} (Spotify ID: {spotify_id})")
-                
-                try:
-                    # 通过Spotify ID获取艺术家信息
-                    spotify_result = await spotify_service.get_artist_by_id(spotify_id)
-                    
-                    if spotify_result.get("success") and spotify_result.get("data"):
-                        spotify_data = spotify_result["data"]
-                        images = spotify_data.get("images", [])
-                        
-                        if images:
-                            # 使用最高质量的图片
-                            best_image = images[0]  # Spotify按质量排序，第一个是最高质量
-                            image_url = best_image.get("url")
-                            
-                            if image_url:
-                                image_mapping[artist_name] = image_url
-                                print(f"  ✅ Found image: {image_url}")
-                            else:
-                                print(f"  ❌ No image URL in response")
-                        else:
-                            print(f"  ❌ No images available")
-                    else:
-                        print(f"  ❌ Failed to get Spotify data: {spotify_result.get('error', 'Unknown error')}")
-                        
-                except Exception as e:
-                    print(f"  ❌ Error getting Spotify data: {str(e)}")
+            if artist["spotify_id"] in failed_ids:
+                print(f"  ⚠️  {artist_name}: Spotify request failed, try again later")
+            elif not spotify_artist:
+                print(f"  ❌ {artist_name}: not found on Spotify")
+            elif spotify_artist.images:
+                # Spotify按质量排序，第一个是最高质量
+                image_mapping[artist_name] = spotify_artist.images[0].url
+                print(f"  ✅ {artist_name}: {spotify_artist.images[0].url}")
             else:
-                print(f"⚠️  {artist_name} has no Spotify ID")
+                print(f"  ❌ {artist_name}: no images available")
         
         print(f"\n📊 Found images for {len(image_mapping)} artists")
         
@@ -1,18 +1,22 @@
 import asyncio
 import logging
+import os
 import sys
 import re
-import httpx
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-import urllib.parse
 
 # Add project root to the Python path
 project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
+# 默认开启上游响应磁盘缓存，重复运行时已请求过的数据直接从缓存读取
+# （可通过环境变量 HTTP_CACHE_MODE=record / replay / off 覆盖）
+os.environ.setdefault("HTTP_CACHE_MODE", "cache")
+
 from services.artist_db_service import artist_db_service
 from services.spotify_service import spotify_service
+from services.wikipedia_service import wikipedia_service
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -27,14 +31,7 @@ class ImprovedWikiSearcher:
     def __init__(self):
         self.db_service = artist_db_service
         self.spotify_service = spotify_service
-        self.timeout = 30.0
-        
-        # Wikipedia API endpoints for different languages
-        self.wiki_apis = {
-            "zh": "https://zh.wikipedia.org/api/rest_v1",
-            "en": "https://en.wikipedia.org/api/rest_v1", 
-            "ja": "https://ja.wikipedia.org/api/rest_v1"
-        }
+        self.wikipedia_service = wikipedia_service
     
     def clean_search_term(self, name: str) -> str:
         """清理搜索词，移除特殊字符"""
@@ -100,46 +97,6 @@ class ImprovedWikiSearcher:
         unique_variations = list(set([v for v in variations if v.strip()]))
         return unique_variations
     
-    async def search_wikipedia(self, search_term: str, language: str = "zh") -> Optional[Dict[str, Any]]:
-        """搜索Wikipedia API"""
-        if not search_term.strip():
-            return None
-            
-        api_url = self.wiki_apis.get(language)
-        if not api_url:
-            return None
-        
-        # 正确URL编码搜索词
-        encoded_search_term = urllib.parse.quote(search_term)
-        search_url = f"{api_url}/page/summary/{encoded_search_term}"
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(search_url)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    extract = data.get("extract", "")
-                    # 确保有实际内容
-                    if extract and len(extract.strip()) > 10:
-                        return {
-                            "title": data.get("title", ""),
-                            "extract": extract,
-                            "thumbnail": data.get("thumbnail"),
-                            "language": language,
-                            "search_term": search_term
-                        }
-                    else:
-                        logging.debug(f"Found page but no extract for '{search_term}' in {language}")
-                        return None
-                else:
-                    logging.debug(f"Wikipedia search failed for '{search_term}' in {language}: {response.status_code}")
-                    return None
-                    
-        except Exception as e:
-            logging.debug(f"Wikipedia search error for '{search_term}' in {language}: {e}")
-            return None
-    
     async def get_spotify_artist_name(self, spotify_id: str) -> Optional[str]:
         """通过Spotify ID获取艺术家官方名称"""
         try:
@@ -167,20 +124,19 @@ class ImprovedWikiSearcher:
         search_variations = self.generate_search_variations(artist_name, spotify_name)
         logging.info(f"  🔄 Search variations: {search_variations}")
         
-        # 按优先级搜索不同语言版本：英文优先，然后日文
-        languages = ["en", "ja"]  # 英文、日文优先级
-        
-        for language in languages:
-            for search_term in search_variations:
-                logging.info(f"    🌐 Trying {language} Wiki: '{search_term}'")
-                
-                result = await self.search_wikipedia(search_term, language)
-                if result and result.get("extract"):
-                    logging.info(f"    ✅ Found in {language} Wiki!")
-                    return result
-                
-                # 避免请求过于频繁
-                await asyncio.sleep(0.5)
+        # 并发搜索不同语言版本，多个结果同时命中时英文优先，然后日文
+        languages = ["en", "ja"]
+        match = await self.wikipedia_service.find_artist(search_variations, languages, min_extract_length=11)
+        if match:
+            wiki_data = match["data"]
+            logging.info(f"    ✅ Found in {match['language']} Wiki via '{match['search_term']}'!")
+            return {
+                "title": wiki_data.title,
+                "extract": wiki_data.extract,
+                "thumbnail": wiki_data.thumbnail.model_dump() if wiki_data.thumbnail else None,
+                "language": match["language"],
+                "search_term": match["search_term"]
+            }
         
         logging.info(f"    ❌ No Wiki data found for {artist_name}")
         return None
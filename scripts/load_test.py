@@ -0,0 +1,89 @@
+"""
+HTTP 负载测试 - 固定并发数持续请求一组 URL，统计吞吐量和延迟分位数
+
+用法：
+    python scripts/load_test.py http://127.0.0.1:8000 /health /spotify/artist/4Z8W4fKeB5YxbusRsdQVPb \
+        --concurrency 64 --duration 20 --warmup 3
+
+每个并发连接按顺序轮流请求给出的路径（保持长连接），预热阶段的请求不计入结果。
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from typing import List
+
+import httpx
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def _run(base_url: str, paths: List[str], concurrency: int, duration: float, warmup: float):
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    errors: Counter = Counter()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        measure_from = time.perf_counter() + warmup
+        stop_at = measure_from + duration
+
+        async def user(offset: int):
+            i = offset
+            while True:
+                started = time.perf_counter()
+                if started >= stop_at:
+                    return
+                path = paths[i % len(paths)]
+                i += 1
+                try:
+                    response = await client.get(path)
+                    status = response.status_code
+                    error = None
+                except httpx.HTTPError as e:
+                    status, error = None, type(e).__name__
+                if started >= measure_from:
+                    if error:
+                        errors[error] += 1
+                    else:
+                        statuses[status] += 1
+                        latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(user(n) for n in range(concurrency)))
+
+    latencies.sort()
+    completed = len(latencies)
+    print(f"target:       {base_url} {' '.join(paths)}")
+    print(f"concurrency:  {concurrency}, duration {duration:.0f}s (+{warmup:.0f}s warm-up)")
+    print(f"requests:     {completed}  ({completed / duration:.1f} req/s)")
+    print(f"status codes: {dict(statuses)}" + (f"  errors: {dict(errors)}" if errors else ""))
+    if latencies:
+        print(
+            "latency ms:   "
+            f"mean {statistics.mean(latencies) * 1000:.1f}  "
+            f"p50 {_percentile(latencies, 0.50) * 1000:.1f}  "
+            f"p90 {_percentile(latencies, 0.90) * 1000:.1f}  "
+            f"p99 {_percentile(latencies, 0.99) * 1000:.1f}  "
+            f"max {latencies[-1] * 1000:.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simple HTTP load generator")
+    parser.add_argument("base_url")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    args = parser.parse_args()
+    asyncio.run(_run(args.base_url.rstrip("/"), args.paths, args.concurrency, args.duration, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+应用导入时间测量 - 在新的 Python 进程中导入 backend/main.py，统计总耗时和最慢的模块
+
+用法：python scripts/measure_import_time.py [重复次数] [显示的模块数]
+
+每次测量使用独立进程（python -X importtime），结果取中位数；
+模块耗时为累计耗时（含其导入的子模块），只显示顶层包。
+"""
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+project_root = Path(__file__).resolve().parent.parent
+backend_dir = project_root / "backend"
+
+
+def _measure_once() -> Tuple[float, Dict[str, float]]:
+    """返回 (main 的累计导入耗时, 各顶层包的累计耗时)，单位毫秒"""
+    env = {**os.environ, "PYTHONPATH": str(backend_dir)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=backend_dir, env=env, capture_output=True, text=True, check=True
+    )
+    total = 0.0
+    # -X importtime 先输出子模块再输出父模块：main 之前、上一个顶层模块之后的直接子模块属于 main
+    packages: Dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_ms = int(cumulative) / 1000
+        except ValueError:
+            continue
+        if not name.startswith("  "):
+            # 顶层模块（名称前只有一个空格）
+            if name.strip() == "main":
+                total = cumulative_ms
+                break
+            packages.clear()
+        elif not name.startswith("    "):
+            # main 直接导入的模块（缩进两个空格）
+            packages[name.strip().split(".")[0]] += cumulative_ms
+    return total, packages
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    totals: List[float] = []
+    per_package: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(runs):
+        total, packages = _measure_once()
+        totals.append(total)
+        for name, value in packages.items():
+            per_package[name].append(value)
+
+    print(f"import main: median {statistics.median(totals):.0f} ms "
+          f"(min {min(totals):.0f}, max {max(totals):.0f}, {runs} runs)")
+    print("slowest top-level imports (median cumulative ms):")
+    ranked = sorted(((statistics.median(values), name) for name, values in per_package.items()), reverse=True)
+    for value, name in ranked[:top]:
+        print(f"  {name:<30} {value:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
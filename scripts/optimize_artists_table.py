@@ -76,9 +76,6 @@ async def update_spotify_ids(backup_data):
                     print(f"   ❌ 更新失败: {e}")
             else:
                 print(f"   ⚠️ 未找到 {artist_name} 的 Spotify ID")
-            
-            # API 限制
-            await asyncio.sleep(1)
 
 def drop_columns():
     """删除冗余字段"""
@@ -16,6 +16,7 @@ project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
 from services.artist_db_service import artist_db_service
+from services.rate_limiter import get_rate_limiter
 from config import settings
 
 # Configure logging
@@ -29,10 +30,16 @@ class AIDescriptionPopulator:
         self.api_key = settings.ARK_API_KEY
         self.model = settings.DEEPSEEK_MODEL
         self.client = None
+        # DeepSeek 共享限流器：按配置速率发送请求，被 429 限流时自动退避
+        self.limiter = get_rate_limiter("deepseek")
         
         if self.api_key:
             try:
-                self.client = Ark(api_key=self.api_key)
+                # DEEPSEEK_API_URL 可指向本地模拟服务
+                if settings.DEEPSEEK_API_URL:
+                    self.client = Ark(api_key=self.api_key, base_url=settings.DEEPSEEK_API_URL)
+                else:
+                    self.client = Ark(api_key=self.api_key)
                 logging.info(f"Successfully initialized Ark client for model: {self.model}")
             except Exception as e:
                 logging.error(f"Failed to initialize Ark client: {str(e)}")
@@ -64,6 +71,7 @@ class AIDescriptionPopulator:
 """
         
         try:
+            await self.limiter.acquire()
             completion = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -83,6 +91,7 @@ class AIDescriptionPopulator:
                 return None
                 
         except Exception as e:
+            self.limiter.record_error(e)
             logging.error(f"Error calling DeepSeek API via Ark SDK for {artist_name}: {e}")
             return None
     
@@ -193,9 +202,6 @@ class AIDescriptionPopulator:
             except Exception as e:
                 logging.error(f"  ❌ Error processing {artist_name}: {e}")
                 failed_artists.append(artist_name)
-            
-            # Add a small delay to avoid rate limiting
-            await asyncio.sleep(1)
         
         logging.info("\n" + "="*60)
         logging.info("=== AI Description Generation Complete ===")
@@ -139,6 +139,7 @@ class MissingWikiPopulator:
             variations = self.generate_search_variations(artist_name, spotify_name)
             
             found_wiki = None
+            found_language = None
             for lang in languages:
                 if found_wiki: break
                 for var in variations:
@@ -147,6 +148,7 @@ class MissingWikiPopulator:
                         wiki_data = await self.wikipedia_service.get_real_data(var, lang)
                         if wiki_data and wiki_data.extract:
                             found_wiki = wiki_data
+                            found_language = lang
                             logging.info(f"  ✅ Found: '{wiki_data.title}' in {lang.upper()}")
                             break
                     except Exception as e:
@@ -157,7 +159,7 @@ class MissingWikiPopulator:
             if found_wiki:
                 update_response = await self.artist_db_service.update_artist_wikipedia_data(
                     artist_id=artist_id,
-                    wiki_data=found_wiki.model_dump(),
+                    wiki_data={**found_wiki.model_dump(), "language": found_language},
                     wiki_extract=found_wiki.extract
                 )
                 if update_response.get("success"):
@@ -1,14 +1,19 @@
 import asyncio
 import logging
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 # Add project root to the Python path
 project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
+# 默认开启上游响应磁盘缓存，重复运行时已请求过的数据直接从缓存读取
+# （可通过环境变量 HTTP_CACHE_MODE=record / replay / off 覆盖）
+os.environ.setdefault("HTTP_CACHE_MODE", "cache")
+
 from services.artist_db_service import artist_db_service
 from services.spotify_service import SpotifyService
 from services.wikipedia_service import WikipediaService
@@ -24,7 +29,44 @@ class RealDataPopulator:
         self.spotify_service = SpotifyService()
         self.wikipedia_service = WikipediaService()
         self.artist_db_service = artist_db_service
+        # 批量预取的 Wikipedia 数据：(搜索词, 语言) -> WikipediaData
+        self.prefetched_wiki: Dict[Tuple[str, str], Any] = {}
+        self.prefetched_languages: set = set()
+        
+    @staticmethod
+    def get_search_variations(artist_name: str) -> List[str]:
+        """Wikipedia 搜索变体"""
+        return [
+            artist_name,
+            f"{artist_name} (musician)",
+            f"{artist_name} (band)",
+            f"{artist_name} (artist)"
+        ]
+    
+    async def prefetch_wikipedia_data(self, artists: List[Dict[str, Any]]):
+        """按语言批量预取所有艺术家及其搜索变体的 Wikipedia 摘要（每 50 个标题一次请求）"""
+        names = [artist["name"] for artist in artists if artist.get("name") and not artist.get("wiki_extract")]
+        titles = [variation for name in names for variation in self.get_search_variations(name)]
+        if not titles:
+            return
         
+        for language in ("en", "ja"):
+            try:
+                found = await self.wikipedia_service.get_artists_bulk(titles, language)
+            except Exception as e:
+                logging.warning(f"Bulk Wikipedia prefetch failed for {language}: {e}")
+                continue
+            for title, wiki_data in found.items():
+                self.prefetched_wiki[(title, language)] = wiki_data
+            self.prefetched_languages.add(language)
+            logging.info(f"Prefetched {len(found)} Wikipedia pages in {language}")
+    
+    async def fetch_wikipedia(self, search_term: str, language: str) -> Optional[Any]:
+        """优先使用批量预取结果；已预取的语言中没有结果即视为页面不存在"""
+        if language in self.prefetched_languages:
+            return self.prefetched_wiki.get((search_term, language))
+        return await self.wikipedia_service.get_real_data(search_term, language)
+    
     async def get_artists_needing_data(self) -> List[Dict[str, Any]]:
         """获取需要填充数据的艺术家列表"""
         try:
@@ -112,12 +154,7 @@ class RealDataPopulator:
             has_japanese_chars = any('\u3040' <= char <= '\u309f' or '\u30a0' <= char <= '\u30ff' or '\u4e00' <= char <= '\u9fff' for char in artist_name)
             
             # 尝试多种搜索策略
-            search_variations = [
-                artist_name,
-                f"{artist_name} (musician)",
-                f"{artist_name} (band)",
-                f"{artist_name} (artist)"
-            ]
+            search_variations = self.get_search_variations(artist_name)
             
             wiki_data = None
             successful_search = None
@@ -127,7 +164,7 @@ class RealDataPopulator:
             for variation in search_variations:
                 try:
                     logging.info(f"Trying English Wikipedia search: '{variation}'")
-                    wiki_data = await self.wikipedia_service.get_real_data(variation, "en")
+                    wiki_data = await self.fetch_wikipedia(variation, "en")
                     
                     if wiki_data and wiki_data.extract:
                         successful_search = variation
@@ -144,7 +181,7 @@ class RealDataPopulator:
                 for variation in search_variations:
                     try:
                         logging.info(f"Trying Japanese Wikipedia search: '{variation}'")
-                        wiki_data = await self.wikipedia_service.get_real_data(variation, "ja")
+                        wiki_data = await self.fetch_wikipedia(variation, "ja")
                         
                         if wiki_data and wiki_data.extract:
                             successful_search = variation
@@ -210,9 +247,6 @@ class RealDataPopulator:
             logging.info(f"Wikipedia data already exists for: {artist_name}")
             results["wikipedia"] = True
         
-        # 添加延迟以避免 API 限制
-        await asyncio.sleep(1)
-        
         return results
     
     async def run_population(self, max_artists: int = 5):
@@ -228,6 +262,8 @@ class RealDataPopulator:
         artists_to_process = artists[:max_artists]
         logging.info(f"Processing {len(artists_to_process)} artists (limited from {len(artists)})")
         
+        await self.prefetch_wikipedia_data(artists_to_process)
+        
         total_processed = 0
         spotify_success = 0
         wikipedia_success = 0
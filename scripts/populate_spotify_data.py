@@ -66,7 +66,6 @@ class SpotifyPopulator:
                     logging.warning(f"  ❌ Failed to update {name}: {resp.get('error')}")
             except Exception as e:
                 logging.error(f"  ❌ Error for {name}: {str(e)}")
-            await asyncio.sleep(0.5)  # 防止API限流
         logging.info(f"\n=== Spotify Population Complete ===\n  Total: {total}\n  Updated: {updated}\n  Failed: {total - updated}")
 
 async def main():
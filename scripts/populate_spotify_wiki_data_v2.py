@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -10,6 +11,10 @@ import re
 project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
+# 默认开启上游响应磁盘缓存，重复运行时已请求过的数据直接从缓存读取
+# （可通过环境变量 HTTP_CACHE_MODE=record / replay / off 覆盖）
+os.environ.setdefault("HTTP_CACHE_MODE", "cache")
+
 from services.artist_db_service import artist_db_service
 from services.spotify_service import SpotifyService
 from services.wikipedia_service import WikipediaService
@@ -112,25 +112,18 @@ class WikiPopulator:
             languages = ["ja", "en"] if is_japanese else ["en"]
             variations = self.generate_search_variations(artist_name)
             
-            found_wiki = None
-            for lang in languages:
-                if found_wiki: break
-                for var in variations:
-                    try:
-                        logging.info(f"  Trying {lang.upper()}: '{var}'")
-                        wiki_data = await self.wikipedia_service.get_real_data(var, lang)
-                        if wiki_data and wiki_data.extract:
-                            found_wiki = wiki_data
-                            logging.info(f"  ✅ Found: '{wiki_data.title}' in {lang.upper()}")
-                            break
-                    except Exception:
-                        continue
+            # 并发尝试所有语言和变体，按 languages / variations 的顺序取优先结果
+            logging.info(f"  Trying {', '.join(lang.upper() for lang in languages)}: {variations}")
+            match = await self.wikipedia_service.find_artist(variations, languages, min_extract_length=1)
+            found_wiki = match["data"] if match else None
+            if found_wiki:
+                logging.info(f"  ✅ Found: '{found_wiki.title}' in {match['language'].upper()}")
             
             # 如果找到，则更新数据库
             if found_wiki:
                 update_response = await self.artist_db_service.update_artist_wikipedia_data(
                     artist_id=artist_id,
-                    wiki_data=found_wiki.model_dump(),
+                    wiki_data={**found_wiki.model_dump(), "language": match["language"]},
                     wiki_extract=found_wiki.extract
                 )
                 if update_response.get("success"):
@@ -141,8 +134,6 @@ class WikiPopulator:
             else:
                 logging.warning(f"  ⚠️ No Wikipedia entry found for {artist_name}")
 
-            await asyncio.sleep(1) # 避免API限流
-
         logging.info("\n" + "="*60)
         logging.info("=== Wikipedia Population Complete ===")
         logging.info(f"  Total artists processed: {total}")
@@ -0,0 +1,38 @@
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add project root to the Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+# 默认开启上游响应磁盘缓存，重复运行时已请求过的数据直接从缓存读取
+os.environ.setdefault("HTTP_CACHE_MODE", "cache")
+
+from services.preview_resolver import preview_resolver
+from services.database_service import db_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+async def main():
+    """为缺少预览URL的歌曲查询 iTunes，并批量写回 songs 表"""
+    if not db_service.is_connected():
+        logging.error("Database not connected.")
+        return
+    
+    max_songs = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    stats = await preview_resolver.resolve_missing(max_songs=max_songs)
+    
+    logging.info("\n=== Preview Resolution Complete ===")
+    logging.info(f"Songs scanned: {stats['scanned']}")
+    logging.info(f"Previews resolved: {stats['resolved']}")
+    logging.info(f"Matched without preview: {stats['without_preview']}")
+    logging.info(f"Not found in iTunes: {stats['not_found']}")
+    logging.info(f"Failed (will retry next run): {stats['failed']}")
+    logging.info(f"Rows persisted: {stats['persisted']}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -22,6 +22,12 @@ import openai
 from openai import AsyncOpenAI
 from supabase import create_client, Client
 
+# Add project root to the Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from services.rate_limiter import get_rate_limiter
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, 
@@ -58,8 +64,10 @@ class JapaneseTranslator:
         # 初始化客户端
         self.openai_client = AsyncOpenAI(
             api_key=self.ark_api_key,
-            base_url="https://api.deepseek.com"
+            base_url=os.getenv("DEEPSEEK_API_URL", "https://api.deepseek.com")
         )
+        # DeepSeek 共享限流器：按配置速率发送请求，被 429 限流时自动退避
+        self.limiter = get_rate_limiter("deepseek")
         
         self.supabase: Client = create_client(self.supabase_url, supabase_key)
         
@@ -232,6 +240,7 @@ class JapaneseTranslator:
 """
 
             # 调用 AI 翻译
+            await self.limiter.acquire()
             response = await self.openai_client.chat.completions.create(
                 model="deepseek-chat",
                 messages=[
@@ -253,6 +262,7 @@ class JapaneseTranslator:
             return translation
             
         except Exception as e:
+            self.limiter.record_error(e)
             logging.error(f"翻译失败: {e}")
             return None
 
@@ -382,9 +392,6 @@ class JapaneseTranslator:
                         failed_artists.append(artist_name)
                 else:
                     logging.warning(f"  ⚠️ 没有内容需要更新: {artist_name}")
-                    
-                # 添加延迟避免API限制
-                await asyncio.sleep(1)
                 
             except Exception as e:
                 logging.error(f"  ❌ 处理失败: {artist_name} - {e}")
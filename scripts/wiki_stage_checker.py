@@ -69,22 +69,13 @@ class WikiStageChecker:
         is_japanese = self.is_japanese_artist(artist_name)
         languages = ["ja", "en"] if is_japanese else ["en"]
         
-        for language in languages:
-            for variation in variations:
-                try:
-                    logging.info(f"Trying {language.upper()} Wikipedia: '{variation}'")
-                    wiki_data = await self.wikipedia_service.get_real_data(variation, language)
-                    
-                    if wiki_data and wiki_data.extract:
-                        result["found"] = True
-                        result["language"] = language
-                        result["title"] = wiki_data.title
-                        logging.info(f"✅ Found: '{wiki_data.title}' in {language.upper()}")
-                        return result
-                        
-                except Exception as e:
-                    logging.debug(f"Failed: '{variation}' in {language}")
-                    continue
+        # 并发尝试所有语言和变体，按优先级取第一个有效结果
+        match = await self.wikipedia_service.find_artist(variations, languages, min_extract_length=1)
+        if match:
+            result["found"] = True
+            result["language"] = match["language"]
+            result["title"] = match["data"].title
+            logging.info(f"✅ Found: '{match['data'].title}' in {match['language'].upper()}")
         
         return result
     
@@ -146,8 +137,6 @@ class WikiStageChecker:
                 else:
                     stats["minor_stage_missing"].append(missing_info)
                     logging.info(f"ℹ️ Minor stage artist - no Wikipedia needed")
-            
-            await asyncio.sleep(0.5)
         
         # 打印结果
         self.print_results(stats)